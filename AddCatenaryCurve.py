@@ -17,6 +17,7 @@
 #
 import FreeCAD
 import Part
+import catenary
 
 class AddCatenaryCurve:
 	"""Command to add a catenary curve sketch"""
@@ -60,14 +61,11 @@ class AddCatenaryCurve:
 			sketch.addProperty("App::PropertyInteger", "NumPoints", "Dimensions").NumPoints=50
 
 			print (sketch.Sag)
-			poles = []
-			for i in range(50 + 1):
-				x = sketch.XStart + (sketch.XEnd - sketch.XStart) * i / sketch.NumPoints
-				y = sketch.YStart + (sketch.Sag * (math.cosh(x / sketch.Sag) - 1))
-				poles.append(FreeCAD.Vector(x, y, 0))
+			xs, ys = catenary.sample(sketch.Sag, sketch.XStart, sketch.XEnd, sketch.YStart, sketch.NumPoints)
+			poles = [FreeCAD.Vector(x, y, 0) for x, y in zip(xs.tolist(), ys.tolist())]
 			# Create the B-spline curve
 			bspline = Part.BSplineCurve()
-			bspline.buildFromPoles(poles)
+			bspline.interpolate(poles)
 
 			# Add the B-spline to the sketch
 			sketch.addGeometry(bspline, False)
@@ -38,10 +38,20 @@ except ImportError:
     QtCore = importlib.import_module("PySide2.QtCore")
     QtWidgets = importlib.import_module("PySide2.QtWidgets")
 import Part
-import Draft
-from BOPTools import BOPFeatures
 
 from varsetOps import getVarsetValue, setVarsetValue, getVarsetInt
+from segmentOps import compute_segment_parameters, compute_adaptive_segment_parameters, add_segments
+import layerSlicer
+import materialReport
+from intersectOps import intersect_segments
+from ringOps import make_rings
+from labelIndex import get_index
+from SegmentedVessel import make_segmented_vessel
+from SegmentFeature import is_segment_feature, segment_parameters, resize_segments
+from bowlOps import bowl_solid_shape, profile_curve
+from profileSampler import profile_sampler
+from docOps import batch_update
+from shapeCache import make_key
 
 class AddSegments:
     '''
@@ -114,6 +124,10 @@ class AddSegments:
                 self.solid_bottom_radio = QtGui.QRadioButton("Solid Bottom")
                 text_box2_layout.addWidget(self.solid_bottom_radio)
                 self.solid_bottom_radio.setChecked(True)
+                self.offset_wall_checkbox = QtWidgets.QCheckBox("Size From Offset Wall")
+                self.offset_wall_checkbox.setToolTip("Size each segment to reach the true inside of the wall instead of the point radius minus the wall thickness")
+                self.offset_wall_checkbox.setChecked(True)
+                text_box2_layout.addWidget(self.offset_wall_checkbox)
                 # Button layout
                 button_layout = QtWidgets.QHBoxLayout()
                 # Add Vessel Outlines button
@@ -135,10 +149,51 @@ class AddSegments:
                 self.delete_segments_button.clicked.connect(self.bt_delete_segments_click)
                 button_layout2.addWidget(self.delete_segments_button)
 
+                adaptive_group = QtWidgets.QGroupBox("Adaptive Layers")
+                adaptive_inputs_layout = QtWidgets.QHBoxLayout()
+                self.min_thickness_input = QtWidgets.QLineEdit()
+                self.min_thickness_input.setToolTip("Thinnest layer the slicer may use in mm")
+                self.min_thickness_input.setText(str(round(self.layer_height / 2, 2)))
+                self.max_thickness_input = QtWidgets.QLineEdit()
+                self.max_thickness_input.setToolTip("Thickest layer the slicer may use in mm")
+                self.max_thickness_input.setText(str(round(self.layer_height * 2, 2)))
+                self.allowance_input = QtWidgets.QLineEdit()
+                self.allowance_input.setToolTip("Thickness each layer loses to flattening and glue-up in mm")
+                self.allowance_input.setText("1.5")
+                adaptive_inputs_layout.addWidget(QtWidgets.QLabel("Min:"))
+                adaptive_inputs_layout.addWidget(self.min_thickness_input)
+                adaptive_inputs_layout.addWidget(QtWidgets.QLabel("Max:"))
+                adaptive_inputs_layout.addWidget(self.max_thickness_input)
+                adaptive_inputs_layout.addWidget(QtWidgets.QLabel("Allowance:"))
+                adaptive_inputs_layout.addWidget(self.allowance_input)
+                self.add_adaptive_segments_button = QtWidgets.QPushButton("Add Adaptive Segments")
+                self.add_adaptive_segments_button.setToolTip("Pick the layer heights from the profile curve that use the least wood and add their segments")
+                self.add_adaptive_segments_button.clicked.connect(self.bt_add_adaptive_segments_click)
+                adaptive_layout = QtWidgets.QVBoxLayout()
+                adaptive_layout.addLayout(adaptive_inputs_layout)
+                adaptive_layout.addWidget(self.add_adaptive_segments_button)
+                adaptive_group.setLayout(adaptive_layout)
+
+                report_layout = QtWidgets.QHBoxLayout()
+                self.species_combo = QtWidgets.QComboBox()
+                self.species_combo.addItems(sorted(materialReport.SPECIES_DENSITY))
+                self.species_combo.setCurrentText(materialReport.DEFAULT_SPECIES)
+                self.species_combo.setToolTip("Wood species used for the mass estimate")
+                self.material_report_button = QtWidgets.QPushButton("Material Report")
+                self.material_report_button.setToolTip("Print the vessel and blank volume, mass and waste without intersecting anything")
+                self.material_report_button.clicked.connect(self.bt_material_report_click)
+                report_layout.addWidget(QtWidgets.QLabel("Species:"))
+                report_layout.addWidget(self.species_combo)
+                report_layout.addWidget(self.material_report_button)
+
                 button_layout2b = QtWidgets.QHBoxLayout()
                 self.array_segments_placeholder_button = QtWidgets.QPushButton("Array Segments")
                 self.array_segments_placeholder_button.clicked.connect(lambda: self.bt_array_segments_click("Segment"))
                 button_layout2b.addWidget(self.array_segments_placeholder_button)
+                self.make_vessel_button = QtWidgets.QPushButton("Make Parametric Vessel")
+                self.make_vessel_button.setToolTip("Add a SegmentedVessel object that rebuilds only the rings affected by profile or variable changes")
+                self.make_vessel_button.clicked.connect(self.bt_make_vessel_click)
+                button_layout2b.addWidget(self.make_vessel_button)
 
                 button_layout3 = QtWidgets.QHBoxLayout()
                 # Add Bowl Solid button
@@ -157,6 +212,9 @@ class AddSegments:
                 self.delete_intersects_button = QtWidgets.QPushButton("Delete Intersect Segments")
                 self.delete_intersects_button.clicked.connect(self.bt_delete_intersects_click)
                 button_layout4.addWidget(self.delete_intersects_button)
+                self.parallel_intersect_checkbox = QtWidgets.QCheckBox("Use All Cores")
+                self.parallel_intersect_checkbox.setToolTip("Run the segment intersections in parallel worker processes")
+                button_layout4.addWidget(self.parallel_intersect_checkbox)
 
                 button_layout5 = QtWidgets.QHBoxLayout()    
                 # Array segments around ring button
@@ -166,6 +224,9 @@ class AddSegments:
                 self.array_segments_button = QtWidgets.QPushButton("Delete Arrayed Segments")
                 self.array_segments_button.clicked.connect(lambda: self.bt_array_segments_click("Delete"))
                 button_layout5.addWidget(self.array_segments_button) 
+                self.link_rings_checkbox = QtWidgets.QCheckBox("Link Rings")
+                self.link_rings_checkbox.setToolTip("Build each ring as one link array over a single segment shape instead of full copies")
+                button_layout5.addWidget(self.link_rings_checkbox)
 
                 button_layout10 = QtWidgets.QHBoxLayout()	
                 # Cancel button
@@ -199,7 +260,7 @@ class AddSegments:
                 
                 fudge_group = QtWidgets.QGroupBox("Individual Segment Adjustment")
                 sub_fudge_layout = QtWidgets.QVBoxLayout()
-                sub_fudge_layout.addWidget(QtWidgets.QLabel("Select one segment to adjust."))
+                sub_fudge_layout.addWidget(QtWidgets.QLabel("Select the segments to adjust."))
                 sub_fudge_layout.addLayout(button_layout7)
                 sub_fudge_layout.addLayout(button_layout8)
                 sub_fudge_layout.addLayout(button_layout9)
@@ -210,6 +271,8 @@ class AddSegments:
                 layout.addLayout(button_layout)
                 layout.addLayout(button_layout2)
                 layout.addLayout(button_layout2b)
+                layout.addWidget(adaptive_group)
+                layout.addLayout(report_layout)
                 layout.addWidget(fudge_group) 
                 layout.addLayout(button_layout3)
                 layout.addLayout(button_layout4)
@@ -235,44 +298,37 @@ class AddSegments:
 
             def bt_edit_segment_click(self, radius_type="inner", direcion="decrease"):
                 fudge_adjust = self.fudge_spinbox.value()
-                import FreeCAD
-                import FreeCADGui
-                doc = FreeCAD.ActiveDocument
-                selected_objects = FreeCADGui.Selection.getSelection()
-                try:
-                    selected_segment = selected_objects[0]
-                except IndexError:
-                    self.show_error_popup("Selection Error", "No segment selected. Please select one segment to adjust.")
+                if direcion != "expand":
+                    fudge_adjust = -fudge_adjust
+                doc = App.ActiveDocument
+                selected_objects = Gui.Selection.getSelection()
+                if not selected_objects:
+                    self.show_error_popup("Selection Error", "No segment selected. Please select the segments to adjust.")
                     return
-                seg_name = selected_segment.Label
-                seg_number = int(seg_name.split("_")[1])
-                num_segments = self.list_of_segment_parameters[seg_number][0]
-                radius= self.list_of_segment_parameters[seg_number][1]
-                trapezoid_height = self.list_of_segment_parameters[seg_number][2]
-                z_level = self.list_of_segment_parameters[seg_number][3]
-                extrude_height = self.list_of_segment_parameters[seg_number][4]
-                if radius_type == "outer":
-                    if direcion == "expand":
-                        new_radius = self.list_of_segment_parameters[seg_number][1] + fudge_adjust
-                        new_trapezoid_height = self.list_of_segment_parameters[seg_number][2] + fudge_adjust
-                    else:
-                        new_radius = self.list_of_segment_parameters[seg_number][1] - fudge_adjust
-                        new_trapezoid_height = self.list_of_segment_parameters[seg_number][2] - fudge_adjust
-                    self.list_of_segment_parameters[seg_number][1] = new_radius
-                    self.list_of_segment_parameters[seg_number][2] = new_trapezoid_height
-                else:
-                    if direcion == "expand":
-                        new_trapezoid_height = self.list_of_segment_parameters[seg_number][2] + (2 * fudge_adjust)
+                try:
+                    if radius_type == "outer":
+                        segments = resize_segments(doc, selected_objects, outer=fudge_adjust)
                     else:
-                        new_trapezoid_height = self.list_of_segment_parameters[seg_number][2] - (2 * fudge_adjust)
-                    self.list_of_segment_parameters[seg_number][2] = new_trapezoid_height
-                doc.removeObject(selected_segment.Name)
-                new_segment = self.make_segment(*self.list_of_segment_parameters[seg_number])
-                obj = doc.getObject(new_segment)
-                obj.ViewObject.Transparency = 45
-                obj.Placement = App.Placement(App.Vector(0,0,0),App.Rotation(App.Vector(0,0,1),-90))   
-                obj.Label = seg_name
-                FreeCADGui.Selection.addSelection(obj)            
+                        segments = resize_segments(doc, selected_objects, inner=fudge_adjust)
+                except ValueError as error:
+                    self.show_error_popup("Resize Error", f"{error} Use a smaller adjustment.")
+                    return
+                if not segments:
+                    self.show_error_popup("Selection Error", "The selection has no adjustable segments. Segments made by older versions have to be added again.")
+                    return
+                # Keep the panel's copy of the parameters in step with the objects
+                index = get_index(doc)
+                for obj in segments:
+                    row = index.segment_number(obj)
+                    if row is not None and row < len(self.list_of_segment_parameters):
+                        self.list_of_segment_parameters[row] = segment_parameters(obj)
+
+            def _require_sampler(self, doc):
+                """Return the shared sampler of BowlProfileSketch, or None after telling the user it is missing."""
+                sampler = profile_sampler(doc)
+                if sampler is None:
+                    self.show_error_popup("Missing Sketch", "A sketch named 'BowlProfileSketch' was not found in the document. Please run the Add Construction Lines command first.")
+                return sampler
 
             def show_error_popup(self, title, message):
                 # Get the main FreeCAD window
@@ -295,12 +351,11 @@ class AddSegments:
 
             def bt_delete_arrayed_segments_click(self):
                 doc = App.ActiveDocument
-                for obj in doc.Objects:
-                    if "Ring_" in obj.Label:
-                        doc.removeObject(obj.Name)
-                for obj in doc.Objects:
-                    if "Segment" in obj.Label:
-                        obj.Visibility = True
+                index = get_index(doc)
+                for obj in index.ring_objects():
+                    doc.removeObject(obj.Name)
+                for obj in index.segments():
+                    obj.Visibility = True
                 doc.recompute()
 
             def bt_delete_intersects_click(self):
@@ -309,143 +364,32 @@ class AddSegments:
                     if "Intersect" in obj.Label:
                         doc.removeObject(obj.Name)
                 doc.recompute()
-                for obj in doc.Objects:
-                    if "Segment" in obj.Label:
-                        obj.Visibility = True
+                for obj in get_index(doc).segments():
+                    obj.Visibility = True
             
             def	bt_add_bowl_solid_click(self):
                 self.update_values()
-                """Create a BSpline from all point geometries in the selected sketch."""
+                """Build the bowl solid from the point geometries in BowlProfileSketch."""
                 doc = App.activeDocument()
-                try:
-                    sketch = doc.getObjectsByLabel("BowlProfileSketch")[0]
-                except:
-                    self.show_error_popup("Missing Sketch", "A sketch named 'BowlProfileSketch' was not found in the document. Please run the Add Construction Lines command first.")
+                sampler = self._require_sampler(doc)
+                if sampler is None:
                     return
-                # Collect point geometries
-                poles = []
-                list_of_points = []
-                self.list_of_segment_names = []  
-                for i, geo in enumerate(sketch.Geometry):
-                    # Check if the geometry is a point
-                    if geo.TypeId == 'Part::GeomPoint':
-                        #point_count += 1
-                        list_of_points.append(App.Vector(geo.X, geo.Y, geo.Z))
-                list_of_points.sort(key=lambda v: v.y)
-                for item in list_of_points:
-                    poles.append(item)
-                if not poles:
-                    print(f"No point geometries found in sketch '{sketch.Name}'.")
+                points = sampler.point_list()
+                if len(points) < 2:
+                    print(f"Need at least 2 point geometries in sketch '{sampler.sketch.Name}' to create a BSpline.")
                     return
-                if len(poles) < 2:
-                    print("Need at least 2 points to create a BSpline.")
-                    return
-                # Build BSpline curve from poles
+                # The revolve, shell and offset are all done on shapes; only the result goes in the document
                 try:
-                    curve = Part.BSplineCurve()
-                    curve.buildFromPoles(poles)
-                    shape = curve.toShape()
+                    shape = bowl_solid_shape(points, self.wall_thickness, curve=sampler.curve(), placement=sampler.placement())
                 except Exception as e:
-                    print(f"Failed to build BSpline: {e}")
+                    self.show_error_popup("Bowl Solid Failed", f"Could not build the bowl solid: {e}")
                     return
-                # Create Part::Feature to hold the result
-                obj_name = f"BSpline_from_{sketch.Name}"
-                bs_obj = doc.addObject("Part::Feature", obj_name)
-                bs_obj.Label = obj_name
-                bs_obj.Shape = shape
-                # Try to align placement with the sketch
-                try:
-                    if hasattr(sketch, 'Placement'):
-                        bs_obj.Placement = sketch.Placement
-                except Exception:
-                    pass
-                # Create lines from each end of the BSpline to x = 0 (same y,z)
-                try:
-                    # shape.Vertexes[0] and [-1] correspond to the start and end vertices of the edge
-                    start_pt = shape.Vertexes[0].Point
-                    end_pt = shape.Vertexes[-1].Point
-                    target_start = Vector(0, start_pt.y, start_pt.z)
-                    target_end = Vector(0, end_pt.y, end_pt.z)
-                    edge1 = Part.makeLine(start_pt, target_start)
-                    edge2 = Part.makeLine(end_pt, target_end)
-                    line1 = doc.addObject("Part::Feature", obj_name + "_endline1")
-                    line1.Label = obj_name + "_endline1"
-                    line1.Shape = edge1
-                    # match placement so the lines align with the sketch/BSpline
-                    try:
-                        if hasattr(sketch, 'Placement'):
-                            line1.Placement = sketch.Placement
-                    except Exception:
-                        pass
-
-                    line2 = doc.addObject("Part::Feature", obj_name + "_endline2")
-                    line2.Label = obj_name + "_endline2"
-                    line2.Shape = edge2
-                    try:
-                        if hasattr(sketch, 'Placement'):
-                            line2.Placement = sketch.Placement
-                    except Exception:
-                        pass
-                except Exception as e:
-                    print(f"Warning: failed to create end lines: {e}")
-                a_compound = doc.addObject("Part::Compound","Compound")
-                doc.Compound.Links = [bs_obj,line1,line2]
-
-                a_revolve = doc.addObject("Part::Revolution","Revolve")
-                doc.Revolve.Source = a_compound
-                doc.Revolve.Axis = (0.0,0.0,1.0)
-                doc.Revolve.Angle = 360.0
-                doc.Revolve.Solid = False
-                doc.Revolve.AxisLink = None
-                doc.Revolve.Symmetric = False
-                doc.Compound.Visibility = False
-
-                # Ensure the document is up-to-date so the revolve has a computed shape
-                try:
-                    doc.recompute()
-                except Exception:
-                    pass
-
-                # Convert the revolve to a solid and hide the original revolve
-                try:
-                    if not hasattr(a_revolve, 'Shape') or a_revolve.Shape is None:
-                        raise ValueError("Revolve has no shape. Recompute may have failed or source is invalid.")
-                    faces = a_revolve.Shape.Faces
-                    if not faces:
-                        raise ValueError("Revolve shape contains no faces; cannot build shell.")
-                    shell = Part.Shell(faces)
-                    solid = Part.Solid(shell)
-                    solid_obj = doc.addObject("Part::Feature", a_revolve.Name + "_solid")
-                    solid_obj.Label = a_revolve.Name + " (Solid)"
-                    solid_obj.Shape = solid
-                    try:
-                        doc.recompute()
-                        a_revolve.Visibility = False
-                        doc.removeObject(a_revolve.Name)
-                        doc.removeObject("Compound")
-                        for obj in doc.Objects:
-                            if obj.Name.startswith("BSpline_from_"):
-                                doc.removeObject(obj.Name)
-                    except:
-                        print("Could not remove revolve object after solid conversion.")
-                except Exception as e:
-                    print(f"Warning: failed to convert revolve to solid: {e}")
-                a_shape = solid_obj.Shape
-                faces_list = a_shape.Faces
-                a_face = faces_list[0]
-                highest_face = -1.0
-                for i, face in enumerate(faces_list):
-                    z_height = face.BoundBox.Center.z
-                    if (z_height > highest_face):
-                        highest_face = z_height
-                        a_face = face
-                a_thickness = doc.addObject("Part::Thickness","BowlSolid")
-                doc.BowlSolid.Faces = (solid_obj,['Face3',])
-                doc.BowlSolid.Value = -self.wall_thickness
-                solid_obj.Visibility = False
-                a_thickness.Placement = App.Placement(App.Vector(0,0,0),App.Rotation(App.Vector(0,0,1),90))
-                a_thickness.ViewObject.Transparency = 50
-                doc.recompute()				
+                with batch_update(doc, "Add Bowl Solid"):
+                    bowl_solid = doc.addObject("Part::Feature", "BowlSolid")
+                    bowl_solid.Shape = shape
+                    bowl_solid.Placement = App.Placement(App.Vector(0,0,0),App.Rotation(App.Vector(0,0,1),90))
+                    if bowl_solid.ViewObject is not None:
+                        bowl_solid.ViewObject.Transparency = 50
 
             def	bt_delete_bowl_solid_click(self):
                 doc = App.ActiveDocument
@@ -470,180 +414,173 @@ class AddSegments:
                 if len(bowl_solid_objs)>1:
                     print("Multiple BowlSolid objects found. Using the first one.")
                 bowl_solid = bowl_solid_objs[0]
-                segment_objs = []
-                for obj in doc.Objects:
-                    if "Segment" in obj.Label:
-                        segment_objs.append(obj.Label)
-                segment_objs.sort()
+                segment_objs = get_index(doc).segments()
                 if len(segment_objs)==0:
                     print("No Segment objects found for intersection.")
                     return
-                bowl_clones = []
-                for j in range(0,len(segment_objs)):
-                    view_obj = bowl_solid
-                    cloned_object = Draft.clone(view_obj)
-                    bowl_clones.append(cloned_object)
-                intersection_list = []
-                for a in range(0,len(bowl_clones)):
-                    bp = BOPFeatures.BOPFeatures(App.activeDocument())
-                    seg_object = doc.getObjectsByLabel(segment_objs[a])[0]
-                    
-                    new_common = bp.make_multi_common([seg_object.Name] + [bowl_clones[a].Name])
-                    #new_common.Label = f"Intersection_{a+1:03d}"
-                    intersection_list.append(new_common.Name)
-                doc.recompute()
-                for a in range(0,len(intersection_list)):
-                    p= doc.getObject(intersection_list[a]).Shape.Faces
-                    p = Part.Solid(Part.Shell(p))
-                    o = doc.addObject("Part::Feature","Common013_solid")
-                    o.Label="Intersect(Solid)_001"
-                    o.Shape=p
-                    del p, o 
-                doc.recompute()
+                keys = self.intersect_cache_keys(doc, segment_objs, bowl_solid)
+                intersect_segments(doc, bowl_solid, segment_objs, prefix="Intersect", parallel=self.parallel_intersect_checkbox.isChecked(), keys=keys)
 
-                for obj in doc.Objects:
-                    if "Common"in obj.Label or "BowlSolid0" in obj.Label:
-                        doc.removeObject(obj.Name)
-
-                doc.recompute()
+            def intersect_cache_keys(self, doc, segment_objs, tool_obj):
+                """Return shape cache keys for the intersections, or None if they cannot be worked out."""
+                self.update_values()
+                sampler = profile_sampler(doc)
+                if sampler is None:
+                    return None
+                if "Touched" in tool_obj.State:
+                    doc.recompute()
+                points = sampler.point_list()
+                index = get_index(doc)
+                keys = []
+                for obj in segment_objs:
+                    if is_segment_feature(obj):
+                        row = segment_parameters(obj)
+                    else:
+                        number = index.segment_number(obj)
+                        if number is None or number >= len(self.list_of_segment_parameters):
+                            # Segments from an earlier session have no parameters to key on.
+                            return None
+                        row = self.list_of_segment_parameters[number]
+                    keys.append(make_key(
+                        "intersect", points,
+                        NumSegments=self.bowl_num_segments, WallThickness=self.wall_thickness,
+                        LayerHeight=self.layer_height, fudge=self.fudge, solid_bottom=self.solid_bottom,
+                        segment=row, tool_volume=tool_obj.Shape.Volume,
+                    ))
+                return keys
 
             def bt_add_vessel_outlines_click(self):
                 self.update_values()
                 """Create a BSpline from all point geometries in the selected sketch."""
                 doc = App.activeDocument()
-
-                try:
-                    sketch = doc.getObjectsByLabel("BowlProfileSketch")[0]
-                except:
-                    self.show_error_popup("Missing Sketch", "A sketch named 'BowlProfileSketch' was not found in the document. Please run the Add Construction Lines command first.")
+                sampler = self._require_sampler(doc)
+                if sampler is None:
                     return
-                # Collect point geometries
-                poles = []
-                list_of_points = []
-                self.list_of_segment_names = []  
-                for i, geo in enumerate(sketch.Geometry):
-                    # Check if the geometry is a point
-                    if geo.TypeId == 'Part::GeomPoint':
-                        #point_count += 1
-                        list_of_points.append(App.Vector(geo.X, geo.Y, geo.Z))
-                list_of_points.sort(key=lambda v: v.y)
-                for item in list_of_points:
-                    poles.append(item)
-                # Build BSpline curve from poles
                 try:
-                    curve = Part.BSplineCurve()
-                    curve.buildFromPoles(poles)
-                    shape = curve.toShape()
+                    shape = profile_curve(sampler.point_list(), sampler.placement())
                 except Exception as e:
                     print(f"Failed to build BSpline: {e}")
                     return
-                # Create Part::Feature to hold the result
-                obj_name = f"BSpline_from_{sketch.Name}"
+                # The poles follow the sketch's placement
+                obj_name = f"BSpline_from_{sampler.sketch.Name}"
                 bs_obj = doc.addObject("Part::Feature", obj_name)
                 bs_obj.Label = "Bowl_Outline"
                 bs_obj.Shape = shape
                 new_copy = App.ActiveDocument.copyObject(bs_obj, True)
                 new_copy.Label = "Bowl_Outline"
-                new_copy.Placement = App.Placement(App.Vector(-self.wall_thickness,0,0),App.Rotation(App.Vector(1,0,0),90))
+                new_copy.Placement = App.Placement(App.Vector(-self.wall_thickness,0,0),App.Rotation())
                 doc.recompute()
-                # Try to align placement with the sketch
-                try:
-                    if hasattr(sketch, 'Placement'):
-                        bs_obj.Placement = sketch.Placement
-                except Exception:
-                    pass
-            
-            def make_segment(self, num_segments=12, radius=50, trapezoid_height=19.05, z_level=0,extrude_height=10, solid_bottom=True):
-                from math import cos, sin, pi, radians, tan
-                self.update_values
-                doc = App.ActiveDocument
-                angle = 180 / self.bowl_num_segments
-                left_top = -((radius * tan(radians(angle))))
-                right_top = (radius * tan(radians(angle)))
-                left_bottom = -((radius - trapezoid_height) * tan(radians(angle)))
-                right_bottom = ((radius - trapezoid_height) * tan(radians(angle)))
-                y_bottom = radius-trapezoid_height
-                y_top = radius
-                if solid_bottom:
-                    left_bottom = 0
-                    right_bottom = 0
-                    y_bottom = 0
-                vertices = [
-                    App.Vector(left_bottom, y_bottom, z_level),
-                    App.Vector(right_bottom, y_bottom, z_level),
-                    App.Vector(right_top, y_top, z_level),
-                    App.Vector(left_top, y_top, z_level),
-                    App.Vector(left_bottom, y_bottom, z_level)
-                ]
-                wire = Part.makePolygon(vertices)
-                face = Part.Face(wire)
-                shape = face.extrude(App.Vector(0, 0, extrude_height))
-                obj = doc.addObject("Part::Feature", f"Segment_000")
-                obj.Shape = shape
-                return obj.Name 
             
             def bt_add_segments_click(self):
                 doc = App.ActiveDocument
                 self.update_values()
+                sampler = self._require_sampler(doc)
+                if sampler is None:
+                    return
+                profile_points = sampler.point_list()
+                inner_profile = None
+                if self.offset_wall_checkbox.isChecked() and len(profile_points) > 1:
+                    inner_profile = sampler.inner_profile(self.wall_thickness)
+                # Work out every layer first, then create all the segments in one transaction
+                parameters = compute_segment_parameters(
+                    profile_points,
+                    self.bowl_num_segments,
+                    self.wall_thickness,
+                    self.fudge,
+                    self.solid_bottom,
+                    inner_profile,
+                )
                 try:
-                    sketch = doc.getObjectsByLabel("BowlProfileSketch")[0]
-                except:
-                    self.show_error_popup("Missing Sketch", "A sketch named 'BowlProfileSketch' was not found in the document. Please run the Add Construction Lines command first.")
+                    segments = add_segments(doc, parameters)
+                except ValueError as e:
+                    self.show_error_popup("Add Segments", str(e))
                     return
-                point_count = 0
-                list_of_points = []
-                self.list_of_segment_names = []  
-                for i, geo in enumerate(sketch.Geometry):
-                    # Check if the geometry is a point
-                    if geo.TypeId == 'Part::GeomPoint':
-                        point_count += 1
-                        list_of_points.append(App.Vector(geo.X, geo.Y, geo.Z))
-                list_of_points.sort(key=lambda v: v.y)
-                triple_list = []
-                max_x =0
-                min_x =0
-                
-                for b in range(len(list_of_points)-1):
-                    l = list_of_points[b].x-self.wall_thickness
-                    m = list_of_points[b].x
-                    n = list_of_points[b+1].x-self.wall_thickness
-                    o = list_of_points[b+1].x
-                    max_x = math.ceil(max(l, m, n, o))
-                    min_x = math.floor(min(l, m, n, o))
-                    a = min_x - (math.cos(math.radians(180/self.bowl_num_segments))*min_x)
-                    min_x = math.floor(min_x - a)
-                    seg_length = max_x - min_x
-                    if b==0 and self.solid_bottom:
-                        self.list_of_segment_parameters.append([self.number_of_segments, max_x+self.fudge, max_x+self.fudge, list_of_points[b].y, list_of_points[b+1].y-list_of_points[b].y, False])
-                        a_name = self.make_segment(num_segments=self.number_of_segments, radius=max_x+self.fudge, trapezoid_height=max_x+self.fudge, z_level=list_of_points[b].y, extrude_height=list_of_points[b+1].y-list_of_points[b].y, solid_bottom=False)    
-                    else:
-                        self.list_of_segment_parameters.append([self.number_of_segments, max_x+self.fudge, seg_length+(2*self.fudge), list_of_points[b].y, list_of_points[b+1].y-list_of_points[b].y, False])
-                        a_name = self.make_segment(num_segments=self.number_of_segments, radius=max_x+self.fudge, trapezoid_height=seg_length+(2*self.fudge), z_level=list_of_points[b].y, extrude_height=list_of_points[b+1].y-list_of_points[b].y, solid_bottom=False)
-
-                    obj = doc.getObject(a_name)
-                    obj.ViewObject.Transparency = 45
-                    obj.Placement = App.Placement(App.Vector(0,0,0),App.Rotation(App.Vector(0,0,1),-90))
-                    self.list_of_segment_names.append(a_name)
+                self.list_of_segment_parameters = parameters
+                self.list_of_segment_names = [obj.Name for obj in segments]
         
+            def bt_add_adaptive_segments_click(self):
+                doc = App.ActiveDocument
+                self.update_values()
+                sampler = self._require_sampler(doc)
+                if sampler is None:
+                    return
+                try:
+                    min_thickness = float(self.min_thickness_input.text())
+                    max_thickness = float(self.max_thickness_input.text())
+                    allowance = float(self.allowance_input.text())
+                except ValueError:
+                    self.show_error_popup("Invalid Input", "Min, Max and Allowance must be numbers.")
+                    return
+                outer = sampler.samples()
+                if self.offset_wall_checkbox.isChecked():
+                    inner = sampler.inner_profile(self.wall_thickness)
+                else:
+                    inner = outer - [self.wall_thickness, 0]
+                try:
+                    report = layerSlicer.slicing_report(
+                        outer, inner, self.bowl_num_segments, self.fudge, min_thickness, max_thickness,
+                        self.layer_height, solid_bottom=self.solid_bottom, allowance=allowance,
+                    )
+                except ValueError as e:
+                    self.show_error_popup("Adaptive Layers", str(e))
+                    return
+                App.Console.PrintMessage(layerSlicer.format_report(report))
+                parameters = compute_adaptive_segment_parameters(
+                    outer, inner, report["boundaries"], self.bowl_num_segments, self.fudge, self.solid_bottom
+                )
+                try:
+                    segments = add_segments(doc, parameters)
+                except ValueError as e:
+                    self.show_error_popup("Add Segments", str(e))
+                    return
+                self.list_of_segment_parameters = parameters
+                self.list_of_segment_names = [obj.Name for obj in segments]
+
+            def bt_material_report_click(self):
+                doc = App.ActiveDocument
+                self.update_values()
+                sampler = self._require_sampler(doc)
+                if sampler is None:
+                    return
+                rows = self.list_of_segment_parameters
+                if not rows:
+                    # No segments added yet: report on the ones Add Segments would make.
+                    rows = compute_segment_parameters(
+                        sampler.point_list(),
+                        self.bowl_num_segments,
+                        self.wall_thickness,
+                        self.fudge,
+                        self.solid_bottom,
+                        sampler.inner_profile(self.wall_thickness) if self.offset_wall_checkbox.isChecked() else None,
+                    )
+                report = materialReport.material_report(
+                    sampler.samples(),
+                    sampler.inner_profile(self.wall_thickness),
+                    rows,
+                    self.species_combo.currentText(),
+                )
+                App.Console.PrintMessage(materialReport.format_report(report))
+
+            def bt_make_vessel_click(self):
+                doc = App.ActiveDocument
+                self.update_values()
+                sampler = self._require_sampler(doc)
+                if sampler is None:
+                    return
+                make_segmented_vessel(
+                    doc, sampler.sketch, doc.getObject("BowlVariables"), self.fudge, self.solid_bottom,
+                    self.offset_wall_checkbox.isChecked(),
+                )
+
             def bt_array_segments_click(self, target):
                 doc = App.ActiveDocument
                 self.update_values()
-                ring_num = 1
                 if target == "Segment":
                     start_point = 0
                 else:
                     start_point = 1
-                for obj in doc.Objects:
-                    if target in obj.Label:
-                        an_obj = doc.getObject(obj.Name)
-                        an_obj.Label =f"Ring_{ring_num:0{3}d}_001"						
-                        for i in range(start_point, self.bowl_num_segments):
-                            angle = i * (360 / self.bowl_num_segments)
-                            another_obj = App.ActiveDocument.copyObject(an_obj, True)
-                            another_obj.Placement = App.Placement(App.Vector(0,0,0),App.Rotation(App.Vector(0,0,1),angle))
-                            another_obj.Label = f"Ring_{ring_num:0{3}d}_002"
-                        ring_num += 1
-                doc.recompute()
+                masters = [obj for obj in doc.Objects if target in obj.Label]
+                make_rings(doc, masters, self.bowl_num_segments, use_links=self.link_rings_checkbox.isChecked(), start=start_point)
 
             def bt_delete_segments_click(self):
                 if App.ActiveDocument:
@@ -652,6 +589,9 @@ class AddSegments:
                             App.ActiveDocument.removeObject(obj.Name)
                     else:
                         print("No active document found.")
+                    # The panel's rows described the segments just deleted.
+                    self.list_of_segment_parameters = []
+                    self.list_of_segment_names = []
 
             def bt_delete_vessel_outlines_click(self):
                 if App.ActiveDocument:
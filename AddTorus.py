@@ -33,6 +33,11 @@ except ImportError:
 import Part
 import Draft
 from BOPTools import BOPFeatures
+from segmentOps import make_segment_shape
+from intersectOps import intersect_segments
+from ringOps import make_rings, ring_placements, copy_instances, link_instances
+from labelIndex import get_index
+from torusOps import add_torus
 
 class AddTorus:
     
@@ -151,6 +156,20 @@ class AddTorus:
                 self.button_array.clicked.connect(self.bt_array_segments_click)
                 button_layout3.addWidget(self.button_array)
 
+                button_layout4 = QtWidgets.QHBoxLayout()
+                self.button_fast_torus = QtWidgets.QPushButton("Make Torus Segments")
+                self.button_fast_torus.setToolTip("Build every ring of the segmented torus in one step, without the sketches, extrusion and intersect steps")
+                self.button_fast_torus.clicked.connect(self.bt_make_torus_segments)
+                button_layout4.addWidget(self.button_fast_torus)
+
+                self.link_rings_checkbox = QtWidgets.QCheckBox("Link Rings")
+                self.link_rings_checkbox.setToolTip("Build rings as link arrays over a single segment shape instead of full copies")
+                button_layout2.addWidget(self.link_rings_checkbox)
+
+                self.parallel_intersect_checkbox = QtWidgets.QCheckBox("Use All Cores")
+                self.parallel_intersect_checkbox.setToolTip("Run the segment intersections in parallel worker processes")
+                button_layout3.addWidget(self.parallel_intersect_checkbox)
+
 
                 # Add button A
                 self.button_close = QtWidgets.QPushButton("Close")
@@ -160,6 +179,7 @@ class AddTorus:
                 layout.addLayout(button_layout)
                 layout.addLayout(button_layout2)
                 layout.addLayout(button_layout3)
+                layout.addLayout(button_layout4)
                 # Add stretch at end
                 layout.addStretch()
                 self.form.setLayout(layout)
@@ -269,67 +289,52 @@ class AddTorus:
                     print("Multiple BowlSolid objects found. Using the first one.")
                 bowl_solid = bowl_solid_objs[0]
 
-                segment_objs = []
-                for obj in doc.Objects:
-                    if object2_name in obj.Label:
-                        segment_objs.append(obj.Label)
-                segment_objs.sort()
-                print(f"Found segment objects: {segment_objs}")
+                if object2_name == "Segment":
+                    segment_objs = get_index(doc).segments()
+                else:
+                    segment_objs = [obj for obj in doc.Objects if object2_name in obj.Label]
+                    segment_objs.sort(key=lambda o: o.Label)
+                print(f"Found segment objects: {[obj.Label for obj in segment_objs]}")
                 
                 if len(segment_objs)==0:
                     print("No Segment objects found for intersection.")
                     return
-                bowl_clones = []
-                for j in range(0,len(segment_objs)):
-                    view_obj = bowl_solid
-                    cloned_object = Draft.clone(view_obj)
-                    bowl_clones.append(cloned_object)
-                intersection_list = []
-                for a in range(0,len(bowl_clones)):
-                    bp = BOPFeatures.BOPFeatures(App.activeDocument())
-                    seg_object = doc.getObjectsByLabel(segment_objs[a])[0]
-                    
-                    new_common = bp.make_multi_common([seg_object.Name] + [bowl_clones[a].Name])
-                    #new_common.Label = f"Intersection_{a+1:03d}"
-                    intersection_list.append(new_common.Name)
-                doc.recompute()
                 if (object2_name == "Segment"):
                     prefix = "Intersect"
                 else:
                     prefix = "Smooth"
-                for a in range(0,len(intersection_list)):
-                    print("Making solid:", intersection_list[a])
-                    p= doc.getObject(intersection_list[a]).Shape.Faces
-                    p = Part.Solid(Part.Shell(p))
-                    o = doc.addObject("Part::Feature","Common013_solid")
-                    
-                    o.Label=f"{prefix}(Solid)_001"
-                    o.Shape=p
-                    del p, o 
-                doc.recompute()
-
-                for obj in doc.Objects:
-                    if "Common"in obj.Label or "BowlSolid0" in obj.Label:
-                        doc.removeObject(obj.Name)
-
-                doc.recompute()
+                intersect_segments(doc, bowl_solid, segment_objs, prefix=prefix, parallel=self.parallel_intersect_checkbox.isChecked())
 
             def bt_array_segments_click(self):
                 doc = App.ActiveDocument
                 print("Arraying Segments Around Ring")
                 self.update_values()
-                ring_num = 1
-                for obj in doc.Objects:
-                    if "Smooth" in obj.Label:
-                        an_obj = doc.getObject(obj.Name)
-                        an_obj.Label =f"Ring_{ring_num:0{3}d}_001"						
-                        for i in range(1, self.num_rings_per_torus):
-                            angle = i * (360 / self.num_rings_per_torus)
-                            another_obj = App.ActiveDocument.copyObject(an_obj, True)
-                            another_obj.Placement = App.Placement(App.Vector(0,0,0),App.Rotation(App.Vector(0,1,0),angle))
-                            another_obj.Label = f"Ring_{ring_num:0{3}d}_002"
-                        ring_num += 1
-                doc.recompute()
+                masters = [obj for obj in doc.Objects if "Smooth" in obj.Label]
+                make_rings(doc, masters, self.num_rings_per_torus, use_links=self.link_rings_checkbox.isChecked(), axis=App.Vector(0,1,0))
+
+            def bt_make_torus_segments(self):
+                try:
+                    self.update_values()
+                except ValueError:
+                    App.Console.PrintError("Invalid input: enter numeric values in all AddTorus fields.\n")
+                    return
+                if App.ActiveDocument is None:
+                    App.Console.PrintError("No active document.\n")
+                    return
+                if self.num_rings_per_torus < 1 or self.num_segments_per_ring < 3:
+                    App.Console.PrintError("The torus needs at least 1 ring and 3 segments per ring.\n")
+                    return
+                if self.torus_outside_radius <= self.torus_inside_radius:
+                    App.Console.PrintError("The torus outside radius must be larger than the inside radius.\n")
+                    return
+                add_torus(
+                    App.ActiveDocument,
+                    self.torus_outside_radius,
+                    self.torus_inside_radius,
+                    self.num_rings_per_torus,
+                    self.num_segments_per_ring,
+                    use_links=self.link_rings_checkbox.isChecked(),
+                )
 
             def bt_make_extrude(self):
                 try:
@@ -411,12 +416,17 @@ class AddTorus:
                 a_segment = self.make_segment(num_segments=self.num_segments_per_ring, radius=(self.ring_diameter/2.0)+self.torus_inside_radius-inside_length, trapezoid_height=20, z_level=0, extrude_height=opposite_height, solid_bottom=False)
                 ring_center = self.torus_outside_radius - (self.ring_diameter / 2.0)
                 an_obj = doc.getObject(a_segment)
-                for i in range(1, self.num_segments_per_ring):
-                    angle = i * (360 / self.num_segments_per_ring)
-                    another_obj = App.ActiveDocument.copyObject(an_obj, True)
-                    another_obj.Placement = App.Placement(App.Vector(0,0,0),App.Rotation(App.Vector(0,0,1),angle))
-                    self.move_object(another_obj, x=ring_center)
                 self.move_object(an_obj, x=ring_center)
+                if self.link_rings_checkbox.isChecked():
+                    placements = ring_placements(self.num_segments_per_ring, offset=App.Vector(ring_center, 0, 0))
+                    labels = [f"Segment_{i:03d}" for i in range(len(placements))]
+                    an_obj.Label = "Torus_Wedge_Master"
+                    link_instances(doc, an_obj, placements, labels, "Torus_Wedge_Array")
+                else:
+                    placements = ring_placements(self.num_segments_per_ring, start=1, offset=App.Vector(ring_center, 0, 0))
+                    labels = [f"Segment_{i + 1:03d}" for i in range(len(placements))]
+                    copy_instances(doc, an_obj, placements, labels)
+                doc.recompute()
 
                 #doc.getObject(a_segment).Placement = App.Placement(App.Vector(0, 0, 0), App.Rotation(App.Vector(0, 0, 1), 90))
                 #doc.getObject(a_segment).Placement = App.Placement(App.Vector(0, -self.torus_outside_radius/2.0, 0), App.Rotation(App.Vector(0, 0, 0), 0))  
@@ -425,38 +435,9 @@ class AddTorus:
 
 
             def make_segment(self, num_segments=12, radius=50, trapezoid_height=19.05, z_level=0,extrude_height=10, solid_bottom=True):
-                from math import cos, sin, pi, radians, tan
-                self.update_values
                 doc = App.ActiveDocument
-                angle = 180 / num_segments
-
-                left_top = -((radius * tan(radians(angle))))
-                right_top = (radius * tan(radians(angle)))
-                left_bottom = -((radius - trapezoid_height) * tan(radians(angle)))
-                right_bottom = ((radius - trapezoid_height) * tan(radians(angle)))
-
-                y_bottom = radius-trapezoid_height
-                y_top = radius
-
-                if solid_bottom:
-                    left_bottom = 0
-                    right_bottom = 0
-                    y_bottom = 0
-
-                vertices = [
-                    App.Vector(left_bottom, y_bottom, z_level),
-                    App.Vector(right_bottom, y_bottom, z_level),
-                    App.Vector(right_top, y_top, z_level),
-                    App.Vector(left_top, y_top, z_level),
-                    App.Vector(left_bottom, y_bottom, z_level)
-                ]
-                wire = Part.makePolygon(vertices)
-                face = Part.Face(wire)
-                shape = face.extrude(App.Vector(0, 0, extrude_height))
-
                 obj = doc.addObject("Part::Feature", f"Segment_000")
-                
-                obj.Shape = shape
+                obj.Shape = make_segment_shape(num_segments, radius, trapezoid_height, z_level, extrude_height, solid_bottom)
                 return obj.Name 
 
             def move_object(self, an_object, x):
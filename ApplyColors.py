@@ -22,6 +22,13 @@ import Part
 import json
 import os
 import random
+import time
+from colorOps import get_shape_color, apply_colors, apply_grid_colors
+import colorPatterns
+import ringColoring
+from rotationOps import z_angles
+from labelIndex import get_index
+from selectionOps import RingQuery, keys_of
 try:
 	from PySide import QtWidgets, QtCore, QtGui
 except ImportError:
@@ -75,6 +82,10 @@ class ApplyColors:
 
 				return QtGui.QIcon(pixmap)	
 
+			def _rgba(self, color):
+				"""Return a QColor as an (r, g, b, a) tuple in 0-1."""
+				return (color.red() / 255.0, color.green() / 255.0, color.blue() / 255.0, 1.0)
+
 			def init_ui(self):
 				import FreeCADGui
 				"""Initialize the user interface."""
@@ -118,6 +129,26 @@ class ApplyColors:
 				random_colors_btn.clicked.connect(self.bt_random_colors)
 				right_layout.addWidget(random_colors_btn)
 
+				seed_layout = QtWidgets.QHBoxLayout()
+				seed_layout.addWidget(QtWidgets.QLabel("Seed:"))
+				self.seed_spinbox = QtWidgets.QSpinBox()
+				self.seed_spinbox.setRange(0, 999999)
+				self.seed_spinbox.setToolTip("The same seed gives the same colors")
+				seed_layout.addWidget(self.seed_spinbox)
+				right_layout.addLayout(seed_layout)
+
+				quota_layout = QtWidgets.QHBoxLayout()
+				quota_layout.addWidget(QtWidgets.QLabel("Quotas:"))
+				self.quotas_edit = QtWidgets.QLineEdit()
+				self.quotas_edit.setToolTip("Most segments per color in list order, separated by commas (blank = no limit)")
+				quota_layout.addWidget(self.quotas_edit)
+				right_layout.addLayout(quota_layout)
+
+				no_touching_btn = QtWidgets.QPushButton("Random Colors, None Touching")
+				no_touching_btn.setToolTip("Random colors where no two touching segments, in a ring or across rings, are alike")
+				no_touching_btn.clicked.connect(self.bt_no_touching_colors)
+				right_layout.addWidget(no_touching_btn)
+
 				select_ring_btn = QtWidgets.QPushButton("Select Ring")
 				select_ring_btn.clicked.connect(self.select_ring_click)
 				right_layout.addWidget(select_ring_btn)
@@ -130,6 +161,24 @@ class ApplyColors:
 				get_color_btn.clicked.connect(self.get_color_from_selected)
 				right_layout.addWidget(get_color_btn)
 
+				pattern_layout = QtWidgets.QHBoxLayout()
+				pattern_layout.addWidget(QtWidgets.QLabel("Pattern:"))
+				self.pattern_combo = QtWidgets.QComboBox()
+				self.pattern_combo.addItems(list(colorPatterns.PATTERNS))
+				self.pattern_combo.currentIndexChanged.connect(self.on_pattern_changed)
+				pattern_layout.addWidget(self.pattern_combo)
+				right_layout.addLayout(pattern_layout)
+
+				self.pattern_parameters_edit = QtWidgets.QLineEdit()
+				self.pattern_parameters_edit.setToolTip("Pattern parameters as name=value, separated by commas. Rings and segments count from 0.")
+				right_layout.addWidget(self.pattern_parameters_edit)
+				self.on_pattern_changed()
+
+				apply_pattern_btn = QtWidgets.QPushButton("Apply Pattern")
+				apply_pattern_btn.setToolTip("Color all ring segments with the pattern, using the colors in list order")
+				apply_pattern_btn.clicked.connect(self.apply_pattern_click)
+				right_layout.addWidget(apply_pattern_btn)
+
 				right_layout.addSpacing(20)
 
 				a_frame = QtWidgets.QFrame()
@@ -209,89 +258,58 @@ class ApplyColors:
 				# Pre-populate with colors from JSON file
 				self.populate_predefined_colors()
 
-			def select_ring_click(self):
-				"""Select all segments in the same column as the first selected object."""
+			def _selected_keys(self):
+				"""Return the (ring, segment) keys of the selected ring objects, or None after a warning."""
 				doc = FreeCAD.activeDocument()
 				if not doc:
 					QtWidgets.QMessageBox.warning(self, "Error", "No active document in FreeCAD.")
-					return
+					return None
 				
 				selected_objects = FreeCADGui.Selection.getSelection()
 				if not selected_objects:
 					QtWidgets.QMessageBox.warning(self, "Error", "Please select an object in FreeCAD first.")
-					return
-				
-				selected_label = selected_objects[0].Label
-				selected_label_prefix = selected_label[:9]
-				
-				# Select all objects with the same prefix
-				new_selection = []
-				for obj in doc.Objects:
-					if obj.Label.startswith(selected_label_prefix):
-						new_selection.append(obj)
+					return None
 				
-				FreeCADGui.Selection.clearSelection()
-				for obj in new_selection:
-					FreeCADGui.Selection.addSelection(obj)
-				doc.recompute()
+				keys = keys_of(selected_objects)
+				if not keys:
+					QtWidgets.QMessageBox.warning(self, "Error", "Please select a ring segment (Ring_RRR_SSS) first.")
+					return None
+				return keys
 
-			def select_column_click(self):
-				"""Select all segments in the same column as the first selected object."""
-				doc = FreeCAD.activeDocument()
-				if not doc:
-					QtWidgets.QMessageBox.warning(self, "Error", "No active document in FreeCAD.")
+			def select_ring_click(self):
+				"""Select all segments in the rings of the selected objects."""
+				keys = self._selected_keys()
+				if keys is None:
 					return
-				
-				selected_objects = FreeCADGui.Selection.getSelection()
-				if not selected_objects:
-					QtWidgets.QMessageBox.warning(self, "Error", "Please select an object in FreeCAD first.")
+				query = RingQuery.all(FreeCAD.activeDocument())
+				selection = query.rings(keys[0][0])
+				for ring, _ in keys[1:]:
+					selection |= query.rings(ring)
+				selection.select()
+
+			def select_column_click(self):
+				"""Select all segments in the same columns as the selected objects."""
+				keys = self._selected_keys()
+				if keys is None:
 					return
-				
-				selected_label = selected_objects[0].Label
-				selected_label_postfix = selected_label[-3:]
-				
-				# Select all objects with the same prefix
-				new_selection = []
-				for obj in doc.Objects:
-					if obj.Label.endswith(selected_label_postfix):
-						new_selection.append(obj)
-				
-				FreeCADGui.Selection.clearSelection()
-				for obj in new_selection:
-					FreeCADGui.Selection.addSelection(obj)
-				doc.recompute()
-			def getVarsetInt(self, property_name):
-				doc = App.activeDocument()
-				varset = doc.getObject("BowlVariables")
-				if varset and property_name in varset.PropertiesList:
-					return getattr(varset, property_name)
-				else:
-					print(f"Property {property_name} not found in BowlVariables.")
-					return None
-			def getVarsetInt(self, property_name):
-				doc = App.activeDocument()
-				varset = doc.getObject("BowlVariables")
-				if varset and property_name in varset.PropertiesList:
-					return getattr(varset, property_name)
-				else:
-					print(f"Property {property_name} not found in BowlVariables.")
-					return None
+				query = RingQuery.all(FreeCAD.activeDocument())
+				selection = query.columns(keys[0][1])
+				for _, segment in keys[1:]:
+					selection |= query.columns(segment)
+				selection.select()
+
 			def apply_color_to_all_segments(self):
 				"""Apply the selected color to all segments in the bowl."""
 				doc = FreeCAD.activeDocument()
 				if not doc:
 					QtWidgets.QMessageBox.warning(self, "Error", "No active document in FreeCAD.")
 					return
-				selection_set = []
-				for obj in doc.Objects:
-					if "Ring" in obj.Label:
-						selection_set.append(obj)
-				FreeCADGui.Selection.clearSelection()
-				for obj in selection_set:
-					FreeCADGui.Selection.addSelection(obj)
-				self.apply_color()
-				FreeCADGui.Selection.clearSelection()
-				doc.recompute()
+				current_row = self.color_list.currentRow()
+				if current_row < 0:
+					QtWidgets.QMessageBox.warning(self, "Error", "No color selected.")
+					return
+				color = self._rgba(self.colors[current_row]["color"])
+				apply_colors(doc, {obj: color for obj in get_index(doc).ring_objects()})
 
 			def bt_random_colors(self):
 				"""Assign random colors from the current list to all objects labeled Ring*."""
@@ -304,63 +322,97 @@ class ApplyColors:
 					QtWidgets.QMessageBox.warning(self, "Error", "No colors available in the list.")
 					return
 
-				ring_objects = [obj for obj in doc.Objects if obj.Label.startswith("Ring")]
+				ring_objects = get_index(doc).ring_objects()
 				if not ring_objects:
 					QtWidgets.QMessageBox.warning(self, "Error", "No objects found with labels starting with 'Ring'.")
 					return
 
-				applied_count = 0
-				for obj in ring_objects:
-					if not hasattr(obj, "ViewObject"):
-						continue
+				palette = [self._rgba(entry["color"]) for entry in self.colors]
+				apply_colors(doc, {obj: random.choice(palette) for obj in ring_objects})
+						
+			def bt_no_touching_colors(self):
+				"""Assign seeded random colors so that no touching segments share a color."""
+				doc = FreeCAD.activeDocument()
+				if not doc:
+					QtWidgets.QMessageBox.warning(self, "Error", "No active document in FreeCAD.")
+					return
 
-					selected_color = random.choice(self.colors)["color"]
-					r = selected_color.red() / 255.0
-					g = selected_color.green() / 255.0
-					b = selected_color.blue() / 255.0
-					obj.ViewObject.ShapeColor = (r, g, b, 1.0)
-					applied_count += 1
+				if not self.colors:
+					QtWidgets.QMessageBox.warning(self, "Error", "No colors available in the list.")
+					return
 
-				doc.recompute()
-						
-			def apply_every_x_input_click(self):
-				"""Get color from the first selected FreeCAD object."""
+				index = get_index(doc)
+				rings = [index.ring(ring) for ring in index.rings()]
+				if not rings:
+					QtWidgets.QMessageBox.warning(self, "Error", "No objects found with labels starting with 'Ring'.")
+					return
+
+				start = time.perf_counter()
+				try:
+					entries = [entry.strip() for entry in self.quotas_edit.text().split(",")] if self.quotas_edit.text().strip() else []
+					if len(entries) > len(self.colors):
+						raise ValueError("There are more quotas than colors.")
+					quotas = [int(entry) if entry else None for entry in entries] + [None] * (len(self.colors) - len(entries))
+					adjacent = ringColoring.neighbours([z_angles(ring) for ring in rings])
+					assignment = ringColoring.color_graph(adjacent, len(self.colors), quotas, seed=self.seed_spinbox.value())
+				except ValueError as e:
+					QtWidgets.QMessageBox.warning(self, "Error", str(e))
+					return
+				palette = [self._rgba(entry["color"]) for entry in self.colors]
+				objects = [obj for ring in rings for obj in ring]
+				apply_colors(doc, {obj: palette[color] for obj, color in zip(objects, assignment)}, "Random Colors")
+				clashes = ringColoring.conflicts(adjacent, assignment)
+				FreeCAD.Console.PrintMessage(
+					f"Colored {len(objects)} segments in {(time.perf_counter() - start) * 1000:.0f} ms\n"
+				)
+				if clashes:
+					FreeCAD.Console.PrintWarning(
+						f"{clashes} pairs of touching segments share a color; add colors or raise the quotas.\n"
+					)
+
+			def on_pattern_changed(self):
+				"""Show the default parameters of the chosen pattern."""
+				_, defaults = colorPatterns.PATTERNS[self.pattern_combo.currentText()]
+				self.pattern_parameters_edit.setText(colorPatterns.format_parameters(defaults))
+
+			def apply_pattern_click(self):
+				"""Color every ring segment with the chosen pattern."""
 				doc = FreeCAD.activeDocument()
 				if not doc:
 					QtWidgets.QMessageBox.warning(self, "Error", "No active document in FreeCAD.")
 					return
-				
-				selected_objects = FreeCADGui.Selection.getSelection()
-				if not selected_objects:
-					QtWidgets.QMessageBox.warning(self, "Error", "Please select an object in FreeCAD first.")
+
+				if not self.colors:
+					QtWidgets.QMessageBox.warning(self, "Error", "No colors available in the list.")
 					return
-				new_selection = []
-				for obj in selected_objects:
-					selected_label = obj.Label
-					selected_label_prefix = selected_label[:9]
-					current_segment = int(selected_label[-3:])
-					#x = int(self.apply_every_x_input.text() )
-					x = self.every_x_spinbox.value()
-					num_segments = self.getVarsetInt("NumSegments")
-					start_segment = current_segment
-					not_done = True
-					reached_end = False
-					while not_done:
-						current_segment += x
-						if current_segment > num_segments and not reached_end:
-							current_segment = current_segment - num_segments
-							reached_end = True
-						if current_segment >= start_segment and reached_end:
-							not_done = False
-						current_segment_string = selected_label_prefix + f"{current_segment:03d}"
-						new_selection.append( doc.getObjectsByLabel(current_segment_string)[0] )
-				FreeCADGui.Selection.clearSelection()
-				for obj in new_selection:
-					FreeCADGui.Selection.addSelection(obj)
-				doc.recompute()
 
-						
+				rings, columns, objects = get_index(doc).grid()
+				if not rings:
+					QtWidgets.QMessageBox.warning(self, "Error", "No objects found with labels starting with 'Ring'.")
+					return
 
+				try:
+					parameters = colorPatterns.parse_parameters(self.pattern_parameters_edit.text())
+					assignment = colorPatterns.evaluate(
+						self.pattern_combo.currentText(), (len(rings), len(columns)), len(self.colors), **parameters
+					)
+				except (ValueError, TypeError) as e:
+					QtWidgets.QMessageBox.warning(self, "Error", str(e))
+					return
+				palette = [self._rgba(entry["color"]) for entry in self.colors]
+				apply_grid_colors(doc, objects, assignment, palette)
+
+			def apply_every_x_input_click(self):
+				"""Select every x-th segment round the ring of each selected object, starting from it."""
+				keys = self._selected_keys()
+				if keys is None:
+					return
+				x = self.every_x_spinbox.value()
+				query = RingQuery.all(FreeCAD.activeDocument())
+				selection = query.rings(keys[0][0]).every(x, keys[0][1])
+				for ring, segment in keys[1:]:
+					selection |= query.rings(ring).every(x, segment)
+				selection.select()
 
 			def get_color_from_selected(self):
 				"""Get color from the first selected FreeCAD object."""
@@ -375,8 +427,8 @@ class ApplyColors:
 					return
 				
 				obj = selected_objects[0]
-				if hasattr(obj, 'ViewObject'):
-					color = obj.ViewObject.ShapeColor
+				color = get_shape_color(obj)
+				if color is not None:
 					r = int(color[0] * 255)
 					g = int(color[1] * 255)
 					b = int(color[2] * 255)
@@ -646,29 +698,15 @@ class ApplyColors:
 					)
 					return
 				
-				# Apply color to each selected object
-				for obj in selected_objects:
-					try:
-						# Convert QColor to RGB tuple (normalized to 0-1)
-						r = selected_color.red() / 255.0
-						g = selected_color.green() / 255.0
-						b = selected_color.blue() / 255.0
-						
-						# Set the color properties
-						if hasattr(obj, "ViewObject"):
-							obj.ViewObject.ShapeColor = (r, g, b, 1.0)
-							
-						#QtWidgets.QMessageBox.information(
-						#	self,
-						#	"Success",
-						#	f"Applied color {selected_color_name} to {obj.Label}."
-						#)
-					except Exception as e:
-						QtWidgets.QMessageBox.critical(
-							self,
-							"Error",
-							f"Failed to apply color: {str(e)}"
-						)
+				# Apply the color to all selected objects at once
+				try:
+					apply_colors(selected_objects[0].Document, {obj: self._rgba(selected_color) for obj in selected_objects})
+				except Exception as e:
+					QtWidgets.QMessageBox.critical(
+						self,
+						"Error",
+						f"Failed to apply color: {str(e)}"
+					)
 
 		dialog = ColorListWidget()
 		# Make it modeless so you can interact with FreeCAD while the dialog is open
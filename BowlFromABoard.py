@@ -31,8 +31,8 @@ except ImportError:
     QtCore = importlib.import_module("PySide2.QtCore")
     QtWidgets = importlib.import_module("PySide2.QtWidgets")
 import Part
-import Draft
-from BOPTools import BOPFeatures
+from boardPlanner import ring_sections, strip_edges, plan, format_plan
+from boardOps import add_board_pieces
 
 class BowlFromABoard:
     
@@ -65,7 +65,6 @@ class BowlFromABoard:
                 self.base_ring_radius = 50.8
                 self.ring_thickness = 20
                 self.ring_width = 25.4
-                self.clone_list = []
                 self.number_of_rings = 6
                 self.number_of_slices = 32
 
@@ -197,62 +196,14 @@ class BowlFromABoard:
 
             def bt_generate_bowl_clicked(self):
                 """Handler for Make Bowl click"""
-                import FreeCAD as App
                 self.update_values()
                 doc = App.ActiveDocument
-                App.Console.PrintMessage("Make Bowl clicked\n")
-                print(self.number_of_slices)
-                self.make_ring(0, 0, self.ring_thickness, self.base_ring_radius, self.slice_angle, "bottom", "Ring0")
-                for i in range(0,self.number_of_rings-2):
-                    a_name = "Ring" + str(i+1)
-                    self.make_ring(self.base_ring_radius+self.ring_width*i, self.ring_thickness*(i+1), self.ring_thickness, self.ring_width, self.slice_angle, "inner", a_name)
-                a_name = "Ring" + str(i+2)
-                self.make_ring(self.base_ring_radius+(self.ring_width*(i+1)), self.ring_thickness*(i+1)+self.ring_thickness, self.ring_thickness, self.ring_width, self.slice_angle, "top", a_name)
-
-                #box_group = doc.addObject("App::DocumentObjectGroup", "boxes")
+                # Work out every ring and strip pair first, then only build the ones holding wood
+                sections = ring_sections(self.base_ring_radius, self.ring_width, self.ring_thickness, self.number_of_rings, self.slice_angle)
                 bowl_width = (self.base_ring_radius+(self.ring_width*(self.number_of_rings)))*2
-                bowl_height = (self.slice_thickness*self.number_of_rings)+(2*self.slice_thickness)
-                box_list = []
-                if (False):
-                    for p in range(0,self.number_of_rings):
-                        for i in range(0,self.number_of_slices):
-                            box = doc.addObject("Part::Box", "Box")
-                            box.Length = bowl_width
-                            slice_width = bowl_width / self.number_of_slices
-                            #box.Width = slice_thickness
-                            box.Width = slice_width
-                            box.Height = bowl_height
-                            shift = bowl_width/2
-
-                            box.Placement = App.Placement(App.Vector(-(box.Length/2), -shift+(i*slice_width), 0), App.Rotation(0, 0, 0))
-                            box_list.append(box.Name)
-                            #box_group.addObject(box)
-                if(False):
-                    for a in range(0,len(self.clone_list)):
-                        bp = BOPFeatures.BOPFeatures(App.activeDocument())
-                        new_common = bp.make_multi_common([box_list[a]] + [self.clone_list[a]])
-                        
-                        x = App.ActiveDocument.getObject(self.clone_list[a])
-                        aName = x.Label
-                        aSplit = aName.split("_")[0]
-                        new_common.Label = "C_" + aSplit + "_"
-                        obj = App.ActiveDocument.getObject(new_common.Name)
-                        
-                        doc.recompute()
-                        #print(type(new_common))
-                        try:
-                            obj = App.ActiveDocument.getObject(new_common.Name)
-                            r_ = 118/256
-                            g_ = 81/256
-                            b_ = 68/256
-                            obj.ViewObject.ShapeColor = (r_, g_, b_)
-                            #print(obj.Shape.Volume)
-                            if (obj.Shape.Volume < 0.1):
-                                doc.removeObject(new_common.Name)
-                                doc.removeObject(box_list[a])
-                                doc.removeObject(self.clone_list[a])
-                        except:
-                            print("Failed to get object:", new_common.Name)         
+                cuts = plan(sections, strip_edges(bowl_width, self.number_of_slices))
+                App.Console.PrintMessage(format_plan(cuts))
+                add_board_pieces(doc, sections, cuts)
 
             def set_tooltips(self):
                 self.bowl_numSegmentsBox.setToolTip("Number of segments around the bowl")
@@ -333,12 +284,6 @@ class BowlFromABoard:
                     revolve.Angle = angle
                     view_obj = doc.getObject(ring_name)
                     view_obj.ViewObject.Transparency = 70
-                    view_obj.Visibility = False
-                    for i in range(0, self.number_of_slices):
-                    # Create a linked clone
-                        cloned_object = Draft.clone(view_obj)
-                        cloned_object.Label = ring_name + "_1"
-                        self.clone_list.append(cloned_object.Name)
                 doc.recompute()
 
             
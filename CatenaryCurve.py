@@ -19,6 +19,7 @@
 import math
 from pydoc import doc
 from unicodedata import name
+import time
 import FreeCAD as App
 import FreeCADGui as Gui
 from FreeCAD import Vector
@@ -33,6 +34,8 @@ except ImportError:
 import Part
 import Draft
 from BOPTools import BOPFeatures
+from bowlOps import wall_solid
+import catenary
 
 class CatenaryCurve:
     
@@ -63,6 +66,8 @@ class CatenaryCurve:
                 self.XEnd=300.0
                 self.YStart=0.0
                 self.NumPoints=50
+                self.Tolerance=catenary.TOLERANCE
+                self.RimHeight=200.0
                 self.WallThickness=0.0
 
                 # Create layout
@@ -130,6 +135,31 @@ class CatenaryCurve:
                 numpoints_layout.addWidget(self.numpoints_edit)
                 layout.addLayout(numpoints_layout)
 
+                # Chord tolerance input
+                tolerance_layout = QtWidgets.QHBoxLayout()
+                tolerance_label = QtWidgets.QLabel("Tolerance:")
+                tolerance_label.setMinimumWidth(100)
+                self.tolerance_edit = QtWidgets.QLineEdit()
+                self.tolerance_edit.setText(str(self.Tolerance))
+                self.tolerance_edit.setToolTip("Largest distance between the curve and the spline points (0 = Num Points only)")
+                tolerance_layout.addWidget(tolerance_label)
+                tolerance_layout.addWidget(self.tolerance_edit)
+                layout.addLayout(tolerance_layout)
+
+                # Rim height input and sag solver
+                rim_layout = QtWidgets.QHBoxLayout()
+                rim_label = QtWidgets.QLabel("Rim Height:")
+                rim_label.setMinimumWidth(100)
+                self.rim_height_edit = QtWidgets.QLineEdit()
+                self.rim_height_edit.setText(str(self.RimHeight))
+                self.button_solve_sag = QtWidgets.QPushButton("Solve Sag")
+                self.button_solve_sag.setToolTip("Set the sag so the curve rises Rim Height between X Start and X End")
+                self.button_solve_sag.clicked.connect(self.bt_solve_sag_clicked)
+                rim_layout.addWidget(rim_label)
+                rim_layout.addWidget(self.rim_height_edit)
+                rim_layout.addWidget(self.button_solve_sag)
+                layout.addLayout(rim_layout)
+
                 # Wall Thickness input
                 wall_layout = QtWidgets.QHBoxLayout()
                 wall_label = QtWidgets.QLabel("Wall Thickness:")
@@ -192,22 +222,22 @@ class CatenaryCurve:
                         App.Console.PrintError("No active document\n")
                         return
 
+                    # Sample first so a bad sag does not leave an empty sketch behind
+                    start = time.perf_counter()
+                    xs, ys = catenary.sample(self.sag, self.XStart, self.XEnd, self.YStart, self.NumPoints, self.Tolerance)
+
                     # Create a new sketch
                     sketch = doc.addObject('Sketcher::SketchObject', 'CatenaryCurveSketch')
                     sketch.Placement = App.Placement(App.Vector(0, 0, 0), App.Rotation(App.Vector(1, 0, 0), 90))
-  
-                    print (self.sag)
-                    poles = []
-                    mirror_curve = self.mirror_curve_radio.isChecked()
-                    for i in range(50 + 1):
-                        x = self.XStart + (self.XEnd - self.XStart) * i / self.NumPoints
-                        y = self.YStart + (self.sag * (math.cosh(x / self.sag) - 1))
-                        if mirror_curve:
-                            x, y = y, x
-                        poles.append(App.Vector(x, y, 0))
-                    # Create the B-spline curve
+                    if self.mirror_curve_radio.isChecked():
+                        xs, ys = ys, xs
+                    poles = [App.Vector(x, y, 0) for x, y in zip(xs.tolist(), ys.tolist())]
+                    # Create the B-spline curve through the sampled points
                     bspline = Part.BSplineCurve()
-                    bspline.buildFromPoles(poles)
+                    bspline.interpolate(poles)
+                    App.Console.PrintMessage(
+                        f"Catenary sag {self.sag:g}: {len(poles)} points in {(time.perf_counter() - start) * 1000:.1f} ms\n"
+                    )
 
                     # Add the B-spline to the sketch
                     sketch.addGeometry(bspline, False)   
@@ -229,6 +259,14 @@ class CatenaryCurve:
                     App.Console.PrintError(f"Error adding Catenary Curve sketch: {str(e)}\n")
                 pass
 
+            def bt_solve_sag_clicked(self):
+                self.update_values()
+                try:
+                    self.sag = catenary.solve_sag(self.RimHeight, self.XStart, self.XEnd)
+                    self.sag_edit.setText(f"{self.sag:.4f}")
+                except ValueError as e:
+                    App.Console.PrintError(f"Error solving sag: {str(e)}\n")
+
             def bt_revolve_clicked(self):
                 import FreeCAD as App
                 try:
@@ -268,22 +306,22 @@ class CatenaryCurve:
                         App.Console.PrintError("Wall thickness must be greater than 0\n")
                         return
 
-                    revolves = [obj for obj in doc.Objects if obj.Name.startswith("CatenaryRevolve")]
-                    if not revolves:
-                        App.Console.PrintError("No revolve found to shell\n")
+                    sketches = [obj for obj in doc.Objects if obj.Name.startswith("CatenaryCurveSketch")]
+                    if not sketches:
+                        App.Console.PrintError("No catenary sketch found to shell\n")
                         return
 
-                    revolve = revolves[-1]
+                    sketch = sketches[-1]
                     doc.recompute()
 
-                    shape = revolve.Shape
-                    if not shape or not shape.Faces:
-                        App.Console.PrintError("Revolve has no faces to shell\n")
+                    # The sketch shape is already placed in the XZ plane
+                    curves = [edge for edge in sketch.Shape.Edges if edge.Curve.TypeId == 'Part::GeomBSplineCurve']
+                    if not curves:
+                        App.Console.PrintError("Catenary sketch has no curve to shell\n")
                         return
 
-                    open_face = max(shape.Faces, key=lambda f: f.CenterOfMass.z)
-                    thickness = -abs(self.WallThickness)
-                    shell_shape = shape.makeThickness([open_face], thickness, 1.0e-3)
+                    # Offset the curve in 2D and revolve the wall section once
+                    shell_shape = wall_solid(curves[0], abs(self.WallThickness))
 
                     shell_obj = doc.addObject("Part::Feature", "CatenaryShell")
                     shell_obj.Shape = shell_shape
@@ -303,6 +341,8 @@ class CatenaryCurve:
                     self.XEnd = float(self.xend_edit.text())
                     self.YStart = float(self.ystart_edit.text())
                     self.NumPoints = int(self.numpoints_edit.text())
+                    self.Tolerance = float(self.tolerance_edit.text())
+                    self.RimHeight = float(self.rim_height_edit.text())
                     self.WallThickness = float(self.wall_thickness_edit.text())
                 except ValueError:
                     pass
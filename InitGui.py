@@ -28,49 +28,20 @@ class WoodturningWorkbench(Gui.Workbench):
 	Icon = str(Path(FreeCAD.getUserAppDataDir()) / "Mod" / "WoodturningWorkbench" / "icons" / "WT_Bench.svg")
 
 	def Initialize(self):
-		from collections import OrderedDict
-		#from AddVase import AddVase
-		from AddVessel import AddVessel
-		from AddTorus import AddTorus
-		from RotateRings import RotateRings
-		from TaskPanelTemplate import TaskPanelTemplate
-		from TopView import TopView
-		from AddSegments import AddSegments
-		from CatenaryCurve import CatenaryCurve
-		from BowlConstructionLines import BowlConstructionLines
-		from SegmentSpreadsheet import SegmentSpreadsheet
-		from BowlFromABoard import BowlFromABoard
-		from ApplyColors import ApplyColors
-		from About import About
-		from WedgeGenerator import WedgeGenerator	
-		from OffcenterTurning import OffcenterTurning
 		"""Initialize the workbench"""
-		# Add commands to toolbar and menu
+		import time
+		from commandManifest import lazy_commands
+		start = time.perf_counter()
+		# Add commands to toolbar and menu; each command module is only imported when first used
 		try:
-			workbench_commands = OrderedDict(
-				[	
-					('AddVessel', AddVessel()),
-					('BowlConstructionLines', BowlConstructionLines()),
-					('AddSegments', AddSegments()),
-					('RotateRings', RotateRings()),
-					('ApplyColors', ApplyColors()),
-					('SegmentSpreadsheet', SegmentSpreadsheet()),
-					('TopView', TopView()),
-					('CatenaryCurve', CatenaryCurve()),
-					('BowlFromABoard', BowlFromABoard()),
-					('AddTorus', AddTorus()),
-					('WedgeGenerator', WedgeGenerator()),
-					('OffcenterTurning', OffcenterTurning()),
-					('About', About())
-				]
-			)	
+			workbench_commands = lazy_commands()
 			for command_name, command in workbench_commands.items():
 				Gui.addCommand(command_name, command)	
 			self.appendToolbar("Woodturning Tools", list(workbench_commands.keys()))
 			self.appendMenu("Woodturning Tools", list(workbench_commands.keys()))
 		except Exception as e:
 			FreeCAD.Console.PrintError(f"Error registering commands: {str(e)}\n")
-		print("Woodturning Tools Workbench initialized")
+		print(f"Woodturning Tools Workbench initialized in {(time.perf_counter() - start) * 1000:.1f} ms")
 
 	def Activated(self):
 		"""Called when the workbench is activated"""
@@ -0,0 +1,187 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Off-centre turning solid computed straight from BowlVariables.
+
+The OffcenterTurning sketches place a point on the bottom and top circles
+for every turning axis, bind them with constraints and expressions, and
+attach a datum line, datum plane, sketch and extrusion to each.  The solver
+and the attachment chain make every change slow.  ``OffcenterSolid`` works
+out the same axes and cutter cylinders from the varset values and
+intersects them with the blank in memory:
+
+* Axis i runs from the bottom point at ``BottomAngle + i * 360 / NumberPoints``
+  on the BottomRadius circle to the matching point at ``TopAngle`` on the
+  TopRadius circle, CylinderHeight up.
+* Each cutter is a CuttingRadius cylinder about its axis, starting
+  ``CUTTER_OFFSET`` before the bottom point and ``CUTTER_LENGTH`` long, like
+  the attached extrusions.
+
+``export_sketches`` adds plain, unconstrained copies of the points and axes
+for anyone who wants to edit them by hand.
+"""
+import math
+from pathlib import Path
+
+import FreeCAD as App
+import Part
+
+from booleanOps import common_shapes
+from varsetOps import getVarsetValue, getVarsetInt
+
+CUTTER_OFFSET = 50.0
+CUTTER_LENGTH = 300.0
+KEY_DECIMALS = 6
+VARIABLES = (
+    "NumberPoints", "BottomAngle", "TopAngle", "CylinderHeight",
+    "CylinderRadius", "TopRadius", "BottomRadius", "CuttingRadius",
+)
+
+
+def read_parameters(varset):
+    """Return {name: value} of the off-centre turning variables (missing ones are 0)."""
+    parameters = {}
+    for name in VARIABLES:
+        value = getVarsetInt(varset, name) if name == "NumberPoints" else getVarsetValue(varset, name)
+        parameters[name] = value if value is not None else 0
+    parameters["NumberPoints"] = int(parameters["NumberPoints"])
+    return parameters
+
+
+def axis_points(parameters):
+    """Return a list of (bottom, top) Vectors, one pair per turning axis."""
+    count = parameters["NumberPoints"]
+    if count < 1:
+        return []
+    step = 2 * math.pi / count
+    axes = []
+    for i in range(count):
+        bottom_angle = math.radians(parameters["BottomAngle"]) + i * step
+        top_angle = math.radians(parameters["TopAngle"]) + i * step
+        bottom = App.Vector(
+            parameters["BottomRadius"] * math.cos(bottom_angle), parameters["BottomRadius"] * math.sin(bottom_angle), 0
+        )
+        top = App.Vector(
+            parameters["TopRadius"] * math.cos(top_angle), parameters["TopRadius"] * math.sin(top_angle),
+            parameters["CylinderHeight"],
+        )
+        axes.append((bottom, top))
+    return axes
+
+
+def cutter_shape(bottom, top, radius):
+    """Return the cutting cylinder about the axis from ``bottom`` to ``top``."""
+    direction = top - bottom
+    direction.normalize()
+    return Part.makeCylinder(radius, CUTTER_LENGTH, bottom - direction * CUTTER_OFFSET, direction)
+
+
+def _key(*values):
+    return tuple(round(float(value), KEY_DECIMALS) for value in values)
+
+
+class OffcenterSolid:
+    """Proxy for the direct off-centre turning solid."""
+
+    def __init__(self, obj):
+        obj.addProperty("App::PropertyLink", "Variables", "Offcenter", "BowlVariables varset with the turning parameters")
+        obj.Proxy = self
+        self._cache = {}
+
+    def dumps(self):
+        return None
+
+    def loads(self, state):
+        return None
+
+    def execute(self, obj):
+        if obj.Variables is None:
+            return
+        cache = getattr(self, "_cache", None)
+        if cache is None:
+            cache = self._cache = {}
+        parameters = read_parameters(obj.Variables)
+        blank = Part.makeCylinder(parameters["CylinderRadius"], parameters["CylinderHeight"])
+        shapes = [blank]
+        keys = [("blank",) + _key(parameters["CylinderRadius"], parameters["CylinderHeight"])]
+        for bottom, top in axis_points(parameters):
+            shapes.append(cutter_shape(bottom, top, parameters["CuttingRadius"]))
+            keys.append(_key(*bottom, *top, parameters["CuttingRadius"]))
+        visited = set()
+        obj.Shape = common_shapes(shapes, keys, cache, visited=visited)
+        # Only keep the intermediate results of the current design.
+        self._cache = {key: cache[key] for key in visited}
+
+
+class ViewProviderOffcenterSolid:
+    """View provider for OffcenterSolid."""
+
+    def __init__(self, vobj):
+        vobj.Proxy = self
+
+    def attach(self, vobj):
+        self.Object = vobj.Object
+
+    def getIcon(self):
+        return str(Path(App.getUserAppDataDir()) / "Mod" / "WoodturningWorkbench" / "icons" / "OffcenterTurning.svg")
+
+    def dumps(self):
+        return None
+
+    def loads(self, state):
+        return None
+
+
+def make_offcenter_solid(doc, variables, label="OffcenterSolid"):
+    """Return the document's OffcenterSolid for ``variables``, adding it if needed, recomputed."""
+    for obj in doc.Objects:
+        if isinstance(getattr(obj, "Proxy", None), OffcenterSolid) and obj.Variables == variables:
+            break
+    else:
+        obj = doc.addObject("Part::FeaturePython", label)
+        OffcenterSolid(obj)
+        obj.Variables = variables
+        if App.GuiUp:
+            ViewProviderOffcenterSolid(obj.ViewObject)
+    obj.touch()
+    doc.recompute()
+    return obj
+
+
+def export_sketches(doc, variables):
+    """Add unconstrained Bottom/Top sketches and an axis compound for hand editing.
+
+    Nothing is bound to BowlVariables; the objects are a snapshot of the
+    current design.  Returns (bottom sketch, top sketch, axes).
+    """
+    parameters = read_parameters(variables)
+    axes = axis_points(parameters)
+    bottom_sketch = doc.addObject("Sketcher::SketchObject", "Bottom_Sketch")
+    top_sketch = doc.addObject("Sketcher::SketchObject", "Top_Sketch")
+    top_sketch.Placement = App.Placement(App.Vector(0, 0, parameters["CylinderHeight"]), App.Rotation())
+    origin, normal = App.Vector(0, 0, 0), App.Vector(0, 0, 1)
+    for sketch, radius in ((bottom_sketch, parameters["BottomRadius"]), (top_sketch, parameters["TopRadius"])):
+        sketch.addGeometry(Part.Circle(origin, normal, radius), True)
+        sketch.addGeometry(Part.Circle(origin, normal, parameters["CylinderRadius"]), False)
+    for bottom, top in axes:
+        bottom_sketch.addGeometry(Part.Point(bottom), False)
+        top_sketch.addGeometry(Part.Point(App.Vector(top.x, top.y, 0)), False)
+    axis_obj = doc.addObject("Part::Feature", "Offcenter_Axes")
+    axis_obj.Shape = Part.Compound([Part.makeLine(bottom, top) for bottom, top in axes]) if axes else Part.Shape()
+    doc.recompute()
+    return bottom_sketch, top_sketch, axis_obj
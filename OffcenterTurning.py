@@ -35,6 +35,8 @@ import Draft
 import Sketcher
 from BOPTools import BOPFeatures
 from varsetOps import setVarsetValue, getVarsetValue, getVarsetInt, setVarsetInt
+from booleanOps import common_tree
+from OffcenterSolid import make_offcenter_solid, export_sketches
 
 class OffcenterTurning:
 	
@@ -82,6 +84,8 @@ class OffcenterTurning:
 					self.varset.BottomRadius = 65.0
 					self.varset.addProperty("App::PropertyFloat", "CuttingRadius", "General", "Radius of the cutting cylinder in mm")
 					self.varset.CuttingRadius = 200.0
+				else:
+					self.varset = doc.getObject("BowlVariables")
 
 					
 
@@ -182,7 +186,16 @@ class OffcenterTurning:
 				self.button_close.clicked.connect(self.on_cancel)
 				button_layout.addWidget(self.button_close)
 
+				mode_layout = QtWidgets.QHBoxLayout()
+				self.direct_checkbox = QtWidgets.QCheckBox("Direct Geometry")
+				self.direct_checkbox.setToolTip("Compute the axes and cutters straight from BowlVariables instead of building constrained sketches")
+				mode_layout.addWidget(self.direct_checkbox)
+				self.editable_sketches_checkbox = QtWidgets.QCheckBox("Editable Sketches")
+				self.editable_sketches_checkbox.setToolTip("With Direct Geometry, also add unconstrained copies of the sketches and axes")
+				mode_layout.addWidget(self.editable_sketches_checkbox)
+
 				layout.addLayout(button_layout)
+				layout.addLayout(mode_layout)
 				# Add stretch at end
 				layout.addStretch()
 				self.slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
@@ -206,7 +219,7 @@ class OffcenterTurning:
 					#self.label.setText(f"Current Value: {value}")
 			def change_num_points(self):
 				sketch = App.ActiveDocument.getObject("Bottom_Sketch")
-				if sketch is not None:
+				if sketch is not None and not self.direct_checkbox.isChecked():
 					self.update_values()
 					self.bt_delete_clicked()
 					self.bt_add_sketches_clicked()
@@ -230,6 +243,11 @@ class OffcenterTurning:
 				if doc is None:
 					App.Console.PrintError("No active document.\n")
 					return
+				if self.direct_checkbox.isChecked():
+					make_offcenter_solid(doc, self.varset)
+					if self.editable_sketches_checkbox.isChecked():
+						export_sketches(doc, self.varset)
+					return
 
 				bottom_radius = getVarsetValue(self, "BottomRadius")
 				top_radius = getVarsetValue(self, "TopRadius")
@@ -442,14 +460,9 @@ class OffcenterTurning:
 					extrude_list = []
 					for obj in doc.Objects:
 						if obj.Label.startswith("Extrude"):
-							extrude_list.append(obj.Name)
-			
-					for i in range(len(extrude_list)):
-						bp = BOPFeatures.BOPFeatures(App.activeDocument())
-						if i == 0:
-							new_common = bp.make_multi_common([extrude_list[i]] + [a_cylinder.Name])
-						else:
-							new_common = bp.make_multi_common([extrude_list[i]] + [new_common.Name])
+							extrude_list.append(obj)
+					# A balanced tree keeps a change to one cutter from recomputing every common after it
+					common_tree(doc, [a_cylinder] + extrude_list)
 				doc.recompute()
 
 			def set_tooltips(self):
@@ -34,6 +34,8 @@ import Part
 import Draft
 from BOPTools import BOPFeatures
 from varsetOps import getVarsetInt
+from labelIndex import get_index, parse_ring_label
+from rotationOps import rotate_objects, rotate_rings, reset_rings
 
 class RotateRings:
     
@@ -166,30 +168,10 @@ class RotateRings:
                 self.update_values()
                 doc = App.ActiveDocument
                 #Ring_001_001
-                print("Rotating Rings")
-                list_of_rings = []
-                prefix = "Ring_"
-                for obj in doc.Objects:
-                    if obj.Label.startswith(prefix):
-                        # Check if the object's label starts with the specified prefix
-                        left_char = obj.Label[:9]
-                        if left_char not in list_of_rings:
-                            list_of_rings.append(left_char)
-                print (list_of_rings)
-                list_of_rings.sort()
-                starting_angle = 0
-                ring_num = 0
-                for ring_name in list_of_rings:
-                    print(ring_name)
-                    for obj in doc.Objects:
-                        if obj.Label.startswith(ring_name):
-                            if obj.Label.endswith("001"):
-                                print(self.rotation_per_ring*ring_num)
-                            obj = doc.getObject(obj.Name)
-                            incremental_rotation = App.Placement(App.Vector(0,0,0), App.Vector(0,0,1), self.rotation_per_ring*ring_num).Rotation
-                            obj.Placement = App.Placement(obj.Placement.Base, incremental_rotation.multiply(obj.Placement.Rotation))
-                    starting_angle = starting_angle - self.rotation_per_ring
-                    ring_num = ring_num + 1     
+                index = get_index(doc)
+                rings = [index.ring(ring) for ring in index.rings()]
+                print(f"Rotating {len(rings)} rings by {self.rotation_per_ring} degrees per ring")
+                rotate_rings(doc, rings, self.rotation_per_ring)
             def bt_rotate_selected_ring_click(self):
                 self.update_values()
                 doc = App.ActiveDocument
@@ -197,30 +179,23 @@ class RotateRings:
                 if not selection:
                     App.Console.PrintError("No ring selected. Please select a ring object.\n")
                     return
-                selected_label = selection[0].Label
-                if len(selected_label) < 8:
+                key = parse_ring_label(selection[0].Label)
+                if key is None:
                     App.Console.PrintError("Selected object label is invalid.\n")
                     return
-                ring_prefix = selected_label[:8]
-                for obj in doc.Objects:
-                    if obj.Label.startswith(ring_prefix):
-                        obj = doc.getObject(obj.Name)
-                        incremental_rotation = App.Placement(App.Vector(0,0,0), App.Vector(0,0,1), self.rotation_per_ring).Rotation
-                        obj.Placement = App.Placement(obj.Placement.Base, incremental_rotation.multiply(obj.Placement.Rotation))
+                objects = get_index(doc).ring(key[0])
+                rotate_objects(doc, objects, [self.rotation_per_ring] * len(objects), "Rotate Ring")
             def reset_rotation(self):
                 self.update_values()
                 doc = App.ActiveDocument
-                ring_objects = [obj for obj in doc.Objects if obj.Label.startswith("Ring")]
-                for obj in ring_objects:
-                    label_suffix = obj.Label[-3:]
-                    try:
-                        ring_index = int(label_suffix)
-                    except ValueError:
-                        continue
-                    rotation_angle = (ring_index - 1) * (360 / self.num_segments)
-                    obj = doc.getObject(obj.Name)
-                    reset_rotation = App.Placement(App.Vector(0,0,0), App.Vector(0,0,1), rotation_angle).Rotation
-                    obj.Placement = App.Placement(obj.Placement.Base, reset_rotation)
+                index = get_index(doc)
+                objects = []
+                segment_numbers = []
+                for segment in index.columns():
+                    column = index.column(segment)
+                    objects.extend(column)
+                    segment_numbers.extend([segment] * len(column))
+                reset_rings(doc, objects, segment_numbers, self.num_segments)
             def bt_A_clicked(self):
                 """Handler for Button A click"""
                 App.Console.PrintMessage("Button A clicked\n")
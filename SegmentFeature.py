@@ -0,0 +1,131 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Parametric segment blank.
+
+``SegmentFeature`` is a FeaturePython object holding one row of segment
+parameters (see segmentOps) as properties and building its trapezoid prism
+on recompute.  Resizing a segment changes its properties and recomputes it
+in place, so its name, links, colour and placement are kept.
+"""
+from pathlib import Path
+
+import FreeCAD as App
+
+from docOps import batch_update
+from segmentOps import make_segment_shape
+
+
+class SegmentFeature:
+    """Proxy for a segment blank."""
+
+    def __init__(self, obj):
+        obj.addProperty("App::PropertyInteger", "NumSegments", "Segment", "Number of segments in the ring").NumSegments = 12
+        obj.addProperty("App::PropertyLength", "Radius", "Segment", "Outer radius of the segment")
+        obj.addProperty("App::PropertyLength", "TrapezoidHeight", "Segment", "Radial depth of the segment")
+        obj.addProperty("App::PropertyDistance", "ZLevel", "Segment", "Height of the bottom of the segment")
+        obj.addProperty("App::PropertyLength", "ExtrudeHeight", "Segment", "Thickness of the segment")
+        obj.addProperty("App::PropertyBool", "SolidBottom", "Segment", "Run the segment to the centre")
+        obj.Proxy = self
+
+    def dumps(self):
+        return None
+
+    def loads(self, state):
+        return None
+
+    def execute(self, obj):
+        obj.Shape = make_segment_shape(*segment_parameters(obj))
+
+
+class ViewProviderSegmentFeature:
+    """View provider for SegmentFeature."""
+
+    def __init__(self, vobj):
+        vobj.Proxy = self
+
+    def attach(self, vobj):
+        self.Object = vobj.Object
+
+    def getIcon(self):
+        return str(Path(App.getUserAppDataDir()) / "Mod" / "WoodturningWorkbench" / "icons" / "AddSegments.svg")
+
+    def dumps(self):
+        return None
+
+    def loads(self, state):
+        return None
+
+
+def is_segment_feature(obj):
+    return isinstance(getattr(obj, "Proxy", None), SegmentFeature)
+
+
+def segment_parameters(obj):
+    """Return the segment parameter row held by a SegmentFeature."""
+    return [
+        obj.NumSegments,
+        obj.Radius.Value,
+        obj.TrapezoidHeight.Value,
+        obj.ZLevel.Value,
+        obj.ExtrudeHeight.Value,
+        obj.SolidBottom,
+    ]
+
+
+def set_segment_parameters(obj, row):
+    """Set the properties of a SegmentFeature from a segment parameter row."""
+    num_segments, radius, trapezoid_height, z_level, extrude_height, solid_bottom = row
+    obj.NumSegments = int(num_segments)
+    obj.Radius = radius
+    obj.TrapezoidHeight = trapezoid_height
+    obj.ZLevel = z_level
+    obj.ExtrudeHeight = extrude_height
+    obj.SolidBottom = bool(solid_bottom)
+
+
+def make_segment_feature(doc, row, name="Segment_000"):
+    """Add a SegmentFeature for one segment parameter row (recompute to build it)."""
+    obj = doc.addObject("Part::FeaturePython", name)
+    SegmentFeature(obj)
+    set_segment_parameters(obj, row)
+    if App.GuiUp:
+        ViewProviderSegmentFeature(obj.ViewObject)
+    return obj
+
+
+def resize_segments(doc, objects, outer=0.0, inner=0.0):
+    """Grow every segment by ``outer`` mm at its outer edge and ``2 * inner`` mm at its inner edge.
+
+    Negative values shrink it.  All segments are changed and recomputed as
+    one undo step.  Returns the segments that were resized.  If any segment
+    would be left with no radius or trapezoid height, ValueError is raised
+    naming them and nothing is changed.
+    """
+    segments = [obj for obj in objects if is_segment_feature(obj)]
+    if not segments:
+        return []
+    sizes = [(obj.Radius.Value + outer, obj.TrapezoidHeight.Value + outer + 2 * inner) for obj in segments]
+    too_small = [obj.Label for obj, (radius, height) in zip(segments, sizes) if radius <= 0 or height <= 0]
+    if too_small:
+        raise ValueError(f"Resizing would leave no radius or trapezoid height in {', '.join(too_small)}.")
+    with batch_update(doc, "Resize Segments"):
+        for obj, (radius, height) in zip(segments, sizes):
+            obj.Radius = radius
+            obj.TrapezoidHeight = height
+    return segments
@@ -19,6 +19,7 @@ import FreeCAD
 import FreeCADGui
 import Sketcher
 import Part
+from labelIndex import get_index
 
 class SegmentSpreadsheet:
 	"""Command to add a catenary curve sketch"""
@@ -53,10 +54,7 @@ class SegmentSpreadsheet:
 			App.Console.PrintError("No active document found\n")
 			exit()
 
-		segment_objects = []
-		for obj in doc.Objects:
-			if "Segment" in obj.Label:
-				segment_objects.append(obj)
+		segment_objects = get_index(doc).segments()
 		# Activate the Spreadsheet workbench
 		try:
 			Gui.activateWorkbench("SpreadsheetWorkbench")
@@ -0,0 +1,190 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Parametric segmented vessel.
+
+``SegmentedVessel`` is a FeaturePython object that links the profile sketch
+and the BowlVariables varset and produces every ring of the vessel as its
+shape: segment blanks, trimmed by the bowl solid and arrayed around Z.
+
+Each ring gets a key made of its layer parameters, the shared settings and
+the profile points it depends on (see ``segmentKernel.ring_dependencies``).
+Ring shapes are cached by key, so after moving one profile point or changing
+a setting only the rings whose key changed are rebuilt.  Rebuilt rings also
+go to the shared shape cache, so returning to an earlier design reloads
+them from disk.
+"""
+from pathlib import Path
+
+import numpy as np
+
+import FreeCAD as App
+import Part
+
+import profileOffset
+import segmentKernel
+from bowlOps import bowl_solid_shape
+from profileSampler import get_sampler
+from intersectOps import to_solid
+from segmentOps import make_segment_shape
+from shapeCache import get_cache, make_key
+from varsetOps import getVarsetValue, getVarsetInt
+
+KEY_DECIMALS = 6
+SEGMENT_ROTATION = -90
+
+
+class SegmentedVessel:
+    """Proxy for the parametric vessel feature."""
+
+    def __init__(self, obj):
+        obj.addProperty("App::PropertyLink", "Profile", "Vessel", "Sketch holding the profile points")
+        obj.addProperty("App::PropertyLink", "Variables", "Vessel", "BowlVariables varset; overrides the values below when set")
+        obj.addProperty("App::PropertyInteger", "NumSegments", "Vessel", "Number of segments around the bowl").NumSegments = 12
+        obj.addProperty("App::PropertyLength", "WallThickness", "Vessel", "Wall thickness of the bowl").WallThickness = 10
+        obj.addProperty("App::PropertyFloat", "Fudge", "Vessel", "Extra material around each segment in mm").Fudge = 4
+        obj.addProperty("App::PropertyBool", "SolidBottom", "Vessel", "Make the first ring a solid disk").SolidBottom = True
+        obj.addProperty("App::PropertyBool", "OffsetWall", "Vessel", "Size each segment to reach the true inside of the wall").OffsetWall = True
+        obj.addProperty("App::PropertyBool", "Trim", "Vessel", "Trim the segments with the bowl solid").Trim = True
+        obj.addProperty("App::PropertyIntegerList", "RebuiltRings", "Status", "Rings built by the last recompute (not reused or reloaded)")
+        obj.setEditorMode("RebuiltRings", 1)
+        obj.Proxy = self
+        self._cache = {}
+
+    def dumps(self):
+        return None
+
+    def loads(self, state):
+        return None
+
+    def parameters(self, obj):
+        """Return (num_segments, wall_thickness, fudge, solid_bottom) from the varset or the object."""
+        num_segments = obj.NumSegments
+        wall_thickness = obj.WallThickness.Value
+        if obj.Variables is not None:
+            num_segments = getVarsetInt(obj.Variables, "NumSegments") or num_segments
+            wall_thickness = getVarsetValue(obj.Variables, "WallThickness") or wall_thickness
+        return int(num_segments), float(wall_thickness), float(obj.Fudge), bool(obj.SolidBottom)
+
+    def ring_keys(self, obj, points, layers):
+        """Return one hashable key per ring; equal keys mean equal ring shapes."""
+        num_segments, wall_thickness, fudge, solid_bottom = self.parameters(obj)
+        settings = (num_segments, wall_thickness, fudge, solid_bottom, obj.Trim, getattr(obj, "OffsetWall", False))
+        rounded_points = np.round(points, KEY_DECIMALS)
+        rounded_layers = np.round(layers, KEY_DECIMALS)
+        dependencies = segmentKernel.ring_dependencies(points, wall_thickness)
+        keys = []
+        for ring, (lo, hi) in enumerate(dependencies):
+            key = settings + (tuple(rounded_layers[ring]),)
+            if obj.Trim:
+                key += (tuple(rounded_points[lo:hi].ravel()),)
+            keys.append(key)
+        return keys
+
+    def build_ring(self, layer, num_segments, tool):
+        """Return the compound of all segments of one ring, or None if nothing is left."""
+        segment = make_segment_shape(num_segments, *layer)
+        segment.rotate(App.Vector(0, 0, 0), App.Vector(0, 0, 1), SEGMENT_ROTATION)
+        if tool is not None:
+            segment = to_solid(segment.common(tool))
+            if segment is None:
+                return None
+        segments = []
+        for angle in segmentKernel.ring_angles(num_segments):
+            copy = segment.copy()
+            copy.rotate(App.Vector(0, 0, 0), App.Vector(0, 0, 1), float(angle))
+            segments.append(copy)
+        return Part.Compound(segments)
+
+    def execute(self, obj):
+        if obj.Profile is None:
+            return
+        cache = getattr(self, "_cache", None)
+        if cache is None:
+            cache = self._cache = {}
+        num_segments, wall_thickness, fudge, solid_bottom = self.parameters(obj)
+        sampler = get_sampler(obj.Profile)
+        points = sampler.points()
+        inner_radius = None
+        # Vessels saved before OffsetWall existed keep the x - wall_thickness sizing.
+        if getattr(obj, "OffsetWall", False) and len(points) > 1:
+            inner = sampler.inner_profile(wall_thickness)
+            inner_radius = profileOffset.band_inner_radius(inner, points[:-1, 1], points[1:, 1])
+        layers = segmentKernel.layer_parameters(points, num_segments, wall_thickness, fudge, solid_bottom, inner_radius)
+        keys = self.ring_keys(obj, points, layers)
+
+        tool = None
+        rebuilt = []
+        for ring, key in enumerate(keys):
+            if key in cache:
+                continue
+            stored_key = make_key("vessel_ring", (), ring=key)
+            shape = get_cache().get(stored_key)
+            if shape is None:
+                if obj.Trim and tool is None:
+                    tool = bowl_solid_shape(sampler.point_list(), wall_thickness, curve=sampler.curve())
+                shape = self.build_ring(layers[ring].tolist(), num_segments, tool)
+                get_cache().put(stored_key, shape if shape is not None else Part.Compound([]))
+                rebuilt.append(ring)
+            elif not shape.Solids:
+                shape = None
+            cache[key] = shape
+        # Only keep the rings of the current design.
+        self._cache = {key: cache[key] for key in keys}
+
+        obj.RebuiltRings = rebuilt
+        shapes = [self._cache[key] for key in keys if self._cache[key] is not None]
+        obj.Shape = Part.Compound(shapes)
+
+
+class ViewProviderSegmentedVessel:
+    """View provider for SegmentedVessel."""
+
+    def __init__(self, vobj):
+        vobj.Proxy = self
+
+    def attach(self, vobj):
+        self.Object = vobj.Object
+
+    def getIcon(self):
+        return str(Path(App.getUserAppDataDir()) / "Mod" / "WoodturningWorkbench" / "icons" / "AddSegments.svg")
+
+    def dumps(self):
+        return None
+
+    def loads(self, state):
+        return None
+
+
+def make_segmented_vessel(doc, profile, variables=None, fudge=4, solid_bottom=True, offset_wall=True, label="Vessel"):
+    """Add a SegmentedVessel for ``profile`` (and optionally the varset) and recompute it.
+
+    The default label does not start with "Segment", so the segment
+    commands and the label index do not take the vessel for a segment.
+    """
+    obj = doc.addObject("Part::FeaturePython", label)
+    SegmentedVessel(obj)
+    obj.Profile = profile
+    obj.Variables = variables
+    obj.Fudge = fudge
+    obj.SolidBottom = solid_bottom
+    obj.OffsetWall = offset_wall
+    if App.GuiUp:
+        ViewProviderSegmentedVessel(obj.ViewObject)
+    doc.recompute()
+    return obj
@@ -34,6 +34,7 @@ import Part
 import Draft
 from BOPTools import BOPFeatures
 from varsetOps import getVarsetInt
+from labelIndex import get_index
 from pathlib import Path
 
 class TopView:
@@ -133,26 +134,14 @@ class TopView:
                     App.Console.PrintMessage(
                         f"Saved original locations for {len(self.segment_original_locations)} segments.\n"
                     )                
-                segment_list = []
+                segment_names = set(current_names)
                 for obj in doc.Objects:
-                    print(f"Object: {obj.Name}, Label: {obj.Label}")
-                    if obj.Label.startswith("Segment"):
-                        if hasattr(obj, "ViewObject"):
-                            obj.ViewObject.Visibility = True
-                        segment_list.append(obj.Label)
-                    else:
-                        if hasattr(obj, "ViewObject"): 
-                            obj.ViewObject.Visibility = False
-                    segment_list.sort()
-                start_angle = 0
+                    if hasattr(obj, "ViewObject"):
+                        obj.ViewObject.Visibility = obj.Name in segment_names
                 rotation_angle = 360 / self.num_segments
-                count = 0
-                for label in segment_list:
-                    print(f"Segment Object: {label}")
-                    obj = doc.getObjectsByLabel(label)[0]
+                for count, obj in enumerate(segment_objects):
                     incremental_rotation = App.Placement(App.Vector(0,0,0), App.Vector(0,0,1), rotation_angle*count).Rotation
                     obj.Placement = App.Placement(obj.Placement.Base, incremental_rotation.multiply(obj.Placement.Rotation))
-                    count += 1
 
             def bt_array_segments_for_plan(self):
                 """Arrange segment objects in a rectangular X/Y array for plan view."""
@@ -240,12 +229,7 @@ class TopView:
                 doc = App.ActiveDocument
                 if doc is None:
                     return []
-                segment_objects = []
-                for obj in doc.Objects:
-                    if hasattr(obj, "Label") and obj.Label.startswith("Segment"):
-                        segment_objects.append(obj)
-                segment_objects.sort(key=lambda o: o.Label)
-                return segment_objects
+                return get_index(doc).segments()
 
             def _get_techdraw_template(self):
                 """Return a template path for the new TechDraw page, if available."""
@@ -0,0 +1,79 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Board pieces of a bowl from a board.
+
+boardPlanner decides which ring and strip pairs hold wood; only those are
+intersected here, each ring solid being revolved once in memory.  Pieces
+are labelled ``C_Ring<r>_<strip>_<piece>``.
+"""
+import time
+
+import FreeCAD as App
+import Part
+
+from docOps import batch_update
+
+Z_AXIS = App.Vector(0, 0, 1)
+PIECE_COLOR = (118 / 256, 81 / 256, 68 / 256)
+
+
+def ring_solid(section):
+    """Revolve a (4, 2) (radius, height) ring section about Z."""
+    corners = [App.Vector(x, 0, z) for x, z in section]
+    face = Part.Face(Part.makePolygon(corners + [corners[0]]))
+    return face.revolve(App.Vector(0, 0, 0), Z_AXIS, 360)
+
+
+def piece_shapes(solid, y0, y1, z, thickness, radius):
+    """Return the solids of ``solid`` between y0 and y1 in its height band."""
+    margin = 1.0
+    box = Part.makeBox(
+        2 * (radius + margin), y1 - y0, thickness + 2 * margin,
+        App.Vector(-radius - margin, y0, z - margin),
+    )
+    return solid.common(box).Solids
+
+
+def add_board_pieces(doc, sections, cuts):
+    """Add a ``Part::Feature`` for every piece in the cut plan; returns them."""
+    start = time.perf_counter()
+    pieces = []
+    with batch_update(doc, "Bowl From A Board"):
+        for ring, section in enumerate(sections):
+            strips = [strip for strip in range(cuts["pieces"].shape[1]) if cuts["pieces"][ring, strip]]
+            if not strips:
+                continue
+            solid = ring_solid(section.tolist())
+            radius = float(section[:, 0].max())
+            for strip in strips:
+                shapes = piece_shapes(
+                    solid, float(cuts["y0"][ring, strip]), float(cuts["y1"][ring, strip]),
+                    float(cuts["z"][ring, strip]), float(cuts["thickness"][ring, strip]), radius,
+                )
+                for number, shape in enumerate(shapes, start=1):
+                    obj = doc.addObject("Part::Feature", "Piece")
+                    obj.Shape = shape
+                    obj.Label = f"C_Ring{ring}_{strip:03d}_{number}"
+                    if obj.ViewObject is not None:
+                        obj.ViewObject.ShapeColor = PIECE_COLOR
+                    pieces.append(obj)
+    App.Console.PrintMessage(
+        f"Added {len(pieces)} board pieces in {(time.perf_counter() - start) * 1000:.0f} ms\n"
+    )
+    return pieces
@@ -0,0 +1,143 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Board slicing plan for a bowl from a board.
+
+It tells Bowl From A Board which pieces each strip yields.  Each ring of
+the bowl is a trapezoid section (radius, height) turned about Z; the board
+is cut into strips across Y.  For every ring and every strip ``plan`` works
+out, without building any solids, how many pieces the strip cuts from the
+ring, their blank dimensions and their volume:
+
+* A strip that misses the outside of the ring cuts nothing.
+* A strip that stays inside the hole of the ring at every height cuts two
+  arcs, one each side of the axis.
+* Any other strip cuts one piece.
+
+The volume is the area of the annulus inside the strip (closed form, from
+circle segments) integrated over the ring height by Gauss-Legendre
+quadrature, since the radii change linearly with height.
+"""
+import numpy as np
+
+MIN_VOLUME = 0.1
+QUADRATURE_POINTS = 8
+
+# Corner order of a ring section: bottom inner, bottom outer, top outer, top inner
+BOTTOM_INNER, BOTTOM_OUTER, TOP_OUTER, TOP_INNER = range(4)
+
+
+def ring_sections(base_ring_radius, ring_width, ring_thickness, number_of_rings, slice_angle):
+    """Return the (rings, 4, 2) trapezoid sections of the bowl, bottom ring first.
+
+    The bottom ring is a disc of ``base_ring_radius``, the top ring has a
+    vertical outside and the rings between lean out by ``slice_angle``.
+    """
+    run = ring_thickness / np.tan(np.radians(slice_angle))
+    sections = [[(0, 0), (base_ring_radius, 0), (base_ring_radius + run, ring_thickness), (0, ring_thickness)]]
+    for k in range(number_of_rings - 1):
+        inner = base_ring_radius + ring_width * k
+        z = ring_thickness * (k + 1)
+        top = k == number_of_rings - 2
+        outer_top = inner + ring_width if top else inner + ring_width + run
+        sections.append([(inner, z), (inner + ring_width, z), (outer_top, z + ring_thickness), (inner + run, z + ring_thickness)])
+    return np.array(sections, dtype=float)
+
+
+def strip_edges(bowl_width, number_of_slices):
+    """Return the ``number_of_slices + 1`` Y edges of equal strips across the bowl."""
+    return np.linspace(-bowl_width / 2.0, bowl_width / 2.0, number_of_slices + 1)
+
+
+def _disc_strip_area(radius, y0, y1):
+    """Return the area of discs of ``radius`` between y0 and y1 (broadcasting)."""
+    radius = np.maximum(radius, 0.0)
+
+    def below(y):
+        # Area of the disc below y: integral of 2 sqrt(r^2 - t^2) from -r to y
+        t = np.clip(y, -radius, radius)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(radius > 0, t / np.where(radius > 0, radius, 1.0), 0.0)
+        return t * np.sqrt(np.maximum(radius ** 2 - t ** 2, 0.0)) + radius ** 2 * (np.arcsin(ratio) + np.pi / 2)
+
+    return below(y1) - below(y0)
+
+
+def plan(sections, edges):
+    """Return the cut plan of every ring against every strip as a dict of (rings, strips) arrays.
+
+    Keys: ``pieces`` (0, 1 or 2), ``y0``/``y1`` (the part of the strip
+    holding wood), ``length`` (blank length along X of each piece),
+    ``width`` (along Y), ``thickness``, ``z`` (bottom height) and ``volume``
+    (of all pieces together).  Pieces smaller than ``MIN_VOLUME`` are left out.
+    """
+    sections = np.asarray(sections, dtype=float)
+    edges = np.asarray(edges, dtype=float)
+    x, z = sections[..., 0], sections[..., 1]
+    z_bottom, z_top = z[:, BOTTOM_INNER], z[:, TOP_INNER]
+    thickness = z_top - z_bottom
+    outer_max = np.maximum(x[:, BOTTOM_OUTER], x[:, TOP_OUTER])
+    inner_min = np.minimum(x[:, BOTTOM_INNER], x[:, TOP_INNER])
+
+    # Quadrature over the ring height: radii at each node, (rings, nodes)
+    nodes, weights = np.polynomial.legendre.leggauss(QUADRATURE_POINTS)
+    fraction = (nodes + 1) / 2
+    inner = x[:, [BOTTOM_INNER]] + fraction * (x[:, [TOP_INNER]] - x[:, [BOTTOM_INNER]])
+    outer = x[:, [BOTTOM_OUTER]] + fraction * (x[:, [TOP_OUTER]] - x[:, [BOTTOM_OUTER]])
+    y0, y1 = edges[None, :-1, None], edges[None, 1:, None]
+    area = _disc_strip_area(outer[:, None, :], y0, y1) - _disc_strip_area(inner[:, None, :], y0, y1)
+    volume = (area * weights).sum(axis=-1) * (thickness / 2)[:, None]
+
+    radius = outer_max[:, None]
+    low = np.maximum(edges[None, :-1], -radius)
+    high = np.minimum(edges[None, 1:], radius)
+    width = np.maximum(high - low, 0.0)
+    near = np.where((low < 0) & (high > 0), 0.0, np.minimum(np.abs(low), np.abs(high)))
+    far = np.maximum(np.abs(low), np.abs(high))
+    reach = np.sqrt(np.maximum(radius ** 2 - near ** 2, 0.0))
+    hole = inner_min[:, None]
+    split = (hole > 0) & (low >= -hole) & (high <= hole)
+    pieces = np.where(split, 2, 1)
+    pieces = np.where((width > 0) & (volume >= MIN_VOLUME * pieces), pieces, 0)
+    length = np.where(split, reach - np.sqrt(np.maximum(hole ** 2 - far ** 2, 0.0)), 2 * reach)
+    empty = pieces == 0
+    return {
+        "pieces": pieces,
+        "y0": np.where(empty, np.nan, low),
+        "y1": np.where(empty, np.nan, high),
+        "length": np.where(empty, 0.0, length),
+        "width": np.where(empty, 0.0, width),
+        "thickness": np.broadcast_to(thickness[:, None], pieces.shape),
+        "z": np.broadcast_to(z_bottom[:, None], pieces.shape),
+        "volume": np.where(empty, 0.0, volume),
+    }
+
+
+def format_plan(cuts):
+    """Return a cut list: one line per ring with its pieces and wood volume."""
+    lines = []
+    for ring in range(cuts["pieces"].shape[0]):
+        strips = np.nonzero(cuts["pieces"][ring])[0]
+        pieces = int(cuts["pieces"][ring].sum())
+        longest = cuts["length"][ring].max() if len(strips) else 0.0
+        lines.append(
+            f"Ring {ring}: {pieces} pieces from {len(strips)} strips, "
+            f"longest {longest:.1f} mm, thickness {cuts['thickness'][ring, 0]:.1f} mm, "
+            f"{cuts['volume'][ring].sum() / 1000:.0f} cm^3\n"
+        )
+    return "".join(lines)
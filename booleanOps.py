@@ -0,0 +1,105 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Boolean scheduling: combine many solids without a long dependency chain.
+
+Intersecting N solids one after the other makes a chain N features deep,
+and changing the first input recomputes all of them in turn.  ``common_tree``
+groups the inputs into a balanced tree of ``Part::MultiCommon`` features
+instead.  Each feature keeps its result, so a change to one input only
+recomputes the features on its path to the root, about log N of them.  With
+``fanout`` at least the number of inputs it makes a single multi-argument
+common.
+
+``common_shapes`` does the same for shapes in memory.  Given a key per input
+it caches every intermediate result under the keys of its inputs.
+"""
+from BOPTools import BOPFeatures
+
+FANOUT = 2
+
+
+def balanced_groups(items, fanout=FANOUT):
+    """Split ``items`` into ceil(len / fanout) groups whose sizes differ by at most one."""
+    count = -(-len(items) // fanout)
+    size, extra = divmod(len(items), count)
+    groups, start = [], 0
+    for k in range(count):
+        end = start + size + (1 if k < extra else 0)
+        groups.append(items[start:end])
+        start = end
+    return groups
+
+
+def common_tree(doc, objects, fanout=FANOUT, label="Common"):
+    """Intersect ``objects`` with a balanced tree of ``Part::MultiCommon`` features.
+
+    Returns the root feature (labelled ``label``), or the only object if
+    there is one.
+    """
+    if not objects:
+        raise ValueError("common_tree needs at least one object.")
+    fanout = max(int(fanout), 2)
+    bp = BOPFeatures.BOPFeatures(doc)
+    level = list(objects)
+    depth = 0
+    while len(level) > 1:
+        depth += 1
+        level = [
+            group[0] if len(group) == 1 else bp.make_multi_common([obj.Name for obj in group])
+            for group in balanced_groups(level, fanout)
+        ]
+    root = level[0]
+    if depth:
+        root.Label = label
+    return root
+
+
+def common_shapes(shapes, keys=None, cache=None, fanout=FANOUT, visited=None):
+    """Intersect ``shapes`` in a balanced tree and return the result.
+
+    ``keys`` holds one hashable key per shape.  When it and the ``cache``
+    dict are given, each intermediate result is stored under the tuple of
+    its input keys and reused by later calls.  The keys used are added to
+    the ``visited`` set, so the caller can drop stale entries.
+    """
+    if not shapes:
+        raise ValueError("common_shapes needs at least one shape.")
+    fanout = max(int(fanout), 2)
+    if keys is None:
+        keys = [None] * len(shapes)
+    level = list(zip(keys, shapes))
+    while len(level) > 1:
+        merged = []
+        for group in balanced_groups(level, fanout):
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            group_keys = [key for key, _ in group]
+            key = None if None in group_keys else tuple(group_keys)
+            shape = cache.get(key) if cache is not None and key is not None else None
+            if shape is None:
+                first, rest = group[0][1], [shape for _, shape in group[1:]]
+                shape = first.common(rest)
+                if cache is not None and key is not None:
+                    cache[key] = shape
+            if visited is not None and key is not None:
+                visited.add(key)
+            merged.append((key, shape))
+        level = merged
+    return level[0][1]
@@ -0,0 +1,238 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Bowl solid shapes built from the profile points, without document objects.
+
+Profile points are (radius, height) pairs from ``BowlProfileSketch``.  The
+profile curve lies in the XZ plane and is revolved about the Z axis, the
+same frame the segments are built in.  The wall is made by offsetting the
+profile in 2D (see profileOffset) and revolving the section once, instead
+of a 3D ``makeThickness``.
+
+Shapes are built in that frame.  ``profile_placement`` gives the placement
+that carries it onto the sketch, so a moved or turned sketch puts the bowl
+where the sketch is.
+"""
+import FreeCAD as App
+import Part
+
+import profileOffset
+
+Z_AXIS = App.Vector(0, 0, 1)
+SAMPLES = 400
+CORNER_ANGLE = 0.5
+APPROXIMATION_TOLERANCE = 1e-2
+# Orientation of a sketch in the XZ plane, the frame the profile is built in
+PROFILE_ROTATION = App.Rotation(App.Vector(1, 0, 0), 90)
+
+
+def profile_placement(sketch):
+    """Return the placement carrying the XZ profile frame onto ``sketch``."""
+    placement = sketch.getGlobalPlacement() if hasattr(sketch, "getGlobalPlacement") else sketch.Placement
+    return placement.multiply(App.Placement(App.Vector(0, 0, 0), PROFILE_ROTATION).inverse())
+
+
+def profile_curve(points, placement=None):
+    """Return the BSpline edge with the profile points as poles.
+
+    The poles are in the XZ plane, or moved by ``placement`` (see
+    ``profile_placement``) if given.
+    """
+    poles = [App.Vector(x, 0, y) for x, y in points]
+    if placement is not None:
+        poles = [placement.multVec(pole) for pole in poles]
+    curve = Part.BSplineCurve()
+    curve.buildFromPoles(poles)
+    return curve.toShape()
+
+
+def revolved_solid(points):
+    """Revolve the profile, closed to the axis at both ends, into a solid."""
+    edge = profile_curve(points)
+    start, end = edge.Vertexes[0].Point, edge.Vertexes[-1].Point
+    edges = [
+        edge,
+        Part.makeLine(start, App.Vector(0, start.y, start.z)),
+        Part.makeLine(end, App.Vector(0, end.y, end.z)),
+    ]
+    faces = Part.Compound(edges).revolve(App.Vector(0, 0, 0), Z_AXIS, 360).Faces
+    return Part.Solid(Part.Shell(faces))
+
+
+def open_face(solid):
+    """Return the flat face closing the rim of the bowl.
+
+    That is the horizontal planar face with the highest centre, found by
+    geometry instead of by face number.
+    """
+    best = None
+    for face in solid.Faces:
+        if face.Surface.TypeId != 'Part::GeomPlane':
+            continue
+        if abs(abs(face.normalAt(0, 0).z) - 1) > 1e-6:
+            continue
+        if best is None or face.CenterOfMass.z > best.CenterOfMass.z:
+            best = face
+    return best
+
+
+def outer_samples(edge, count=None):
+    """Sample a profile edge in the XZ plane as (radius, height) pairs from bottom to rim."""
+    count = count or SAMPLES
+    samples = [(point.x, point.z) for point in edge.discretize(count)]
+    if samples[0][1] > samples[-1][1]:
+        samples.reverse()
+    return samples
+
+
+def _polyline_edges(points):
+    """Turn an (m, 2) XZ polyline into edges, splitting it at sharp corners.
+
+    Smooth runs become one approximated BSpline each so the revolved wall
+    has a handful of faces instead of one per sample.
+    """
+    vectors = [App.Vector(x, 0, z) for x, z in points]
+    runs = [[vectors[0]]]
+    for k in range(1, len(vectors)):
+        runs[-1].append(vectors[k])
+        if 0 < k < len(vectors) - 1:
+            before = vectors[k] - vectors[k - 1]
+            after = vectors[k + 1] - vectors[k]
+            if before.getAngle(after) > CORNER_ANGLE:
+                runs.append([vectors[k]])
+    edges = []
+    for run in runs:
+        if len(run) == 2:
+            edges.append(Part.makeLine(run[0], run[1]))
+        else:
+            curve = Part.BSplineCurve()
+            curve.approximate(Points=run, DegMax=3, Tolerance=APPROXIMATION_TOLERANCE)
+            edges.append(curve.toShape())
+    return edges
+
+
+def wall_solid(outer_edge, wall_thickness, count=None):
+    """Revolve the wall between ``outer_edge`` and its 2D inward offset into a solid.
+
+    ``outer_edge`` is the outside of the bowl in the XZ plane.  The section
+    is closed along the bottom, the rim and the axis and revolved once.
+    """
+    samples = outer_samples(outer_edge, count)
+    inner = profileOffset.inner_profile(samples, wall_thickness)
+    (x0, z0), (xn, zn) = samples[0], samples[-1]
+    inner_start = App.Vector(0, 0, inner[0][1])
+    inner_end = App.Vector(inner[-1][0], 0, zn)
+    edges = [outer_edge, Part.makeLine(App.Vector(xn, 0, zn), inner_end)]
+    edges += _polyline_edges(inner[::-1])
+    edges.append(Part.makeLine(inner_start, App.Vector(0, 0, z0)))
+    if x0 > profileOffset.EPSILON:
+        edges.append(Part.makeLine(App.Vector(0, 0, z0), App.Vector(x0, 0, z0)))
+    section = Part.Face(Part.Wire(Part.__sortEdges__(edges)))
+    shape = section.revolve(App.Vector(0, 0, 0), Z_AXIS, 360)
+    return shape.Solids[0] if shape.Solids else Part.Solid(Part.Shell(shape.Faces))
+
+
+def bowl_solid_shape(points, wall_thickness, tolerance=1e-3, curve=None, placement=None):
+    """Return the bowl solid: the revolved profile hollowed by ``wall_thickness``.
+
+    ``curve`` is the XZ profile edge if the caller already has it and
+    ``placement`` moves the result onto the sketch (see
+    ``profile_placement``).  The wall comes from the 2D profile offset; if
+    that section cannot be built, fall back to ``makeThickness`` on the
+    revolved solid.
+    """
+    try:
+        solid = wall_solid(curve or profile_curve(points), wall_thickness)
+    except Exception as e:
+        App.Console.PrintWarning(f"2D wall offset failed ({e}), falling back to makeThickness\n")
+        revolved = revolved_solid(points)
+        rim = open_face(revolved)
+        if rim is None:
+            raise ValueError("The revolved profile has no flat rim face to open.")
+        solid = revolved.makeThickness([rim], -wall_thickness, tolerance)
+    if placement is not None:
+        solid.transformShape(placement.toMatrix())
+    return solid
+
+
+def _document_chain_solid(doc, points, wall_thickness):
+    """Build the bowl solid the way AddSegments used to, through document features."""
+    edge = profile_curve(points)
+    start, end = edge.Vertexes[0].Point, edge.Vertexes[-1].Point
+    curve = doc.addObject("Part::Feature", "BSpline")
+    curve.Shape = edge
+    line1 = doc.addObject("Part::Feature", "Line1")
+    line1.Shape = Part.makeLine(start, App.Vector(0, start.y, start.z))
+    line2 = doc.addObject("Part::Feature", "Line2")
+    line2.Shape = Part.makeLine(end, App.Vector(0, end.y, end.z))
+    compound = doc.addObject("Part::Compound", "Compound")
+    compound.Links = [curve, line1, line2]
+    revolve = doc.addObject("Part::Revolution", "Revolve")
+    revolve.Source = compound
+    revolve.Axis = Z_AXIS
+    revolve.Angle = 360.0
+    doc.recompute()
+    solid = doc.addObject("Part::Feature", "Revolve_solid")
+    solid.Shape = Part.Solid(Part.Shell(revolve.Shape.Faces))
+    doc.recompute()
+    thickness = doc.addObject("Part::Thickness", "BowlSolid")
+    rim = open_face(solid.Shape)
+    face_number = next(i for i, face in enumerate(solid.Shape.Faces, start=1) if face.isSame(rim))
+    face_name = f"Face{face_number}"
+    thickness.Faces = (solid, [face_name])
+    thickness.Value = -wall_thickness
+    doc.recompute()
+    return thickness.Shape
+
+
+def benchmark(point_counts=(10, 50, 200), wall_thickness=10.0):
+    """Time the document-feature chain against ``bowl_solid_shape``.
+
+    Each build runs in a throw-away document inside a transaction so the
+    undo/redo memory can be compared too.  Meant to be run from the FreeCAD
+    Python console.
+    """
+    import math
+    import time
+    results = []
+    for count in point_counts:
+        points = [(60 + 40 * math.sin(math.pi * i / count), 150.0 * i / count) for i in range(count + 1)]
+        timings = {}
+        for mode in ("document", "memory"):
+            doc = App.newDocument("BowlSolidBenchmark")
+            doc.UndoMode = 1
+            try:
+                doc.openTransaction("Bowl Solid")
+                start = time.perf_counter()
+                if mode == "document":
+                    _document_chain_solid(doc, points, wall_thickness)
+                else:
+                    doc.addObject("Part::Feature", "BowlSolid").Shape = bowl_solid_shape(points, wall_thickness)
+                    doc.recompute()
+                seconds = time.perf_counter() - start
+                doc.commitTransaction()
+                timings[mode] = (seconds, doc.UndoRedoMemSize)
+            finally:
+                App.closeDocument(doc.Name)
+        results.append((count, timings))
+        App.Console.PrintMessage(
+            f"{count:4d} points: document chain {timings['document'][0] * 1000:.0f} ms "
+            f"(undo {timings['document'][1] / 1024:.0f} KiB), in memory {timings['memory'][0] * 1000:.0f} ms "
+            f"(undo {timings['memory'][1] / 1024:.0f} KiB)\n"
+        )
+    return results
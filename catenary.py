@@ -0,0 +1,129 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Catenary profile sampling and sag solving.
+
+It provides the points and sag for the Catenary Curve command.  The curve is
+``y = y_start + sag * (cosh(x / sag) - 1)`` for x from x_start to x_end,
+where ``sag`` is the catenary parameter entered in the Catenary Curve panel.
+
+* ``sample`` starts from ``num_points`` equal intervals and splits every
+  interval whose chord is further than ``tolerance`` from the curve, all
+  intervals at once, until the polyline is within tolerance.  Points end up
+  where the curve bends most.
+* ``solve_sag`` finds the sag that gives a requested height between x_start
+  and x_end by safeguarded Newton iteration.  It accepts arrays, so a sweep
+  of vessel sizes is solved in one call.
+"""
+import numpy as np
+
+TOLERANCE = 0.05
+MAX_POINTS = 10000
+MAX_ITERATIONS = 60
+MAX_ARGUMENT = 700.0
+
+
+def catenary_y(x, sag, y_start=0.0):
+    """Return the catenary height at ``x`` (broadcasting)."""
+    return y_start + sag * (np.cosh(np.asarray(x, dtype=float) / sag) - 1)
+
+
+def chord_deviation(x0, x1, sag):
+    """Return the distance from the chord x0-x1 to the curve at the middle of each interval."""
+    y0, y1 = catenary_y(x0, sag), catenary_y(x1, sag)
+    middle = (x0 + x1) / 2
+    gap = (y0 + y1) / 2 - catenary_y(middle, sag)
+    return np.abs(gap) * np.abs(x1 - x0) / np.hypot(x1 - x0, y1 - y0)
+
+
+def sample(sag, x_start, x_end, y_start=0.0, num_points=50, tolerance=TOLERANCE, max_points=MAX_POINTS):
+    """Return (x, y) arrays of points along the catenary.
+
+    There are at least ``num_points`` intervals; with a positive
+    ``tolerance`` intervals are halved until every chord is within it, up to
+    ``max_points`` points.  The sag must be positive, since a negative one
+    turns the curve downwards.
+    """
+    if sag <= 0:
+        raise ValueError("The sag must be positive.")
+    x = np.linspace(x_start, x_end, max(int(num_points), 1) + 1)
+    while tolerance > 0 and len(x) < max_points:
+        coarse = np.nonzero(chord_deviation(x[:-1], x[1:], sag) > tolerance)[0]
+        if len(coarse) == 0:
+            break
+        coarse = coarse[: max_points - len(x)]
+        x = np.insert(x, coarse + 1, (x[coarse] + x[coarse + 1]) / 2)
+    return x, catenary_y(x, sag, y_start)
+
+
+def _rise(t, x_start, x_end):
+    """Return the height from x_start to x_end with 1 / sag = t, and its derivative in t."""
+    a, b = np.minimum(t * x_start, MAX_ARGUMENT), np.minimum(t * x_end, MAX_ARGUMENT)
+    rise = (np.cosh(b) - np.cosh(a)) / t
+    slope = (x_end * np.sinh(b) - x_start * np.sinh(a)) / t - rise / t
+    return rise, slope
+
+
+def _estimate(height, x_start, x_end, high):
+    """Return a starting t: the small-sag root, capped by the large-sag one.
+
+    For large t the rise is about exp(t * x_end) / (2 t), so t is a fixed
+    point of ln(2 * height * t) / x_end; a few iterations get close.
+    """
+    t = np.minimum(high, 1 / x_end)
+    for _ in range(8):
+        t = np.minimum(high, np.log1p(2 * height * t) / x_end)
+    return np.maximum(t, high * 1e-3)
+
+
+def solve_sag(height, x_start, x_end, tolerance=1e-9):
+    """Return the sag giving ``height`` between x_start and x_end (broadcasting).
+
+    The rise is solved in t = 1 / sag: it grows with t, and is at least
+    ``t * (x_end^2 - x_start^2) / 2``, which brackets the root.  Newton steps
+    on the logarithm of the rise start from ``_estimate``; steps that leave
+    the bracket are replaced by bisection in log t.  ValueError is raised
+    if any sag has not converged after ``MAX_ITERATIONS``.
+    """
+    height, x_start, x_end = np.broadcast_arrays(
+        np.asarray(height, dtype=float), np.abs(np.asarray(x_start, dtype=float)), np.abs(np.asarray(x_end, dtype=float))
+    )
+    spread = x_end ** 2 - x_start ** 2
+    if np.any(height <= 0) or np.any(spread <= 0):
+        raise ValueError("The height and the distance between x_start and x_end must be positive.")
+    low = np.zeros_like(height)
+    high = 2 * height / spread
+    t = _estimate(height, x_start, x_end, high)
+    done = np.zeros(height.shape, dtype=bool)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for _ in range(MAX_ITERATIONS):
+            rise, slope = _rise(t, x_start, x_end)
+            error = np.log(rise) - np.log(height)
+            high = np.where(error > 0, t, high)
+            low = np.where(error > 0, low, t)
+            step = t - error * rise / slope
+            middle = np.where(low > 0, np.sqrt(low * high), high / 2)
+            t_next = np.where((step > low) & (step < high) & np.isfinite(step), step, middle)
+            done = (np.abs(t_next - t) <= tolerance * t) & (np.abs(error) <= 1e-6)
+            t = t_next
+            if np.all(done):
+                break
+    if not np.all(done):
+        raise ValueError("The sag did not converge; check the height and the X range.")
+    sag = 1 / t
+    return sag if sag.ndim else float(sag)
@@ -0,0 +1,101 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""Color helpers that work for both shape features and link elements.
+
+``apply_colors`` recolors many objects in one go.  It takes an
+{object: color} mapping and never goes through the selection.  All changes
+are made while the main window is frozen, so the view repaints once.
+``apply_grid_colors`` does the same for a colorPatterns assignment array
+over the ring grid.
+"""
+from docOps import batch_update
+
+
+def set_shape_color(obj, color):
+    """Set the display color of ``obj`` to an (r, g, b, a) tuple in 0-1.
+
+    Shape features use ``ShapeColor``; link ring elements have no
+    ``ShapeColor`` and get an overriding material instead.
+    """
+    view = getattr(obj, "ViewObject", None)
+    if view is None:
+        return False
+    if hasattr(view, "ShapeColor"):
+        view.ShapeColor = color
+        return True
+    if hasattr(view, "ShapeMaterial"):
+        material = view.ShapeMaterial
+        material.DiffuseColor = color
+        view.ShapeMaterial = material
+        view.OverrideMaterial = True
+        return True
+    return False
+
+
+def get_shape_color(obj):
+    """Return the display color of ``obj`` as an (r, g, b, a) tuple, or None."""
+    view = getattr(obj, "ViewObject", None)
+    if view is None:
+        return None
+    if hasattr(view, "ShapeColor"):
+        return tuple(view.ShapeColor)
+    if hasattr(view, "ShapeMaterial"):
+        return tuple(view.ShapeMaterial.DiffuseColor)
+    return None
+
+
+def rgba(color):
+    """Return ``color`` as a float (r, g, b, a) tuple; a missing alpha is 1."""
+    color = tuple(float(c) for c in color)
+    return color if len(color) == 4 else color[:3] + (1.0,)
+
+
+def apply_colors(doc, colors, name="Apply Colors"):
+    """Set the display color of many objects in one batch.
+
+    ``colors`` is an {object: color} mapping or an iterable of
+    (object, color) pairs, colors being (r, g, b) or (r, g, b, a) in 0-1.
+    Objects that already have their color are left alone.  Returns the
+    number of objects whose color changed.
+    """
+    items = colors.items() if hasattr(colors, "items") else colors
+    changed = 0
+    with batch_update(doc, name, recompute=False):
+        for obj, color in items:
+            color = rgba(color)
+            current = get_shape_color(obj)
+            if current is not None and rgba(current) == color:
+                continue
+            if set_shape_color(obj, color):
+                changed += 1
+    return changed
+
+
+def apply_grid_colors(doc, objects, assignment, palette, name="Apply Pattern"):
+    """Color a grid of ring objects from an assignment array in one batch.
+
+    ``objects`` is the (R, S) list of lists from ``LabelIndex.grid`` and
+    ``assignment`` an (R, S) array of indices into ``palette``; cells with
+    a negative index or no object are left alone.
+    """
+    colors = {}
+    for row, indices in zip(objects, assignment.tolist()):
+        for obj, index in zip(row, indices):
+            if obj is not None and index >= 0:
+                colors[obj] = palette[index]
+    return apply_colors(doc, colors, name)
@@ -0,0 +1,143 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Color patterns over the ring and segment grid.
+
+It turns a pattern name into a color per segment.  A vessel's ring objects
+form an (R, S) grid: row r is the r-th ring from the bottom and column s
+the s-th segment, both counted from 0 (``Ring_001_001`` is [0, 0]).  A
+pattern is a function of the grid shape, the number of colors in the
+palette and its own keyword parameters.  It returns an int (R, S)
+assignment array holding a palette index per cell, or ``LEAVE`` (-1) for
+cells that keep their color.
+
+``PATTERNS`` maps the pattern names shown in Apply Colors to
+(function, default parameters).
+"""
+import numpy as np
+
+LEAVE = -1
+
+
+def _grid(shape):
+    rings, segments = np.indices(shape)
+    return rings, segments
+
+
+def solid(shape, colors, color=0):
+    """Every cell gets ``color``."""
+    return np.full(shape, color % colors, dtype=int)
+
+
+def every_x(shape, colors, step=2, offset=0, color=0):
+    """Every ``step``-th segment of each ring, starting at ``offset``, gets ``color``."""
+    _, s = _grid(shape)
+    return np.where((s - offset) % max(step, 1) == 0, color % colors, LEAVE)
+
+
+def columns(shape, colors, width=1):
+    """Vertical stripes ``width`` segments wide cycling through the palette."""
+    _, s = _grid(shape)
+    return (s // max(width, 1)) % colors
+
+
+def bands(shape, colors, height=1):
+    """Horizontal bands ``height`` rings high cycling through the palette."""
+    r, _ = _grid(shape)
+    return (r // max(height, 1)) % colors
+
+
+def checkerboard(shape, colors, width=1, height=1):
+    """Blocks of ``width`` segments by ``height`` rings, alternating."""
+    r, s = _grid(shape)
+    return (r // max(height, 1) + s // max(width, 1)) % colors
+
+
+def spiral(shape, colors, width=1, twist=1):
+    """Stripes that move ``twist`` segments round per ring."""
+    r, s = _grid(shape)
+    return (((s - twist * r) % shape[1]) // max(width, 1)) % colors
+
+
+def chevron(shape, colors, repeats=4, height=1):
+    """``repeats`` V shapes round the vessel, stepping a color every ``height`` rings."""
+    r, s = _grid(shape)
+    period = max(shape[1] // max(repeats, 1), 1)
+    return ((r + np.abs(s % period - period // 2)) // max(height, 1)) % colors
+
+
+def diamond(shape, colors, repeats=4, width=1):
+    """Nested diamonds ``repeats`` times round the vessel, each ring of them ``width`` wide."""
+    r, s = _grid(shape)
+    period = max(shape[1] // max(repeats, 1), 1)
+    distance = np.abs(r % period - period // 2) + np.abs(s % period - period // 2)
+    return (distance // max(width, 1)) % colors
+
+
+def feature_band(shape, colors, start=0, height=1, color=0):
+    """Rings ``start`` to ``start + height - 1`` get ``color``."""
+    r, _ = _grid(shape)
+    return np.where((r >= start) & (r < start + height), color % colors, LEAVE)
+
+
+PATTERNS = {
+    "Solid": (solid, {"color": 0}),
+    "Every X": (every_x, {"step": 2, "offset": 0, "color": 0}),
+    "Columns": (columns, {"width": 1}),
+    "Bands": (bands, {"height": 1}),
+    "Checkerboard": (checkerboard, {"width": 1, "height": 1}),
+    "Spiral": (spiral, {"width": 1, "twist": 1}),
+    "Chevron": (chevron, {"repeats": 4, "height": 1}),
+    "Diamond": (diamond, {"repeats": 4, "width": 1}),
+    "Feature Band": (feature_band, {"start": 0, "height": 1, "color": 0}),
+}
+
+
+def evaluate(name, shape, colors, **parameters):
+    """Return the assignment array of the named pattern.
+
+    Parameters that are not given take the pattern's defaults; unknown ones
+    raise ValueError.
+    """
+    if name not in PATTERNS:
+        raise ValueError(f"Unknown pattern {name!r}.")
+    if colors < 1:
+        raise ValueError("A pattern needs at least one color.")
+    function, defaults = PATTERNS[name]
+    unknown = set(parameters) - set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown parameters for {name}: {', '.join(sorted(unknown))}.")
+    return function(tuple(shape), colors, **{**defaults, **parameters})
+
+
+def parse_parameters(text):
+    """Parse ``"step=3, offset=1"`` into {"step": 3, "offset": 1}."""
+    parameters = {}
+    for item in text.replace(";", ",").split(","):
+        if not item.strip():
+            continue
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Expected name=value, got {item.strip()!r}.")
+        parameters[key.strip()] = int(value)
+    return parameters
+
+
+def format_parameters(parameters):
+    """Inverse of ``parse_parameters``."""
+    return ", ".join(f"{key}={value}" for key, value in parameters.items())
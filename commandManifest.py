@@ -0,0 +1,127 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Static manifest of the workbench commands and a lazy command proxy.
+
+The workbench registers a ``LazyCommand`` per manifest entry, so toolbar and
+menu entries are built without importing the command modules (and with them
+Part, Draft and BOPTools).  The real command is imported on first use.
+Keep the resources here in step with each command's ``GetResources``.
+"""
+import importlib
+import time
+from pathlib import Path
+
+import FreeCAD as App
+
+# (command name, module, class, icon, menu text, tool tip), in toolbar order
+COMMANDS = [
+    ("AddVessel", "AddVessel", "AddVessel", "AddVase.svg",
+     "Add Vessel Profile", "Add a Vase/Bowl profile to the document from an SVG file"),
+    ("BowlConstructionLines", "BowlConstructionLines", "BowlConstructionLines", "BowlConstructionLines.svg",
+     "Add Profile Points", "Add profile points"),
+    ("AddSegments", "AddSegments", "AddSegments", "AddSegments.svg",
+     "Add Segments", "Add a segments to the document"),
+    ("RotateRings", "RotateRings", "RotateRings", "RotateRings.svg",
+     "Rotate Rings", "Rotate Rings Command"),
+    ("ApplyColors", "ApplyColors", "ApplyColors", "ApplyColors.svg",
+     "Apply Colors", "Apply colors to selected objects in the document"),
+    ("SegmentSpreadsheet", "SegmentSpreadsheet", "SegmentSpreadsheet", "SegmentSpreadsheet.svg",
+     "Make Segment Dimension Spreadsheet", "Create a spreadsheet listing segment dimensions"),
+    ("TopView", "TopView", "TopView", "TopView.svg",
+     "Top View", "Top View Command"),
+    ("CatenaryCurve", "CatenaryCurve", "CatenaryCurve", "CatenaryCurve.svg",
+     "Catenary Curve", "Catenary Curve Command"),
+    ("BowlFromABoard", "BowlFromABoard", "BowlFromABoard", "BowlFromABoard.svg",
+     "Bowl From A Board", "Bowl From A Board Command"),
+    ("AddTorus", "AddTorus", "AddTorus", "AddTorus.svg",
+     "AddTorus", "AddTorus Command"),
+    ("WedgeGenerator", "WedgeGenerator", "WedgeGenerator", "WedgeGenerator.svg",
+     "Wedgie Generator", "Wedgie Generator Command"),
+    ("OffcenterTurning", "OffcenterTurning", "OffcenterTurning", "OffcenterTurning.svg",
+     "Offcenter Turning", "Offcenter Turning Command"),
+    ("About", "About", "About", "About.svg",
+     "About Woodturning Workbench", "About the Woodturning Workbench and its creator"),
+]
+
+
+def icon_path(icon):
+    return str(Path(App.getUserAppDataDir()) / "Mod" / "WoodturningWorkbench" / "icons" / icon)
+
+
+class LazyCommand:
+    """Stands in for a command until it is first activated."""
+
+    def __init__(self, module_name, class_name, icon, menu_text, tool_tip):
+        self.module_name = module_name
+        self.class_name = class_name
+        self.resources = {
+            'Pixmap': icon_path(icon),
+            'MenuText': menu_text,
+            'ToolTip': tool_tip,
+        }
+        self._command = None
+
+    def command(self):
+        """Import the command module and return the real command."""
+        if self._command is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self.module_name)
+            self._command = getattr(module, self.class_name)()
+            App.Console.PrintLog(
+                f"Loaded {self.module_name} in {(time.perf_counter() - start) * 1000:.0f} ms\n"
+            )
+        return self._command
+
+    def GetResources(self):
+        return self.resources
+
+    def IsActive(self):
+        if self._command is not None:
+            return self._command.IsActive()
+        # Every command works on the active document.
+        return App.ActiveDocument is not None
+
+    def Activated(self):
+        self.command().Activated()
+
+
+def lazy_commands():
+    """Return {command name: LazyCommand} in toolbar order."""
+    return {
+        name: LazyCommand(module_name, class_name, icon, menu_text, tool_tip)
+        for name, module_name, class_name, icon, menu_text, tool_tip in COMMANDS
+    }
+
+
+def benchmark():
+    """Time importing every command module that is not loaded yet.
+
+    Run it in a fresh FreeCAD session right after activating the workbench
+    to see what eager loading used to add to activation.
+    """
+    import sys
+    start = time.perf_counter()
+    loaded = 0
+    for _, module_name, class_name, *_ in COMMANDS:
+        if module_name not in sys.modules:
+            getattr(importlib.import_module(module_name), class_name)
+            loaded += 1
+    seconds = time.perf_counter() - start
+    App.Console.PrintMessage(f"Importing {loaded} command modules took {seconds * 1000:.0f} ms\n")
+    return seconds
@@ -0,0 +1,49 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""Helpers for grouping many document edits into a single update."""
+from contextlib import contextmanager
+
+import FreeCAD as App
+
+
+@contextmanager
+def batch_update(doc, name, recompute=True):
+    """Run the enclosed edits as one undo step with the main window frozen.
+
+    The document is recomputed once at the end instead of after every
+    object that is added or changed.  If the block raises, the transaction
+    is aborted and the exception is re-raised.
+    """
+    main_window = None
+    if App.GuiUp:
+        import FreeCADGui as Gui
+        main_window = Gui.getMainWindow()
+        main_window.setUpdatesEnabled(False)
+    doc.openTransaction(name)
+    try:
+        yield doc
+        if recompute:
+            doc.recompute()
+    except Exception:
+        doc.abortTransaction()
+        raise
+    else:
+        doc.commitTransaction()
+    finally:
+        if main_window is not None:
+            main_window.setUpdatesEnabled(True)
@@ -0,0 +1,199 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+In-memory boolean engine for intersecting segments with a vessel solid.
+
+The booleans run on ``Part`` shapes instead of document features, so no
+clones or Common features are created.  Only the final solids are written
+to the document.
+
+Each segment's boolean is independent, so ``intersect_shapes_parallel`` can
+also fan them out to a process pool.  Shapes cross the process boundary as
+BREP strings and every worker loads the tool shape once.
+"""
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+import FreeCAD as App
+import Part
+
+from docOps import batch_update
+from shapeCache import get_cache
+
+
+def to_solid(shape):
+    """Return ``shape`` as a single solid, or None if it is empty."""
+    if shape.isNull() or not shape.Faces:
+        return None
+    if len(shape.Solids) == 1:
+        return shape.Solids[0]
+    return Part.Solid(Part.Shell(shape.Faces))
+
+
+def intersect_shapes(tool_shape, shapes):
+    """Intersect every shape with ``tool_shape``.
+
+    Returns a list of (solid, seconds) pairs in the order of ``shapes``;
+    solid is None when a shape does not overlap the tool.
+    """
+    results = []
+    for shape in shapes:
+        start = time.perf_counter()
+        solid = to_solid(shape.common(tool_shape))
+        results.append((solid, time.perf_counter() - start))
+    return results
+
+
+_worker_tool_shape = None
+
+
+def _init_worker(tool_brep):
+    """Process pool initializer: load the tool shape once per worker."""
+    global _worker_tool_shape
+    _worker_tool_shape = Part.Shape()
+    _worker_tool_shape.importBrepFromString(tool_brep)
+
+
+def _common_worker(shape_brep):
+    """Intersect one BREP-encoded shape with the worker's tool shape."""
+    start = time.perf_counter()
+    shape = Part.Shape()
+    shape.importBrepFromString(shape_brep)
+    solid = to_solid(shape.common(_worker_tool_shape))
+    brep = solid.exportBrepToString() if solid is not None else None
+    return brep, time.perf_counter() - start
+
+
+def worker_executable():
+    """Return a Python interpreter that can import FreeCAD, or None.
+
+    Inside the GUI ``sys.executable`` is the FreeCAD binary, which cannot
+    host multiprocessing workers, so look for the interpreter shipped next
+    to it.
+    """
+    current = Path(sys.executable)
+    if current.name.lower().startswith("python"):
+        return str(current)
+    bin_dir = Path(App.getHomePath()) / "bin"
+    for name in ("python.exe", "python3", "python"):
+        candidate = bin_dir / name
+        if candidate.exists():
+            return str(candidate)
+    return None
+
+
+def intersect_shapes_parallel(tool_shape, shapes, processes=None):
+    """Like ``intersect_shapes`` but spread over a process pool.
+
+    Falls back to ``intersect_shapes`` when no worker interpreter can be
+    found or there is only one shape.
+    """
+    if len(shapes) < 2:
+        return intersect_shapes(tool_shape, shapes)
+    executable = worker_executable()
+    if executable is None:
+        App.Console.PrintWarning("No Python interpreter found for worker processes, intersecting in this process\n")
+        return intersect_shapes(tool_shape, shapes)
+    processes = min(processes or os.cpu_count() or 1, len(shapes))
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(executable)
+    with context.Pool(processes, initializer=_init_worker, initargs=(tool_shape.exportBrepToString(),)) as pool:
+        encoded = pool.map(_common_worker, [shape.exportBrepToString() for shape in shapes])
+    results = []
+    for brep, seconds in encoded:
+        solid = None
+        if brep is not None:
+            solid = Part.Shape()
+            solid.importBrepFromString(brep)
+            solid = to_solid(solid)
+        results.append((solid, seconds))
+    return results
+
+
+def add_intersections(doc, solids, prefix="Intersect", sources=()):
+    """Add one ``Part::Feature`` per solid labelled ``<prefix>(Solid)_001``, ...
+
+    ``sources`` are hidden once the results are in place.  Empty results
+    (None) are skipped.  Returns the created objects.
+    """
+    objects = []
+    with batch_update(doc, "Intersect Segments"):
+        for index, solid in enumerate(solids):
+            if solid is None:
+                continue
+            obj = doc.addObject("Part::Feature", "Common013_solid")
+            obj.Label = f"{prefix}(Solid)_{index + 1:03d}"
+            obj.Shape = solid
+            objects.append(obj)
+        for source in sources:
+            source.Visibility = False
+    return objects
+
+
+def report_timings(labels, results, wall_time):
+    """Print the per-segment boolean times and the overall wall time to the report view."""
+    total = 0.0
+    for label, (solid, seconds) in zip(labels, results):
+        total += seconds
+        status = "" if solid is not None else " (no overlap, skipped)"
+        App.Console.PrintMessage(f"  {label}: {seconds * 1000:.1f} ms{status}\n")
+    App.Console.PrintMessage(
+        f"Intersected {len(results)} segments: {total * 1000:.1f} ms boolean time, {wall_time * 1000:.1f} ms wall time\n"
+    )
+
+
+def intersect_segments(doc, tool_obj, segment_objs, prefix="Intersect", parallel=False, keys=None):
+    """Intersect each segment object with ``tool_obj`` and add the resulting solids.
+
+    The tool shape is read once and reused for every boolean.  With
+    ``parallel`` the booleans run in a process pool.  ``keys`` are optional
+    shape cache keys, one per segment (see ``shapeCache.make_key``); cached
+    results are reused and new ones stored.  Returns the created objects.
+    """
+    if "Touched" in tool_obj.State:
+        doc.recompute()
+    start = time.perf_counter()
+    results = [None] * len(segment_objs)
+    cache = get_cache() if keys is not None else None
+    if cache is not None:
+        for i, key in enumerate(keys):
+            cached = cache.get(key)
+            if cached is not None:
+                results[i] = (to_solid(cached), 0.0)
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        tool_shape = tool_obj.Shape.copy()
+        # getShape also resolves App::Link ring elements
+        shapes = [Part.getShape(segment_objs[i]) for i in missing]
+        if parallel:
+            computed = intersect_shapes_parallel(tool_shape, shapes)
+        else:
+            computed = intersect_shapes(tool_shape, shapes)
+        for i, result in zip(missing, computed):
+            results[i] = result
+            if cache is not None:
+                solid = result[0]
+                # An empty compound records "no overlap" so it is not recomputed either.
+                cache.put(keys[i], solid if solid is not None else Part.Compound([]))
+    if cache is not None:
+        App.Console.PrintMessage(f"Shape cache: {len(segment_objs) - len(missing)} of {len(segment_objs)} intersections reused\n")
+    report_timings([obj.Label for obj in segment_objs], results, time.perf_counter() - start)
+    return add_intersections(doc, [solid for solid, _ in results], prefix, segment_objs)
@@ -0,0 +1,255 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Shared index of ring and segment objects by label.
+
+Ring objects are labelled ``Ring_RRR_SSS`` (ring number, segment number)
+and segment blanks ``Segment_NNN`` (parameter row number).  Instead of every command scanning
+``doc.Objects`` and matching substrings, ``get_index(doc)`` returns an index
+that is built once per document and then kept current by a document
+observer, so the queries below cost O(k) in the size of the answer.
+"""
+import re
+
+import FreeCAD as App
+
+RING_LABEL = re.compile(r"^Ring_(\d+)_(\d+)$")
+SEGMENT_LABEL = re.compile(r"^Segment_(\d+)$")
+
+
+def parse_ring_label(label):
+    """Return (ring, segment) for a ``Ring_RRR_SSS`` label, or None."""
+    match = RING_LABEL.match(label)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def parse_segment_label(label):
+    """Return the row number of a ``Segment_NNN`` label, or None."""
+    match = SEGMENT_LABEL.match(label)
+    return int(match.group(1)) if match else None
+
+
+def ring_label(ring, segment):
+    """Return the ``Ring_RRR_SSS`` label for a ring and segment number."""
+    return f"Ring_{ring:03d}_{segment:03d}"
+
+
+class LabelIndex:
+    """Ring/segment lookup tables for one document."""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.rebuild()
+
+    def rebuild(self):
+        """Rebuild the index with one pass over the document."""
+        self._rings = {}
+        self._columns = {}
+        self._segments = {}
+        self._keys = {}
+        for obj in self.doc.Objects:
+            self.add(obj)
+
+    def add(self, obj):
+        """Index ``obj`` under its current label."""
+        label = obj.Label
+        key = parse_ring_label(label)
+        if key is not None:
+            ring, segment = key
+            self._rings.setdefault(ring, {})[segment] = obj.Name
+            self._columns.setdefault(segment, {})[ring] = obj.Name
+            self._keys[obj.Name] = key
+        else:
+            number = parse_segment_label(label)
+            if number is not None:
+                self._segments[obj.Name] = number
+                self._keys[obj.Name] = number
+
+    def remove(self, obj_name):
+        """Drop the object called ``obj_name`` from the index."""
+        key = self._keys.pop(obj_name, None)
+        if isinstance(key, tuple):
+            ring, segment = key
+            if self._rings.get(ring, {}).get(segment) == obj_name:
+                del self._rings[ring][segment]
+                if not self._rings[ring]:
+                    del self._rings[ring]
+            if self._columns.get(segment, {}).get(ring) == obj_name:
+                del self._columns[segment][ring]
+                if not self._columns[segment]:
+                    del self._columns[segment]
+        elif key is not None:
+            self._segments.pop(obj_name, None)
+
+    def update(self, obj):
+        """Re-index ``obj`` after its label changed."""
+        self.remove(obj.Name)
+        self.add(obj)
+
+    def _objects(self, names):
+        objects = []
+        for name in names:
+            obj = self.doc.getObject(name)
+            if obj is not None:
+                objects.append(obj)
+        return objects
+
+    def rings(self):
+        """Return the sorted ring numbers."""
+        return sorted(self._rings)
+
+    def columns(self):
+        """Return the sorted segment (column) numbers."""
+        return sorted(self._columns)
+
+    def get(self, ring, segment):
+        """Return the object at (ring, segment), or None."""
+        name = self._rings.get(ring, {}).get(segment)
+        return self.doc.getObject(name) if name else None
+
+    def ring(self, ring):
+        """Return the objects of one ring ordered by segment number."""
+        members = self._rings.get(ring, {})
+        return self._objects(members[segment] for segment in sorted(members))
+
+    def column(self, segment):
+        """Return the objects in one column ordered by ring number."""
+        members = self._columns.get(segment, {})
+        return self._objects(members[ring] for ring in sorted(members))
+
+    def ring_objects(self):
+        """Return every ``Ring_RRR_SSS`` object ordered by ring, then segment."""
+        return self._objects(
+            self._rings[ring][segment] for ring in sorted(self._rings) for segment in sorted(self._rings[ring])
+        )
+
+    def ring_keys(self):
+        """Return {object name: (ring, segment)} for every ring object."""
+        return {name: key for name, key in self._keys.items() if isinstance(key, tuple)}
+
+    def grid(self):
+        """Return (rings, columns, objects) for the ring objects as a grid.
+
+        ``rings`` and ``columns`` are the sorted ring and segment numbers and
+        ``objects[i][j]`` is the object at (rings[i], columns[j]), or None.
+        """
+        rings, columns = self.rings(), self.columns()
+        objects = [
+            [self.doc.getObject(self._rings[ring][column]) if column in self._rings[ring] else None for column in columns]
+            for ring in rings
+        ]
+        return rings, columns, objects
+
+    def segment_number(self, obj):
+        """Return the row number of an indexed ``Segment_NNN`` object, or None."""
+        return self._segments.get(obj.Name)
+
+    def segments(self):
+        """Return every ``Segment_NNN`` object ordered by row number."""
+        return self._objects(sorted(self._segments, key=self._segments.get))
+
+
+class _IndexObserver:
+    """Document observer that keeps every live LabelIndex current."""
+
+    def __init__(self):
+        self.indexes = {}
+
+    def _index_for(self, obj):
+        doc = getattr(obj, "Document", None)
+        return self.indexes.get(doc.Name) if doc is not None else None
+
+    def slotCreatedObject(self, obj):
+        index = self._index_for(obj)
+        if index is not None:
+            index.add(obj)
+
+    def slotDeletedObject(self, obj):
+        index = self._index_for(obj)
+        if index is not None:
+            index.remove(obj.Name)
+
+    def slotChangedObject(self, obj, prop):
+        if prop == "Label":
+            index = self._index_for(obj)
+            if index is not None:
+                index.update(obj)
+
+    def slotDeletedDocument(self, doc):
+        self.indexes.pop(doc.Name, None)
+
+
+_observer = None
+
+
+def get_index(doc=None):
+    """Return the live LabelIndex for ``doc`` (default: the active document)."""
+    global _observer
+    doc = doc or App.ActiveDocument
+    if _observer is None:
+        _observer = _IndexObserver()
+        App.addDocumentObserver(_observer)
+    index = _observer.indexes.get(doc.Name)
+    if index is None or index.doc != doc:
+        index = LabelIndex(doc)
+        _observer.indexes[doc.Name] = index
+    return index
+
+
+def benchmark(num_rings=50, num_segments=100, repeats=100):
+    """Time ring/column lookups by label scan and through the index.
+
+    Builds a throw-away document with ``num_rings * num_segments`` ring
+    objects (5,000 by default) and prints the average time of a
+    ``doc.Objects`` scan and of an index query.  Meant to be run from the
+    FreeCAD Python console.
+    """
+    import timeit
+    doc = App.newDocument("LabelIndexBenchmark")
+    try:
+        for ring in range(1, num_rings + 1):
+            for segment in range(1, num_segments + 1):
+                doc.addObject("App::FeaturePython", "Ring").Label = ring_label(ring, segment)
+        start = timeit.default_timer()
+        index = get_index(doc)
+        build = timeit.default_timer() - start
+        ring, column = num_rings // 2, num_segments // 2
+        cases = {
+            "ring": (
+                lambda: [obj for obj in doc.Objects if obj.Label.startswith(f"Ring_{ring:03d}_")],
+                lambda: index.ring(ring),
+            ),
+            "column": (
+                lambda: [obj for obj in doc.Objects if obj.Label.startswith("Ring") and obj.Label[-3:] == f"{column:03d}"],
+                lambda: index.column(column),
+            ),
+        }
+        results = {"build": build}
+        App.Console.PrintMessage(f"{len(doc.Objects)} objects, index built in {build * 1000:.1f} ms\n")
+        for name, (scan, lookup) in cases.items():
+            scan_time = timeit.timeit(scan, number=repeats) / repeats
+            lookup_time = timeit.timeit(lookup, number=repeats) / repeats
+            results[name] = (scan_time, lookup_time)
+            App.Console.PrintMessage(
+                f"{name}: scan {scan_time * 1000:.3f} ms, index {lookup_time * 1000:.3f} ms\n"
+            )
+    finally:
+        App.closeDocument(doc.Name)
+    return results
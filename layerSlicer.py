@@ -0,0 +1,187 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Adaptive layer slicing that minimizes the wood in the segment blanks.
+
+It picks the layer heights for Add Adaptive Segments.  The outside of the
+bowl is an (n, 2) array of (radius, height) samples of the profile curve
+and the inside is the matching inner profile (see profileOffset).  Layers are no
+longer tied to the profile points: boundaries are picked from a grid of
+candidate heights so every layer is between ``min_thickness`` and
+``max_thickness`` thick and the total blank volume (segmentKernel.blank_volume)
+is as small as possible.  ``allowance`` is the thickness each layer loses
+to flattening and glue-up; without it thinner layers always win.
+
+The grid is split into cells and the largest outer / smallest inner radius
+of each cell is worked out once.  A layer is a run of cells, so its extremes
+are running max / min over the cells, and the dynamic programme relaxes all
+layers starting at one height in a single vectorized step.
+"""
+import numpy as np
+
+import segmentKernel
+
+RESOLUTION = 1.0
+ALLOWANCE = 0.0
+
+
+def cell_extremes(outer, inner, heights):
+    """Return the largest outer and smallest inner radius between each pair of heights.
+
+    ``outer`` and ``inner`` are (n, 2) (radius, height) polylines.  The inner
+    radius below the start of the inner polyline is 0 (solid bottom).
+    """
+    outer = np.asarray(outer, dtype=float)
+    inner = np.asarray(inner, dtype=float)
+    heights = np.asarray(heights, dtype=float)
+    extremes = []
+    for polyline, reduce, below in ((outer, np.maximum, np.nan), (inner, np.minimum, 0.0)):
+        order = np.argsort(polyline[:, 1], kind="stable")
+        z, r = polyline[order, 1], polyline[order, 0]
+        at_grid = np.interp(heights, z, r, left=below)
+        cells = reduce(at_grid[:-1], at_grid[1:])
+        # Samples strictly inside a cell can stick out further than its ends.
+        cell = np.searchsorted(heights, z, side="right") - 1
+        inside = (cell >= 0) & (cell < len(cells)) & (z > heights[np.clip(cell, 0, len(heights) - 1)])
+        reduce.at(cells, cell[inside], r[inside])
+        extremes.append(cells)
+    outer_cells, inner_cells = extremes
+    # Below the outer profile there is no wood at all.
+    return np.nan_to_num(outer_cells, nan=0.0), inner_cells
+
+
+def band_volumes(outer_radius, inner_radius, z_bottom, z_top, num_segments, fudge, first, allowance=ALLOWANCE):
+    """Return the blank volume of layers with the given extreme radii, plus ``allowance`` of thickness each."""
+    parameters = segmentKernel.band_parameters(
+        z_bottom, z_top, outer_radius, inner_radius, num_segments, fudge, solid_bottom=False
+    )
+    if first is not None:
+        # The bottom layer of a solid bottom bowl is a full disc of segments.
+        parameters[first, segmentKernel.TRAPEZOID_HEIGHT] = parameters[first, segmentKernel.RADIUS]
+    parameters[:, segmentKernel.EXTRUDE_HEIGHT] += allowance
+    return segmentKernel.blank_volume(parameters, num_segments)
+
+
+def adaptive_layers(outer, inner, num_segments, fudge, min_thickness, max_thickness,
+                    resolution=RESOLUTION, solid_bottom=True, allowance=ALLOWANCE):
+    """Return (boundaries, volume): the layer heights with the least total blank volume.
+
+    ``boundaries`` runs from the bottom of ``outer`` to the rim; each layer
+    is ``min_thickness`` to ``max_thickness`` thick, rounded to the candidate
+    grid of ``resolution``.  Raises ValueError if no slicing fits the range.
+    """
+    outer = np.asarray(outer, dtype=float)
+    bottom, top = outer[:, 1].min(), outer[:, 1].max()
+    cells_count = max(int(np.ceil((top - bottom) / resolution)), 1)
+    heights = np.linspace(bottom, top, cells_count + 1)
+    step = (top - bottom) / cells_count
+    shortest = max(int(np.ceil(min_thickness / step - 1e-9)), 1)
+    longest = int(np.floor(max_thickness / step + 1e-9))
+    if longest < shortest:
+        raise ValueError(f"No layer thickness between {min_thickness} and {max_thickness} fits a {step:.3f} grid.")
+    outer_cells, inner_cells = cell_extremes(outer, inner, heights)
+
+    best = np.full(cells_count + 1, np.inf)
+    best[0] = 0.0
+    previous = np.full(cells_count + 1, -1)
+    for start in range(cells_count - shortest + 1):
+        if not np.isfinite(best[start]):
+            continue
+        stop = min(start + longest, cells_count)
+        if stop - start < shortest:
+            continue
+        # Every layer from ``start`` to ``start + shortest .. stop`` cells up.
+        outer_radius = np.maximum.accumulate(outer_cells[start:stop])[shortest - 1:]
+        inner_radius = np.minimum.accumulate(inner_cells[start:stop])[shortest - 1:]
+        ends = np.arange(start + shortest, stop + 1)
+        volumes = band_volumes(
+            outer_radius, inner_radius, heights[start], heights[ends], num_segments, fudge,
+            first=slice(None) if solid_bottom and start == 0 else None, allowance=allowance,
+        )
+        candidates = best[start] + volumes
+        better = candidates < best[ends]
+        best[ends[better]] = candidates[better]
+        previous[ends[better]] = start
+    if not np.isfinite(best[-1]):
+        raise ValueError(
+            f"The profile height {top - bottom:.1f} cannot be split into layers "
+            f"{min_thickness} to {max_thickness} thick."
+        )
+    path = [cells_count]
+    while path[-1] > 0:
+        path.append(previous[path[-1]])
+    return heights[path[::-1]], best[-1]
+
+
+def sliced_volume(outer, inner, boundaries, num_segments, fudge, solid_bottom=True, allowance=ALLOWANCE):
+    """Return the blank volume of each layer between consecutive ``boundaries``."""
+    boundaries = np.asarray(boundaries, dtype=float)
+    outer_radius, inner_radius = cell_extremes(outer, inner, boundaries)
+    return band_volumes(
+        outer_radius, inner_radius, boundaries[:-1], boundaries[1:], num_segments, fudge,
+        first=0 if solid_bottom else None, allowance=allowance,
+    )
+
+
+def uniform_layers(outer, layer_height):
+    """Return boundaries every ``layer_height`` from the bottom, the last layer ending at the rim."""
+    outer = np.asarray(outer, dtype=float)
+    bottom, top = outer[:, 1].min(), outer[:, 1].max()
+    boundaries = np.arange(bottom, top - 1e-6, layer_height)
+    return np.append(boundaries, top)
+
+
+def layer_parameters(outer, inner, boundaries, num_segments, fudge, solid_bottom=True):
+    """Return segmentKernel layer parameters for the layers between ``boundaries``."""
+    boundaries = np.asarray(boundaries, dtype=float)
+    outer_radius, inner_radius = cell_extremes(outer, inner, boundaries)
+    return segmentKernel.band_parameters(
+        boundaries[:-1], boundaries[1:], outer_radius, inner_radius, num_segments, fudge, solid_bottom
+    )
+
+
+def slicing_report(outer, inner, num_segments, fudge, min_thickness, max_thickness, layer_height,
+                   resolution=RESOLUTION, solid_bottom=True, allowance=ALLOWANCE):
+    """Slice adaptively and compare with uniform ``layer_height`` layers.
+
+    Returns a dict with both sets of boundaries, their volumes (mm^3) and
+    the volume and percentage saved.
+    """
+    boundaries, volume = adaptive_layers(
+        outer, inner, num_segments, fudge, min_thickness, max_thickness, resolution, solid_bottom, allowance
+    )
+    uniform = uniform_layers(outer, layer_height)
+    uniform_volume = sliced_volume(outer, inner, uniform, num_segments, fudge, solid_bottom, allowance).sum()
+    saved = uniform_volume - volume
+    return {
+        "boundaries": boundaries,
+        "volume": volume,
+        "uniform_boundaries": uniform,
+        "uniform_volume": uniform_volume,
+        "saved": saved,
+        "saved_percent": 100.0 * saved / uniform_volume if uniform_volume else 0.0,
+    }
+
+
+def format_report(report):
+    """Return a short human readable summary of ``slicing_report``."""
+    return (
+        f"Adaptive slicing: {len(report['boundaries']) - 1} layers, {report['volume'] / 1000:.0f} cm^3 of blanks; "
+        f"uniform: {len(report['uniform_boundaries']) - 1} layers, {report['uniform_volume'] / 1000:.0f} cm^3. "
+        f"Saved {report['saved'] / 1000:.0f} cm^3 ({report['saved_percent']:.1f}%)\n"
+    )
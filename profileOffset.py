@@ -0,0 +1,178 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+2D wall offset of a bowl profile.
+
+It gives the inside of the wall for segments and solids.  The outside of
+the bowl is given as an (n, 2) polyline of (radius, height) samples from
+the bottom to the rim.  ``inner_profile`` returns the inside of a wall of constant
+thickness, the same surface ``makeThickness`` produces on the revolved
+solid, but worked out in the profile plane:
+
+1. The bottom is closed to the axis and the chain is offset to its inside
+   with mitred corners.
+2. Loops that appear where the wall is thicker than the local radius of
+   curvature are cut out.
+3. The result is clipped to the axis and the rim height.
+"""
+import numpy as np
+
+MITER_LIMIT = 4.0
+EPSILON = 1e-9
+
+
+def wall_chain(outer):
+    """Return the outer profile with the bottom closed to the axis."""
+    outer = np.asarray(outer, dtype=float)[:, :2]
+    if outer[0, 0] > EPSILON:
+        outer = np.vstack([[0.0, outer[0, 1]], outer])
+    return outer
+
+
+def _dedupe(points):
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.linalg.norm(np.diff(points, axis=0), axis=1) > EPSILON
+    return points[keep]
+
+
+def offset_polyline(points, distance):
+    """Offset a polyline by ``distance`` to the left of its direction of travel.
+
+    Interior vertices move along the bisector of the two segment normals
+    (a mitre join, capped at ``MITER_LIMIT * distance``).
+    """
+    points = _dedupe(np.asarray(points, dtype=float))
+    tangents = np.diff(points, axis=0)
+    tangents /= np.linalg.norm(tangents, axis=1)[:, None]
+    normals = np.column_stack([-tangents[:, 1], tangents[:, 0]])
+    vertex_normals = np.empty_like(points)
+    vertex_normals[0] = normals[0]
+    vertex_normals[-1] = normals[-1]
+    bisectors = normals[:-1] + normals[1:]
+    lengths = np.linalg.norm(bisectors, axis=1)
+    # Opposite normals (a full reversal) have no bisector; fall back to the first normal.
+    bisectors = np.where(lengths[:, None] > EPSILON, bisectors / np.maximum(lengths, EPSILON)[:, None], normals[:-1])
+    cos_half = np.einsum("ij,ij->i", bisectors, normals[:-1])
+    scale = 1.0 / np.maximum(cos_half, 1.0 / MITER_LIMIT)
+    vertex_normals[1:-1] = bisectors * scale[:, None]
+    return points + distance * vertex_normals
+
+
+def _segment_hits(points, i):
+    """Return (j, t, u) of the first later, non-adjacent segment crossing segment i."""
+    p, r = points[i], points[i + 1] - points[i]
+    q = points[i + 2:-1]
+    s = points[i + 3:] - q
+    if len(q) == 0:
+        return None
+    denominator = r[0] * s[:, 1] - r[1] * s[:, 0]
+    qp = q - p
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (qp[:, 0] * s[:, 1] - qp[:, 1] * s[:, 0]) / denominator
+        u = (qp[:, 0] * r[1] - qp[:, 1] * r[0]) / denominator
+    hits = np.nonzero((np.abs(denominator) > EPSILON) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1))[0]
+    if len(hits) == 0:
+        return None
+    # The furthest crossing removes the largest loop in one go.
+    k = hits[-1]
+    return i + 2 + k, t[k], u[k]
+
+
+def remove_loops(points):
+    """Cut out every loop where the polyline crosses itself."""
+    points = np.array(points, dtype=float)
+    result = [points[0]]
+    i = 0
+    while i < len(points) - 1:
+        hit = _segment_hits(points, i)
+        if hit is None:
+            result.append(points[i + 1])
+            i += 1
+            continue
+        j, t, _ = hit
+        crossing = points[i] + t * (points[i + 1] - points[i])
+        result.append(crossing)
+        # Carry on along segment j, starting from the crossing.
+        points[j] = crossing
+        i = j
+    return _dedupe(np.array(result))
+
+
+def _clip(points, axis, limit, keep_below):
+    """Clip a polyline to ``points[:, axis] <= limit`` (or ``>=``), cutting at the crossings."""
+    values = points[:, axis] - limit
+    if not keep_below:
+        values = -values
+    inside = values <= EPSILON
+    clipped = []
+    for k in range(len(points)):
+        if inside[k]:
+            clipped.append(points[k])
+        if k + 1 < len(points) and inside[k] != inside[k + 1]:
+            fraction = values[k] / (values[k] - values[k + 1])
+            clipped.append(points[k] + fraction * (points[k + 1] - points[k]))
+    return np.array(clipped).reshape(-1, 2)
+
+
+def inner_profile(outer, wall_thickness):
+    """Return the inside of the wall as an (m, 2) polyline from the axis to the rim.
+
+    ``outer`` runs from the bottom of the bowl to the rim.  The result starts
+    on the axis ``wall_thickness`` above the bottom and ends at rim height.
+    """
+    chain = wall_chain(outer)
+    rim = chain[-1, 1]
+    inner = remove_loops(offset_polyline(chain, wall_thickness))
+    inner = _clip(inner, 0, 0.0, keep_below=False)
+    if len(inner) and abs(inner[0, 0]) > EPSILON:
+        inner = np.vstack([[0.0, inner[0, 1]], inner])
+    # Carry the inside up to the rim along its last direction, or straight up.
+    last, before = inner[-1], inner[-2]
+    direction = last - before
+    if last[1] < rim - EPSILON:
+        if direction[1] > EPSILON:
+            inner = np.vstack([inner, last + direction * (rim - last[1]) / direction[1]])
+        else:
+            inner = np.vstack([inner, [last[0], rim]])
+    inner = _clip(inner, 1, rim, keep_below=True)
+    return _dedupe(inner)
+
+
+def band_inner_radius(inner, z_bottom, z_top):
+    """Return the smallest inner radius of the wall between two heights, per band.
+
+    Heights below the start of the inner curve are solid bottom (radius 0).
+    """
+    inner = np.asarray(inner, dtype=float)
+    z_bottom = np.atleast_1d(np.asarray(z_bottom, dtype=float))
+    z_top = np.atleast_1d(np.asarray(z_top, dtype=float))
+    order = np.argsort(inner[:, 1], kind="stable")
+    heights, radii = inner[order, 1], inner[order, 0]
+    at_bottom = np.interp(z_bottom, heights, radii, left=0.0)
+    at_top = np.interp(z_top, heights, radii, left=0.0)
+    result = np.minimum(at_bottom, at_top)
+    for k in range(len(result)):
+        in_band = radii[(heights > z_bottom[k]) & (heights < z_top[k])]
+        if len(in_band):
+            result[k] = min(result[k], in_band.min())
+    return result
+
+
+def wall_section(outer, inner):
+    """Return the closed wall cross-section: outer chain, rim, inner chain reversed."""
+    return np.vstack([wall_chain(outer), inner[::-1]])
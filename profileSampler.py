@@ -0,0 +1,140 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Shared, cached access to the bowl profile in ``BowlProfileSketch``.
+
+``get_sampler(sketch)`` returns a ProfileSampler holding the sorted profile
+points, the fitted BSpline and dense samples of it.  Everything is worked
+out on first use and kept until the sketch's Geometry changes, which a
+document observer reports, so commands can ask for the profile as often as
+they like.
+"""
+import numpy as np
+
+import FreeCAD as App
+
+import profileOffset
+from bowlOps import SAMPLES, outer_samples, profile_curve, profile_placement
+
+PROFILE_SKETCH = "BowlProfileSketch"
+
+
+class ProfileSampler:
+    """Profile points and curve of one sketch."""
+
+    def __init__(self, sketch):
+        self.sketch = sketch
+        self._points = None
+        self._curve = None
+        self._samples = {}
+        self._inner = {}
+
+    def points(self):
+        """Return the (n, 2) array of (radius, height) point geometries sorted by height."""
+        if self._points is None:
+            points = [(geo.X, geo.Y) for geo in self.sketch.Geometry if geo.TypeId == 'Part::GeomPoint']
+            points = np.array(points, dtype=float).reshape(-1, 2)
+            self._points = points[np.argsort(points[:, 1], kind="stable")]
+        return self._points
+
+    def point_list(self):
+        """Return the profile points as a list of (radius, height) tuples."""
+        return [tuple(point) for point in self.points().tolist()]
+
+    def curve(self):
+        """Return the BSpline edge through the profile points (as poles) in the XZ plane."""
+        if self._curve is None:
+            if len(self.points()) < 2:
+                raise ValueError(f"Sketch '{self.sketch.Label}' needs at least 2 points to make a profile curve.")
+            self._curve = profile_curve(self.point_list())
+        return self._curve
+
+    def placement(self):
+        """Return the placement carrying the XZ profile frame onto the sketch."""
+        return profile_placement(self.sketch)
+
+    def samples(self, count=SAMPLES):
+        """Return ``count`` (radius, height) samples of the curve from bottom to rim."""
+        if count not in self._samples:
+            self._samples[count] = np.array(outer_samples(self.curve(), count))
+        return self._samples[count]
+
+    def inner_profile(self, wall_thickness):
+        """Return the inside of the wall for ``wall_thickness`` (see profileOffset)."""
+        key = round(float(wall_thickness), 6)
+        if key not in self._inner:
+            self._inner[key] = profileOffset.inner_profile(self.samples(), wall_thickness)
+        return self._inner[key]
+
+    def radius_at(self, heights):
+        """Return the radius of the curve at each height (vectorized).
+
+        Heights outside the profile return NaN.
+        """
+        samples = self.samples()
+        return np.interp(heights, samples[:, 1], samples[:, 0], left=np.nan, right=np.nan)
+
+
+class _SamplerObserver:
+    """Drops cached samplers when their sketch changes or goes away."""
+
+    def __init__(self):
+        self.samplers = {}
+
+    def slotChangedObject(self, obj, prop):
+        if prop in ("Geometry", "Label"):
+            self.samplers.pop((obj.Document.Name, obj.Name), None)
+
+    def slotDeletedObject(self, obj):
+        self.samplers.pop((obj.Document.Name, obj.Name), None)
+
+    def slotDeletedDocument(self, doc):
+        for key in [key for key in self.samplers if key[0] == doc.Name]:
+            del self.samplers[key]
+
+
+_observer = None
+
+
+def get_sampler(sketch):
+    """Return the shared ProfileSampler for ``sketch``."""
+    global _observer
+    if _observer is None:
+        _observer = _SamplerObserver()
+        App.addDocumentObserver(_observer)
+    key = (sketch.Document.Name, sketch.Name)
+    sampler = _observer.samplers.get(key)
+    if sampler is None or sampler.sketch != sketch:
+        sampler = ProfileSampler(sketch)
+        _observer.samplers[key] = sampler
+    return sampler
+
+
+def find_profile_sketch(doc=None):
+    """Return the ``BowlProfileSketch`` of ``doc`` (default: the active document), or None."""
+    doc = doc or App.ActiveDocument
+    if doc is None:
+        return None
+    sketches = doc.getObjectsByLabel(PROFILE_SKETCH)
+    return sketches[0] if sketches else None
+
+
+def profile_sampler(doc=None):
+    """Return the sampler of the document's BowlProfileSketch, or None if there is none."""
+    sketch = find_profile_sketch(doc)
+    return get_sampler(sketch) if sketch is not None else None
@@ -0,0 +1,310 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Random ring colors with no two touching segments alike.
+
+It picks the colors behind Apply Colors' "Random Colors, None Touching".
+The segments are the nodes of a graph:
+
+* Segments next to each other round a ring are neighbours.
+* A segment is a neighbour of every segment in the ring above whose angular
+  span overlaps its own.  The spans come from the segments' actual angles,
+  so rings turned by RotateRings get the right neighbours.
+
+``color_graph`` colors the segments DSATUR fashion: the segment whose
+neighbours already have the most different colors goes next, with ties
+broken by a seeded generator, so the same seed gives the same vessel.  It
+takes the free color with the most stock left, which also keeps the counts
+even.  Optional quotas cap how many segments each color may get, for
+example the pieces of each species in stock.  When a segment has no free
+color, a Kempe chain swap (exchanging two colors over a connected run of
+segments) frees one where it can; any clashes left are then repaired by
+recoloring and swapping segments.
+"""
+import heapq
+import random
+
+import numpy as np
+
+TOLERANCE = 1e-6
+KEMPE_STEPS = 50
+REPAIR_ATTEMPTS = 10
+
+
+def circular_distance(a, b):
+    """Return the angle between ``a`` and ``b`` in radians, in [0, pi] (broadcasting)."""
+    return np.abs((np.asarray(a) - np.asarray(b) + np.pi) % (2 * np.pi) - np.pi)
+
+
+def neighbours(angles, tolerance=TOLERANCE):
+    """Return the neighbour lists of the segments of a vessel.
+
+    ``angles`` holds one array of segment centre angles (radians) per
+    ring, bottom ring first; nodes are numbered ring by ring in that order.
+    Each segment of a ring of n spans 2 pi / n.
+    """
+    angles = [np.asarray(ring, dtype=float) for ring in angles]
+    starts = np.cumsum([0] + [len(ring) for ring in angles])
+    adjacent = [set() for _ in range(starts[-1])]
+    for r, ring in enumerate(angles):
+        n = len(ring)
+        if n > 1:
+            order = np.argsort(ring) + starts[r]
+            for a, b in zip(order.tolist(), np.roll(order, -1).tolist()):
+                if a != b:
+                    adjacent[a].add(b)
+                    adjacent[b].add(a)
+        if r + 1 < len(angles) and n and len(angles[r + 1]):
+            above = angles[r + 1]
+            reach = np.pi / n + np.pi / len(above) - tolerance
+            rows, cols = np.nonzero(circular_distance(ring[:, None], above[None, :]) < reach)
+            for a, b in zip((rows + starts[r]).tolist(), (cols + starts[r + 1]).tolist()):
+                adjacent[a].add(b)
+                adjacent[b].add(a)
+    return [sorted(nodes) for nodes in adjacent]
+
+
+def conflicts(adjacent, colors):
+    """Return the number of neighbouring pairs with the same color."""
+    return sum(1 for a, nodes in enumerate(adjacent) for b in nodes if a < b and colors[a] == colors[b])
+
+
+def _kempe_chain(node, first, second, colors, adjacent, limit):
+    """Return the ``first``/``second`` chain through the ``first`` neighbours of ``node``.
+
+    Returns (chain, usable).  The chain is not usable if it also reaches a
+    ``second`` neighbour, since swapping it would not free ``first``, or if
+    it grows past ``limit`` nodes.
+    """
+    chain = {other for other in adjacent[node] if colors[other] == first}
+    stack = list(chain)
+    while stack:
+        current = stack.pop()
+        for other in adjacent[current]:
+            if other not in chain and colors[other] in (first, second):
+                if other in adjacent[node] or len(chain) >= limit:
+                    return chain, False
+                chain.add(other)
+                stack.append(other)
+    return chain, True
+
+
+def _dsatur(adjacent, remaining, rng, budget):
+    """Color every node, the most constrained first.
+
+    The next node is the one whose neighbours have the most different
+    colors, then the one with the most neighbours, ties broken at random.
+    It takes the stocked color none of its neighbours has with the most
+    stock left.  If every stocked color is taken, the smallest Kempe chain
+    that frees one is swapped, until chain searches have visited ``budget``
+    nodes; otherwise the node takes the color fewest neighbours have.
+    """
+    count, num_colors = len(adjacent), len(remaining)
+    colors = [-1] * count
+    # seen[node][color]: how many neighbours of node have color
+    seen = [[0] * num_colors for _ in range(count)]
+    saturation = [0] * count
+    ties = [rng.random() for _ in range(count)]
+    queue = [(0, -len(adjacent[node]), ties[node], node) for node in range(count)]
+    heapq.heapify(queue)
+
+    def paint(node, color):
+        old = colors[node]
+        colors[node] = color
+        for other in adjacent[node]:
+            if old >= 0:
+                seen[other][old] -= 1
+            seen[other][color] += 1
+            if colors[other] < 0:
+                level = sum(1 for c in seen[other] if c)
+                if level != saturation[other]:
+                    saturation[other] = level
+                    heapq.heappush(queue, (-level, -len(adjacent[other]), ties[other], other))
+
+    def free_color(node):
+        nonlocal budget
+        best = None
+        for first in range(num_colors):
+            if not seen[node][first]:
+                continue
+            for second in range(num_colors):
+                if second == first or budget <= 0:
+                    continue
+                chain, usable = _kempe_chain(node, first, second, colors, adjacent, budget)
+                budget -= len(chain)
+                if not usable:
+                    continue
+                moved = sum(1 if colors[other] == first else -1 for other in chain)
+                if remaining[first] + moved < 1 or remaining[second] < moved:
+                    continue
+                if best is None or len(chain) < len(best[2]):
+                    best = (first, second, chain)
+        if best is None:
+            return None
+        first, second, chain = best
+        for other in chain:
+            swapped = second if colors[other] == first else first
+            remaining[colors[other]] += 1
+            remaining[swapped] -= 1
+            paint(other, swapped)
+        return first
+
+    while queue:
+        level, _, _, node = heapq.heappop(queue)
+        if colors[node] >= 0 or -level != saturation[node]:
+            continue
+        counts = seen[node]
+        stocked = [c for c in range(num_colors) if remaining[c] > 0]
+        rng.shuffle(stocked)
+        color = min(stocked, key=lambda c: (counts[c], -remaining[c]))
+        if counts[color]:
+            freed = free_color(node)
+            if freed is not None:
+                color = freed
+        remaining[color] -= 1
+        paint(node, color)
+    return colors
+
+
+def _repair(adjacent, colors, remaining, rng, attempts):
+    """Recolor or swap clashing segments until none clash or ``attempts`` run out.
+
+    A clashing segment takes a stocked color its neighbours use less, or
+    sometimes one they use as much, or swaps colors with a segment elsewhere
+    when that lowers the clashes, which keeps the counts per color.
+    """
+    count, num_colors = len(colors), len(remaining)
+    # seen[node][color]: how many neighbours of node have color
+    seen = [[0] * num_colors for _ in range(count)]
+    for node, nodes in enumerate(adjacent):
+        for other in nodes:
+            seen[node][colors[other]] += 1
+    bad, position = [], {}
+
+    def mark(node):
+        clashing = seen[node][colors[node]] > 0
+        if clashing and node not in position:
+            position[node] = len(bad)
+            bad.append(node)
+        elif not clashing and node in position:
+            last = bad.pop()
+            if last != node:
+                bad[position[node]] = last
+                position[last] = position[node]
+            del position[node]
+
+    def recolor(node, color):
+        old = colors[node]
+        colors[node] = color
+        for other in adjacent[node]:
+            seen[other][old] -= 1
+            seen[other][color] += 1
+            mark(other)
+        mark(node)
+
+    for node in range(count):
+        mark(node)
+    for _ in range(attempts):
+        if not bad:
+            break
+        node = rng.choice(bad)
+        current = colors[node]
+        counts = seen[node]
+        options = [c for c in range(num_colors) if c != current and remaining[c] > 0]
+        best = min((counts[c] for c in options), default=None)
+        if best is not None and (best < counts[current] or (best == counts[current] and rng.random() < 0.3)):
+            color = rng.choice([c for c in options if counts[c] == best])
+            remaining[current] += 1
+            remaining[color] -= 1
+            recolor(node, color)
+            continue
+        for other in (rng.randrange(count) for _ in range(16)):
+            color = colors[other]
+            if color == current or other in adjacent[node]:
+                continue
+            if counts[color] + seen[other][current] < counts[current] + seen[other][color]:
+                recolor(node, color)
+                recolor(other, current)
+                break
+    return colors
+
+
+def color_graph(adjacent, num_colors, quotas=None, seed=None, kempe_steps=KEMPE_STEPS, repair_attempts=REPAIR_ATTEMPTS):
+    """Return a list with a color in range(num_colors) for every node.
+
+    ``quotas`` gives the most nodes each color may take (None for no
+    limit); ValueError is raised if together they cannot cover the graph.
+    The same ``seed`` gives the same colors.
+
+    Kempe chain searches stop after visiting ``kempe_steps`` nodes per
+    node, and the clashes left are repaired for up to ``repair_attempts``
+    moves per node.  The colors and quotas may make some clashes
+    unavoidable; count them with ``conflicts``.
+    """
+    count = len(adjacent)
+    if num_colors < 1:
+        raise ValueError("At least one color is needed.")
+    if quotas is None:
+        quotas = [None] * num_colors
+    if len(quotas) != num_colors:
+        raise ValueError("Give one quota per color.")
+    stock = [count if quota is None else int(quota) for quota in quotas]
+    if sum(stock) < count:
+        raise ValueError(f"The quotas cover {sum(stock)} segments but the vessel has {count}.")
+    rng = random.Random(seed)
+    remaining = stock
+    colors = _dsatur(adjacent, remaining, rng, kempe_steps * count)
+    return _repair(adjacent, colors, remaining, rng, repair_attempts * count)
+
+
+def layout_angles(num_rings, num_segments, twist=0.5, alternate=True):
+    """Return segment angles for ``neighbours``, each ring turned ``twist`` segments.
+
+    With ``alternate`` the odd rings are turned (a brick layout); without it
+    every ring is turned ``twist`` further than the one below (a spiral).
+    """
+    step = 2 * np.pi / num_segments
+    centres = (np.arange(num_segments) + 0.5) * step
+    return [centres + twist * step * (ring % 2 if alternate else ring) for ring in range(num_rings)]
+
+
+def benchmark(ring_counts=(20, 201), num_segments=24, num_colors=3, seeds=(1, 2, 3)):
+    """Time ``color_graph`` on brick and half-step spiral layouts and check for clashes.
+
+    Both layouts can be colored with three colors without clashes (the
+    brick by ``(s + 2 * (r % 2)) % 3``, the spiral by ``(s + 2 * r) % 3``
+    when ``num_segments`` is a multiple of three), so any clash left is a
+    solver failure and raises AssertionError.  Prints one line per layout.
+    """
+    import time
+    results = []
+    for num_rings in ring_counts:
+        for name, alternate in (("brick", True), ("spiral", False)):
+            adjacent = neighbours(layout_angles(num_rings, num_segments, alternate=alternate))
+            for seed in seeds:
+                start = time.perf_counter()
+                colors = color_graph(adjacent, num_colors, seed=seed)
+                seconds = time.perf_counter() - start
+                clashes = conflicts(adjacent, colors)
+                results.append((name, num_rings, seed, clashes, seconds))
+                print(f"{name} {num_rings} x {num_segments}, seed {seed}: {clashes} clashes, {seconds * 1000:.0f} ms")
+    colorable = num_colors > 3 or (num_colors == 3 and num_segments % 3 == 0)
+    failures = [result for result in results if colorable and result[3]]
+    if failures:
+        raise AssertionError(f"{len(failures)} colorable layouts were left with clashes.")
+    return results
@@ -0,0 +1,141 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Ring creation: arraying one segment around an axis.
+
+Two modes are available:
+
+* ``copy_instances`` deep-copies the segment for every position, which is
+  what the workbench has always done.  Every copy stores its own BRep.
+* ``link_instances`` creates one ``App::Link`` array over the segment.  The
+  shape is stored once and every element only holds a placement.  The
+  elements are exposed as ``App::LinkElement`` objects labelled
+  ``Ring_RRR_SSS`` so RotateRings, ApplyColors and the other label based
+  tools keep working on them.
+"""
+import os
+import tempfile
+import time
+
+import FreeCAD as App
+
+from docOps import batch_update
+
+
+def ring_placements(num_segments, axis=App.Vector(0, 0, 1), start=0, offset=App.Vector(0, 0, 0), base=None):
+    """Return the placement of every segment position in a ring.
+
+    Position i is rotated ``i * 360 / num_segments`` degrees about ``axis``
+    and then moved by ``offset``.  ``base`` is an optional placement applied
+    before the rotation, e.g. the segment's own placement.
+    """
+    placements = []
+    for i in range(start, num_segments):
+        placement = App.Placement(offset, App.Rotation(axis, i * (360 / num_segments)))
+        if base is not None:
+            placement = placement.multiply(base)
+        placements.append(placement)
+    return placements
+
+
+def copy_instances(doc, master, placements, labels):
+    """Deep-copy ``master`` once per placement; returns the copies."""
+    copies = []
+    for placement, label in zip(placements, labels):
+        copy = doc.copyObject(master, True)
+        copy.Placement = placement
+        copy.Label = label
+        copies.append(copy)
+    return copies
+
+
+def link_instances(doc, master, placements, labels, array_label):
+    """Create one link array over ``master`` with an element per placement.
+
+    Each element gets the matching label from ``labels`` and ``master`` is
+    hidden.  Returns the elements.
+    """
+    link = doc.addObject("App::Link", array_label)
+    link.Label = array_label
+    link.LinkedObject = master
+    link.ShowElement = True
+    link.ElementCount = len(placements)
+    link.PlacementList = placements
+    elements = list(link.ElementList)
+    for element, label in zip(elements, labels):
+        element.Label = label
+    master.Visibility = False
+    return elements
+
+
+def make_rings(doc, masters, num_segments, use_links=False, axis=App.Vector(0, 0, 1), start=1):
+    """Array every master in ``masters`` into a ring, numbering rings from 1.
+
+    In copy mode the master becomes ``Ring_RRR_001`` and copies are made for
+    positions ``start`` to ``num_segments - 1``.  In link mode a link array
+    labelled ``Layer_RRR_Array`` (so it is not picked up as a ring segment)
+    holds every position and the master is hidden.  All rings are created
+    in one transaction.  Returns a list with the ring objects of each master.
+    """
+    rings = []
+    with batch_update(doc, "Make Rings"):
+        for ring_num, master in enumerate(masters, start=1):
+            if use_links:
+                placements = ring_placements(num_segments, axis, base=master.Placement)
+                labels = [f"Ring_{ring_num:03d}_{i + 1:03d}" for i in range(len(placements))]
+                rings.append(link_instances(doc, master, placements, labels, f"Layer_{ring_num:03d}_Array"))
+            else:
+                placements = ring_placements(num_segments, axis, start)
+                labels = [f"Ring_{ring_num:03d}_{i + 2:03d}" for i in range(len(placements))]
+                master.Label = f"Ring_{ring_num:03d}_001"
+                rings.append([master] + copy_instances(doc, master, placements, labels))
+    return rings
+
+
+def benchmark(num_rings=40, num_segments=24):
+    """Compare copy and link rings by stored BRep count and saved file size.
+
+    Builds a throw-away document for each mode from the same box segments,
+    saves it to a temporary file and prints the results.  Meant to be run
+    from the FreeCAD Python console.
+    """
+    import Part
+    results = {}
+    for use_links in (False, True):
+        doc = App.newDocument("RingBenchmark")
+        try:
+            masters = []
+            for ring in range(num_rings):
+                master = doc.addObject("Part::Feature", "Intersect")
+                master.Shape = Part.makeBox(20, 40, 10, App.Vector(-10, 80, ring * 10))
+                masters.append(master)
+            start = time.perf_counter()
+            make_rings(doc, masters, num_segments, use_links)
+            seconds = time.perf_counter() - start
+            breps = len([obj for obj in doc.Objects if obj.TypeId == "Part::Feature"])
+            path = os.path.join(tempfile.gettempdir(), f"RingBenchmark_{int(use_links)}.FCStd")
+            doc.saveAs(path)
+            size = os.path.getsize(path)
+        finally:
+            App.closeDocument(doc.Name)
+        mode = "links" if use_links else "copies"
+        results[mode] = (seconds, breps, size)
+        App.Console.PrintMessage(
+            f"{mode}: {seconds * 1000:.0f} ms, {breps} stored BReps, {size / 1024:.0f} KiB on disk\n"
+        )
+    return results
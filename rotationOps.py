@@ -0,0 +1,88 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Batched ring rotation about the Z axis.
+
+The new rotations are computed for all objects at once as quaternion
+arrays (x, y, z, w, FreeCAD's order) and then written back in a single
+transaction with the main window frozen, see ``docOps.batch_update``.
+"""
+import numpy as np
+
+import FreeCAD as App
+
+from docOps import batch_update
+
+
+def z_quaternions(angles_deg):
+    """Return (n, 4) quaternions for rotations of ``angles_deg`` about Z."""
+    half = np.radians(np.asarray(angles_deg, dtype=float)) / 2
+    quaternions = np.zeros(half.shape + (4,))
+    quaternions[..., 2] = np.sin(half)
+    quaternions[..., 3] = np.cos(half)
+    return quaternions
+
+
+def quaternion_multiply(a, b):
+    """Row-wise Hamilton product ``a * b`` of two (n, 4) quaternion arrays."""
+    ax, ay, az, aw = np.moveaxis(a, -1, 0)
+    bx, by, bz, bw = np.moveaxis(b, -1, 0)
+    return np.stack((
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+        aw * bw - ax * bx - ay * by - az * bz,
+    ), axis=-1)
+
+
+def z_angles(objects):
+    """Return the rotation of each object about Z in radians, in (-pi, pi]."""
+    if not objects:
+        return np.zeros(0)
+    q = np.array([obj.Placement.Rotation.Q for obj in objects])
+    return np.arctan2(2 * (q[:, 3] * q[:, 2] + q[:, 0] * q[:, 1]), 1 - 2 * (q[:, 1] ** 2 + q[:, 2] ** 2))
+
+
+def set_rotations(doc, objects, quaternions, name="Rotate Rings"):
+    """Give every object the matching rotation, keeping its position, in one transaction."""
+    with batch_update(doc, name):
+        for obj, q in zip(objects, quaternions):
+            obj.Placement = App.Placement(obj.Placement.Base, App.Rotation(*q))
+
+
+def rotate_objects(doc, objects, angles_deg, name="Rotate Rings"):
+    """Rotate each object by its angle about Z on top of its current rotation."""
+    if not objects:
+        return
+    current = np.array([obj.Placement.Rotation.Q for obj in objects])
+    set_rotations(doc, objects, quaternion_multiply(z_quaternions(angles_deg), current), name)
+
+
+def rotate_rings(doc, rings, step):
+    """Rotate ring i of ``rings`` (lists of objects) by ``i * step`` degrees."""
+    objects = [obj for ring in rings for obj in ring]
+    angles = np.repeat(np.arange(len(rings)) * step, [len(ring) for ring in rings])
+    rotate_objects(doc, objects, angles)
+
+
+def reset_rings(doc, objects, segment_numbers, num_segments):
+    """Put segment s of every ring back at ``(s - 1) * 360 / num_segments`` degrees."""
+    if not objects:
+        return
+    angles = (np.asarray(segment_numbers) - 1) * (360 / num_segments)
+    set_rotations(doc, objects, z_quaternions(angles), "Reset Ring Rotation")
@@ -0,0 +1,161 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Pure-geometry segment ring kernel.
+
+This module only depends on NumPy so it can be used from tests, batch
+scripts or a plain Python interpreter without FreeCAD.  The FreeCAD side
+(segmentOps) turns the arrays returned here into shapes.
+
+Conventions:
+
+* A profile is an (n, 2) array of (radius, height) points sorted by height.
+* A layer is the band between two consecutive profile points; each layer
+  becomes one ring.
+* Layer parameters are an (rings, 4) array with the columns
+  ``RADIUS, TRAPEZOID_HEIGHT, Z_LEVEL, EXTRUDE_HEIGHT``.
+* A segment has 8 corners: the bottom trapezoid (inner left, inner right,
+  outer right, outer left) followed by the same four corners on top.
+  Segment 0 of every ring is centred on the +Y axis and segment j is
+  rotated by ``j * 360 / num_segments`` degrees about Z.
+"""
+import numpy as np
+
+RADIUS = 0
+TRAPEZOID_HEIGHT = 1
+Z_LEVEL = 2
+EXTRUDE_HEIGHT = 3
+
+
+def layer_parameters(profile_points, num_segments, wall_thickness, fudge, solid_bottom=True, inner_radius=None):
+    """Return the (rings, 4) layer parameter array for a profile.
+
+    By default the inside of the wall is taken as ``x - wall_thickness`` at
+    both points of a layer.  ``inner_radius`` can give the smallest inner
+    radius of each layer instead, e.g. from profileOffset.band_inner_radius.
+    """
+    points = np.asarray(profile_points, dtype=float)[:, :2]
+    if len(points) < 2:
+        return np.zeros((0, 4))
+    x0, x1 = points[:-1, 0], points[1:, 0]
+    y0, y1 = points[:-1, 1], points[1:, 1]
+    if inner_radius is None:
+        candidates = np.stack([x0 - wall_thickness, x0, x1 - wall_thickness, x1])
+    else:
+        candidates = np.stack([np.asarray(inner_radius, dtype=float), x0, x1])
+    return band_parameters(y0, y1, candidates.max(axis=0), candidates.min(axis=0), num_segments, fudge, solid_bottom)
+
+
+def band_parameters(z_bottom, z_top, outer_radius, inner_radius, num_segments, fudge, solid_bottom=True):
+    """Return the (rings, 4) layer parameters for height bands with known radii.
+
+    ``outer_radius`` is the largest outside radius and ``inner_radius`` the
+    smallest inside radius of the wall within each band.  Bands whose
+    inside reaches the axis get a trapezoid as tall as the radius, so their
+    segments run in to the centre instead of past it.
+    """
+    max_x = np.ceil(np.asarray(outer_radius, dtype=float))
+    z_bottom = np.broadcast_to(np.asarray(z_bottom, dtype=float), max_x.shape)
+    min_x = np.floor(np.asarray(inner_radius, dtype=float))
+    # Pull the inner edge in so the chord of the segment still covers the wall.
+    min_x = np.floor(min_x - (min_x - np.cos(np.radians(180 / num_segments)) * min_x))
+    radius = max_x + fudge
+    trapezoid_height = np.minimum((max_x - min_x) + (2 * fudge), radius)
+    if solid_bottom and len(trapezoid_height):
+        trapezoid_height[0] = radius[0]
+    return np.column_stack([radius, trapezoid_height, z_bottom, np.asarray(z_top, dtype=float) - z_bottom])
+
+
+def blank_volume(parameters, num_segments, solid_bottom=False):
+    """Return the volume of wood in each ring of segment blanks (mm^3).
+
+    ``num_segments`` and ``solid_bottom`` may be scalars or one value per
+    ring; solid-bottom blanks run in to the centre.
+    """
+    parameters = np.atleast_2d(np.asarray(parameters, dtype=float))
+    num_segments = np.asarray(num_segments, dtype=float)
+    outer = parameters[:, RADIUS]
+    inner = np.where(solid_bottom, 0.0, np.maximum(outer - parameters[:, TRAPEZOID_HEIGHT], 0.0))
+    # N trapezoids between radii inner and outer with half angle 180/N
+    area = num_segments * np.tan(np.radians(180 / num_segments)) * (outer ** 2 - inner ** 2)
+    return area * parameters[:, EXTRUDE_HEIGHT]
+
+
+def segment_corners(parameters, num_segments, solid_bottom=False):
+    """Return the (rings, 8, 3) corners of the segment centred on +Y in each ring."""
+    parameters = np.atleast_2d(np.asarray(parameters, dtype=float))
+    half_tan = np.tan(np.radians(180 / num_segments))
+    y_top = parameters[:, RADIUS]
+    y_bottom = y_top - parameters[:, TRAPEZOID_HEIGHT]
+    if solid_bottom:
+        y_bottom = np.zeros_like(y_bottom)
+    z_bottom = parameters[:, Z_LEVEL]
+    z_top = z_bottom + parameters[:, EXTRUDE_HEIGHT]
+
+    corners = np.empty((len(parameters), 8, 3))
+    for offset, z in ((0, z_bottom), (4, z_top)):
+        corners[:, offset + 0] = np.column_stack([-y_bottom * half_tan, y_bottom, z])
+        corners[:, offset + 1] = np.column_stack([y_bottom * half_tan, y_bottom, z])
+        corners[:, offset + 2] = np.column_stack([y_top * half_tan, y_top, z])
+        corners[:, offset + 3] = np.column_stack([-y_top * half_tan, y_top, z])
+    return corners
+
+
+def ring_angles(num_segments):
+    """Return the rotation of every segment in a ring, in degrees."""
+    return np.arange(num_segments) * (360.0 / num_segments)
+
+
+def rotate_about_z(corners, angles_deg):
+    """Rotate (..., 3) points by each angle, returning (len(angles), ..., 3)."""
+    angles = np.radians(np.asarray(angles_deg, dtype=float))
+    cos_a = np.cos(angles).reshape((-1,) + (1,) * (corners.ndim - 1))
+    sin_a = np.sin(angles).reshape(cos_a.shape)
+    x, y, z = corners[..., 0], corners[..., 1], corners[..., 2]
+    return np.stack(
+        [x * cos_a - y * sin_a, x * sin_a + y * cos_a, np.broadcast_to(z, (len(angles),) + z.shape)],
+        axis=-1,
+    )
+
+
+def ring_vertices(profile_points, wall_thickness, fudge, num_segments, solid_bottom=True):
+    """Return every segment corner of every ring as one (rings, segments, 8, 3) array."""
+    parameters = layer_parameters(profile_points, num_segments, wall_thickness, fudge, solid_bottom)
+    corners = segment_corners(parameters, num_segments)
+    # rotate_about_z puts the segment axis first; move it after the ring axis.
+    return np.swapaxes(rotate_about_z(corners, ring_angles(num_segments)), 0, 1)
+
+
+def ring_dependencies(profile_points, wall_thickness, degree=3):
+    """Return the (rings, 2) half-open range of profile point indices each ring depends on.
+
+    Ring i is built from points i and i + 1.  Once it is trimmed by the
+    bowl solid it also depends on every pole of the cubic BSpline that can
+    reach its height band (poles ``i - degree + 1`` to ``i + degree``) and,
+    through the wall offset, on every point within ``wall_thickness`` of
+    that band.
+    """
+    points = np.asarray(profile_points, dtype=float)[:, :2]
+    count = len(points)
+    if count < 2:
+        return np.zeros((0, 2), dtype=int)
+    rings = np.arange(count - 1)
+    heights = points[:, 1]
+    lo = np.minimum(rings - degree + 1, np.searchsorted(heights, heights[:-1] - wall_thickness, side="left"))
+    hi = np.maximum(rings + degree + 1, np.searchsorted(heights, heights[1:] + wall_thickness, side="right"))
+    return np.column_stack([np.clip(lo, 0, count), np.clip(hi, 0, count)])
@@ -0,0 +1,147 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Batched segment builder for segmented vessels.
+
+Building segments happens in two phases:
+
+1. ``compute_segment_parameters`` and ``trapezoid_vertices`` work out the
+   trapezoid of every layer with segmentKernel, without touching the document.
+2. ``add_segments`` turns those trapezoids into SegmentFeature objects
+   inside a single transaction and recomputes the document once.
+
+Each row of segment parameters has the same layout the AddSegments panel has
+always used::
+
+    [num_segments, radius, trapezoid_height, z_level, extrude_height, solid_bottom]
+"""
+import math
+import time
+
+import FreeCAD as App
+import Part
+
+from docOps import batch_update
+import layerSlicer
+import profileOffset
+import segmentKernel
+
+
+def compute_segment_parameters(profile_points, num_segments, wall_thickness, fudge, solid_bottom=True, inner_profile=None):
+    """Return one segment parameter row per layer between consecutive profile points.
+
+    ``profile_points`` is a sequence of (x, y) pairs (or Vectors) sorted by
+    height, where x is the outside radius and y the height of the point.
+    ``inner_profile`` is the optional inside of the wall as (radius, height)
+    pairs (see ProfileSampler.inner_profile); segments are then sized to
+    reach it instead of ``x - wall_thickness``.
+    """
+    points = [(point[0], point[1]) for point in profile_points]
+    inner_radius = None
+    if inner_profile is not None and len(points) > 1:
+        heights = [point[1] for point in points]
+        inner_radius = profileOffset.band_inner_radius(inner_profile, heights[:-1], heights[1:])
+    layers = segmentKernel.layer_parameters(points, num_segments, wall_thickness, fudge, solid_bottom, inner_radius)
+    return [[num_segments] + row + [False] for row in layers.tolist()]
+
+
+def compute_adaptive_segment_parameters(outer, inner, boundaries, num_segments, fudge, solid_bottom=True):
+    """Return one segment parameter row per layer between ``boundaries`` (see layerSlicer).
+
+    ``outer`` and ``inner`` are the outside and inside of the wall as
+    (radius, height) samples; each segment covers both over its layer.
+    """
+    layers = layerSlicer.layer_parameters(outer, inner, boundaries, num_segments, fudge, solid_bottom)
+    return [[num_segments] + row + [False] for row in layers.tolist()]
+
+
+def trapezoid_vertices(num_segments, radius, trapezoid_height, z_level, solid_bottom=False):
+    """Return the four (x, y, z) corners of a segment's bottom face.
+
+    The segment is centred on the +Y axis with its outer edge at ``radius``.
+    """
+    corners = segmentKernel.segment_corners([radius, trapezoid_height, z_level, 0], num_segments, solid_bottom)
+    return [tuple(corner) for corner in corners[0, :4].tolist()]
+
+
+def shape_from_corners(corners):
+    """Return the prism solid described by an (8, 3) corner array from segmentKernel."""
+    bottom = [App.Vector(*corner) for corner in corners[:4].tolist()]
+    height = corners[4][2] - corners[0][2]
+    wire = Part.makePolygon(bottom + [bottom[0]])
+    return Part.Face(wire).extrude(App.Vector(0, 0, height))
+
+
+def make_segment_shape(num_segments, radius, trapezoid_height, z_level, extrude_height, solid_bottom=False):
+    """Return the extruded trapezoid solid for one row of segment parameters."""
+    corners = segmentKernel.segment_corners([radius, trapezoid_height, z_level, extrude_height], num_segments, solid_bottom)
+    return shape_from_corners(corners[0])
+
+
+def add_segments(doc, segment_parameters, label_prefix="Segment", transparency=45, rotation=-90):
+    """Create one SegmentFeature per parameter row in a single transaction.
+
+    Objects are labelled ``<label_prefix>_000``, ``<label_prefix>_001``, ... in
+    layer order so the label index matches the row in ``segment_parameters``.
+    ValueError is raised if the document already has segments with that
+    prefix, since their labels would clash.  Returns the created objects.
+    """
+    # SegmentFeature builds its shape with this module.
+    from SegmentFeature import make_segment_feature
+    existing = [obj.Label for obj in doc.Objects if obj.Label.startswith(f"{label_prefix}_")]
+    if existing:
+        raise ValueError(
+            f"The document already has {len(existing)} {label_prefix} objects ({existing[0]}, ...). Delete them before adding new segments."
+        )
+    placement = App.Placement(App.Vector(0, 0, 0), App.Rotation(App.Vector(0, 0, 1), rotation))
+    objects = []
+    with batch_update(doc, "Add Segments"):
+        for index, row in enumerate(segment_parameters):
+            obj = make_segment_feature(doc, row, f"{label_prefix}_000")
+            obj.Placement = placement
+            obj.Label = f"{label_prefix}_{index:03d}"
+            if obj.ViewObject is not None:
+                obj.ViewObject.Transparency = transparency
+            objects.append(obj)
+    return objects
+
+
+def benchmark(layer_counts=(10, 25, 50, 100, 200), num_segments=24, wall_thickness=10.0, fudge=4.0):
+    """Time the geometry and document phases of ``add_segments`` for several layer counts.
+
+    Runs against a throw-away document and prints one line per layer count.
+    Meant to be run from the FreeCAD Python console.
+    """
+    results = []
+    for layers in layer_counts:
+        profile = [(60 + 40 * math.sin(math.pi * i / layers), 10.0 * i) for i in range(layers + 1)]
+        doc = App.newDocument("SegmentBenchmark")
+        try:
+            start = time.perf_counter()
+            parameters = compute_segment_parameters(profile, num_segments, wall_thickness, fudge)
+            geometry_time = time.perf_counter() - start
+            start = time.perf_counter()
+            add_segments(doc, parameters)
+            document_time = time.perf_counter() - start
+        finally:
+            App.closeDocument(doc.Name)
+        results.append((layers, geometry_time, document_time))
+        App.Console.PrintMessage(
+            f"{layers:4d} layers: geometry {geometry_time * 1000:.2f} ms, document {document_time * 1000:.1f} ms\n"
+        )
+    return results
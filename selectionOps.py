@@ -0,0 +1,179 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Selection queries over the ring and segment grid.
+
+A ``RingQuery`` is an immutable set of (ring, segment) keys taken from the
+document's LabelIndex, numbered as in the ``Ring_RRR_SSS`` labels.  Queries
+are narrowed with ring and column ranges, strides and modulo tests and
+combined with ``|``, ``&``, ``-``, ``^`` and ``~``, for example::
+
+    query = RingQuery.all(doc)
+    (query.rings(2, 6) & query.columns(step=3)).select()
+    (~query.rings(1)).select()
+
+``select`` replaces the GUI selection with the result in one batch.
+"""
+import FreeCAD as App
+
+from labelIndex import get_index
+
+
+def _matches(value, start, stop, step, offset):
+    if start is not None and value < start:
+        return False
+    if stop is not None and value > stop:
+        return False
+    if offset is None:
+        offset = 1 if start is None else start
+    return (value - offset) % step == 0
+
+
+class RingQuery:
+    """Immutable set of (ring, segment) keys of one document."""
+
+    def __init__(self, index, keys):
+        self.index = index
+        self.keys = frozenset(keys)
+
+    @classmethod
+    def all(cls, doc=None):
+        """Return a query holding every ring object of ``doc`` (default: the active document)."""
+        index = get_index(doc)
+        return cls(index, index.ring_keys().values())
+
+    def _new(self, keys):
+        return RingQuery(self.index, keys)
+
+    def rings(self, start=None, stop=None, step=1, offset=None):
+        """Keep rings ``start`` to ``stop`` (inclusive; ``stop`` defaults to ``start``).
+
+        Every ``step``-th ring is kept, counting from ``offset`` if given,
+        otherwise from ``start``.  ``rings()`` keeps everything.
+        """
+        if stop is None:
+            stop = start
+        return self._new(key for key in self.keys if _matches(key[0], start, stop, step, offset))
+
+    def columns(self, start=None, stop=None, step=1, offset=None):
+        """Keep segments ``start`` to ``stop`` of every ring, like ``rings``."""
+        if stop is None:
+            stop = start
+        return self._new(key for key in self.keys if _matches(key[1], start, stop, step, offset))
+
+    def every(self, step, start=1):
+        """Keep every ``step``-th segment of each ring, counting from segment ``start``.
+
+        The count goes once round each ring and wraps past its last segment,
+        so with 12 segments, ``step`` 5 and ``start`` 8 it keeps 8, 1 and 6.
+        """
+        step = max(int(step), 1)
+        sizes = {}
+        for ring, segment in self.index.ring_keys().values():
+            sizes[ring] = max(sizes.get(ring, 0), segment)
+        kept = set()
+        for ring, size in sizes.items():
+            kept.update((ring, (start - 1 + k * step) % size + 1) for k in range(-(-size // step)))
+        return self._new(self.keys & kept)
+
+    def modulo(self, ring_modulus=None, ring_remainder=0, column_modulus=None, column_remainder=0):
+        """Keep keys whose ring and/or segment number has the given remainder."""
+        return self._new(
+            (ring, segment) for ring, segment in self.keys
+            if (ring_modulus is None or ring % ring_modulus == ring_remainder % ring_modulus)
+            and (column_modulus is None or segment % column_modulus == column_remainder % column_modulus)
+        )
+
+    def where(self, predicate):
+        """Keep the keys for which ``predicate(ring, segment)`` is true."""
+        return self._new(key for key in self.keys if predicate(*key))
+
+    def __or__(self, other):
+        return self._new(self.keys | other.keys)
+
+    def __and__(self, other):
+        return self._new(self.keys & other.keys)
+
+    def __sub__(self, other):
+        return self._new(self.keys - other.keys)
+
+    def __xor__(self, other):
+        return self._new(self.keys ^ other.keys)
+
+    def __invert__(self):
+        return RingQuery.all(self.index.doc) - self
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(sorted(self.keys))
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def objects(self):
+        """Return the objects of the query ordered by ring, then segment."""
+        objects = []
+        for ring, segment in sorted(self.keys):
+            obj = self.index.get(ring, segment)
+            if obj is not None:
+                objects.append(obj)
+        return objects
+
+    def select(self, clear=True):
+        """Make the query's objects the GUI selection; returns them."""
+        objects = self.objects()
+        select_objects(objects, clear)
+        return objects
+
+
+def keys_of(objects):
+    """Return the (ring, segment) keys of the ring objects among ``objects``."""
+    if not objects:
+        return []
+    keys = get_index(objects[0].Document).ring_keys()
+    return [keys[obj.Name] for obj in objects if obj.Name in keys]
+
+
+def select_objects(objects, clear=True):
+    """Replace (or extend) the GUI selection with ``objects`` in one batch.
+
+    Objects inside a group or part are added with one ``addSelection``
+    call per container, as sub-object paths; the main window is frozen
+    while the selection is changed, so the tree and 3D view update once.
+    """
+    if not App.GuiUp:
+        return
+    import FreeCADGui as Gui
+    main_window = Gui.getMainWindow()
+    main_window.setUpdatesEnabled(False)
+    try:
+        if clear:
+            Gui.Selection.clearSelection()
+        containers = {}
+        for obj in objects:
+            parent = obj.getParentGeoFeatureGroup() or obj.getParentGroup()
+            if parent is None:
+                Gui.Selection.addSelection(obj)
+            else:
+                containers.setdefault(parent.Name, (parent, []))[1].append(obj.Name + ".")
+        for parent, subnames in containers.values():
+            Gui.Selection.addSelection(parent, subnames)
+    finally:
+        main_window.setUpdatesEnabled(True)
@@ -0,0 +1,136 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Content-addressed cache of generated shapes.
+
+Keys are SHA-256 hashes of the profile points plus the BowlVariables values
+a shape was generated from (see ``make_key``), so switching back to an
+earlier design finds the same keys again.  Shapes are kept in a small
+in-memory LRU and written as BREP files to
+``<UserAppData>/WoodturningWorkbench/ShapeCache``, which is trimmed to its
+newest ``max_disk_entries`` files.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import FreeCAD as App
+import Part
+
+KEY_DECIMALS = 6
+TRIM_EVERY = 64
+
+
+def make_key(kind, profile_points, **values):
+    """Return the cache key for a shape of ``kind`` made from a profile and settings."""
+    points = [[round(float(c), KEY_DECIMALS) for c in point[:2]] for point in profile_points]
+    rounded = {
+        name: round(float(value), KEY_DECIMALS) if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+        for name, value in values.items()
+    }
+    payload = json.dumps([kind, points, rounded], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ShapeCache:
+    """LRU of shapes backed by a directory of BREP files."""
+
+    def __init__(self, directory=None, max_entries=512, max_disk_entries=4096):
+        if directory is None:
+            directory = Path(App.getUserAppDataDir()) / "WoodturningWorkbench" / "ShapeCache"
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._writes = 0
+
+    def _path(self, key):
+        return self.directory / f"{key}.brp"
+
+    def get(self, key):
+        """Return a copy of the shape stored under ``key``, or None."""
+        shape = self._memory.get(key)
+        if shape is None:
+            path = self._path(key)
+            if path.exists():
+                shape = Part.Shape()
+                try:
+                    shape.read(str(path))
+                except Exception:
+                    path.unlink(missing_ok=True)
+                    shape = None
+                else:
+                    # Touch the file so disk eviction is least recently used as well.
+                    os.utime(path)
+                    self._remember(key, shape)
+        else:
+            self._memory.move_to_end(key)
+        if shape is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return shape.copy()
+
+    def put(self, key, shape):
+        """Store ``shape`` under ``key`` in memory and on disk."""
+        shape = shape.copy()
+        self._remember(key, shape)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            shape.exportBrep(str(self._path(key)))
+        except Exception as e:
+            App.Console.PrintWarning(f"Could not write shape cache entry: {e}\n")
+            return
+        self._writes += 1
+        if self._writes % TRIM_EVERY == 0:
+            self._trim_disk()
+
+    def _remember(self, key, shape):
+        self._memory[key] = shape
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _trim_disk(self):
+        files = list(self.directory.glob("*.brp"))
+        if len(files) <= self.max_disk_entries:
+            return
+        files.sort(key=lambda path: path.stat().st_mtime)
+        for path in files[:len(files) - self.max_disk_entries]:
+            path.unlink(missing_ok=True)
+
+    def clear(self):
+        """Forget every entry, in memory and on disk."""
+        self._memory.clear()
+        for path in self.directory.glob("*.brp"):
+            path.unlink(missing_ok=True)
+
+
+_cache = None
+
+
+def get_cache():
+    """Return the shared workbench shape cache."""
+    global _cache
+    if _cache is None:
+        _cache = ShapeCache()
+    return _cache
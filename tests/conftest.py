@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# The workbench modules live flat in the repository root.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def hemisphere():
+    """Outside of a 100 mm hemisphere bowl sampled every 0.25 mm of height, and its 10 mm wall."""
+    import profileOffset
+    heights = np.linspace(0.0, 100.0, 401)
+    outer = np.column_stack([np.sqrt(np.maximum(100.0 ** 2 - (100.0 - heights) ** 2, 0.0)), heights])
+    return outer, profileOffset.inner_profile(outer, 10.0)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import boardPlanner
+
+
+def test_strip_edges():
+    np.testing.assert_allclose(boardPlanner.strip_edges(100.0, 4), [-50, -25, 0, 25, 50])
+
+
+def test_ring_sections_stack_up():
+    sections = boardPlanner.ring_sections(50.0, 20.0, 10.0, 4, 45.0)
+    assert sections.shape == (4, 4, 2)
+    # The bottom ring is a disc and every ring starts where the last one ends.
+    np.testing.assert_allclose(sections[0, boardPlanner.BOTTOM_INNER], [0, 0])
+    np.testing.assert_allclose(sections[1:, boardPlanner.BOTTOM_INNER, 1], sections[:-1, boardPlanner.TOP_INNER, 1])
+    # The top ring has a vertical outside.
+    assert sections[-1, boardPlanner.TOP_OUTER, 0] == sections[-1, boardPlanner.BOTTOM_OUTER, 0]
+
+
+def test_plan_volumes_add_up_to_the_ring():
+    ring = [[(30.0, 0.0), (80.0, 0.0), (80.0, 10.0), (30.0, 10.0)]]
+    cuts = boardPlanner.plan(ring, boardPlanner.strip_edges(240.0, 8))
+    assert cuts["volume"].sum() == pytest.approx(np.pi * (80 ** 2 - 30 ** 2) * 10)
+    # Strips outside the ring cut nothing; strips inside the hole cut two arcs.
+    np.testing.assert_array_equal(cuts["pieces"][0], [0, 1, 1, 2, 2, 1, 1, 0])
+    assert "Ring 0: 8 pieces from 6 strips" in boardPlanner.format_plan(cuts)
+
+
+def test_plan_of_a_disc():
+    disc = [[(0.0, 0.0), (60.0, 0.0), (60.0, 20.0), (0.0, 20.0)]]
+    cuts = boardPlanner.plan(disc, boardPlanner.strip_edges(120.0, 3))
+    assert cuts["volume"].sum() == pytest.approx(np.pi * 60 ** 2 * 20)
+    np.testing.assert_array_equal(cuts["pieces"][0], [1, 1, 1])
+    assert cuts["length"][0, 1] == pytest.approx(120)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+import catenary
+
+
+def test_sample_follows_the_curve_within_tolerance():
+    x, y = catenary.sample(250.0, 0.0, 300.0, y_start=5.0, num_points=10, tolerance=0.05)
+    assert x[0] == 0 and x[-1] == 300 and len(x) > 11
+    assert y[0] == pytest.approx(5.0)
+    np.testing.assert_allclose(y, catenary.catenary_y(x, 250.0, 5.0))
+    assert np.all(catenary.chord_deviation(x[:-1], x[1:], 250.0) <= 0.05)
+
+
+def test_sample_without_tolerance_keeps_equal_intervals():
+    x, _ = catenary.sample(250.0, 0.0, 300.0, num_points=50, tolerance=0)
+    np.testing.assert_allclose(np.diff(x), 6.0)
+
+
+@pytest.mark.parametrize("sag", [0.0, -100.0])
+def test_sample_rejects_sag_that_is_not_positive(sag):
+    with pytest.raises(ValueError):
+        catenary.sample(sag, 0.0, 300.0)
+
+
+def test_solve_sag_round_trip():
+    heights = np.array([1.0, 50.0, 200.0, 5000.0])
+    sag = catenary.solve_sag(heights, 10.0, 300.0)
+    rise = catenary.catenary_y(300.0, sag) - catenary.catenary_y(10.0, sag)
+    np.testing.assert_allclose(rise, heights, rtol=1e-6)
+    assert isinstance(catenary.solve_sag(200.0, 0.0, 300.0), float)
+
+
+def test_solve_sag_rejects_bad_input():
+    with pytest.raises(ValueError):
+        catenary.solve_sag(-1.0, 0.0, 300.0)
+    with pytest.raises(ValueError):
+        catenary.solve_sag(10.0, 300.0, 300.0)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+import colorPatterns
+
+
+def test_every_pattern_fills_the_grid():
+    for name in colorPatterns.PATTERNS:
+        assignment = colorPatterns.evaluate(name, (5, 12), 3)
+        assert assignment.shape == (5, 12)
+        assert np.all((assignment == colorPatterns.LEAVE) | ((assignment >= 0) & (assignment < 3)))
+
+
+def test_checkerboard_and_every_x():
+    np.testing.assert_array_equal(colorPatterns.evaluate("Checkerboard", (2, 4), 2), [[0, 1, 0, 1], [1, 0, 1, 0]])
+    every = colorPatterns.evaluate("Every X", (1, 6), 3, step=3, offset=1, color=2)
+    np.testing.assert_array_equal(every, [[-1, 2, -1, -1, 2, -1]])
+
+
+def test_spiral_moves_one_segment_per_ring():
+    assignment = colorPatterns.evaluate("Spiral", (3, 6), 6)
+    np.testing.assert_array_equal(assignment[1], np.roll(assignment[0], 1))
+
+
+def test_evaluate_rejects_unknown_names_and_parameters():
+    with pytest.raises(ValueError):
+        colorPatterns.evaluate("Plaid", (2, 2), 2)
+    with pytest.raises(ValueError):
+        colorPatterns.evaluate("Bands", (2, 2), 2, width=3)
+    with pytest.raises(ValueError):
+        colorPatterns.evaluate("Bands", (2, 2), 0)
+
+
+def test_parameters_round_trip():
+    parameters = colorPatterns.parse_parameters("step=3; offset=1,")
+    assert parameters == {"step": 3, "offset": 1}
+    assert colorPatterns.parse_parameters(colorPatterns.format_parameters(parameters)) == parameters
+    with pytest.raises(ValueError):
+        colorPatterns.parse_parameters("step")
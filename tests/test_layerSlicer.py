@@ -0,0 +1,30 @@
+import numpy as np
+
+import layerSlicer
+import segmentKernel
+
+
+def test_hemisphere_layers_stop_at_the_axis(hemisphere):
+    outer, inner = hemisphere
+    parameters = layerSlicer.layer_parameters(outer, inner, np.arange(0.0, 101.0, 10.0), 12, 4.0)
+    np.testing.assert_array_equal(parameters[1], [64, 64, 10, 10])
+    assert np.all(parameters[:, segmentKernel.TRAPEZOID_HEIGHT] <= parameters[:, segmentKernel.RADIUS])
+
+
+def test_adaptive_cost_matches_built_layers(hemisphere):
+    outer, inner = hemisphere
+    boundaries, volume = layerSlicer.adaptive_layers(outer, inner, 12, 4.0, 5.0, 20.0, allowance=0.0)
+    assert boundaries[0] == 0.0 and boundaries[-1] == 100.0
+    thickness = np.diff(boundaries)
+    assert np.all((thickness > 5.0 - 1e-6) & (thickness < 20.0 + 1e-6))
+    parameters = layerSlicer.layer_parameters(outer, inner, boundaries, 12, 4.0)
+    built = segmentKernel.blank_volume(parameters, 12, solid_bottom=np.arange(len(parameters)) == 0)
+    np.testing.assert_allclose(built.sum(), volume)
+    np.testing.assert_allclose(layerSlicer.sliced_volume(outer, inner, boundaries, 12, 4.0, allowance=0.0), built)
+
+
+def test_adaptive_layers_use_no_more_wood_than_uniform(hemisphere):
+    outer, inner = hemisphere
+    _, volume = layerSlicer.adaptive_layers(outer, inner, 12, 4.0, 5.0, 20.0)
+    uniform = layerSlicer.sliced_volume(outer, inner, layerSlicer.uniform_layers(outer, 10.0), 12, 4.0)
+    assert volume <= uniform.sum() + 1e-6
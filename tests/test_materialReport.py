@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+import materialReport
+import profileOffset
+
+CYLINDER = [(100.0, 0.0), (100.0, 100.0)]
+
+
+def test_revolved_volume_of_a_rectangle():
+    section = [(0.0, 0.0), (30.0, 0.0), (30.0, 20.0), (0.0, 20.0)]
+    assert materialReport.revolved_volume(section) == pytest.approx(np.pi * 30 ** 2 * 20)
+
+
+def test_solid_and_wall_volume_of_a_cylinder():
+    inner = profileOffset.inner_profile(CYLINDER, 10.0)
+    assert materialReport.solid_volume(CYLINDER) == pytest.approx(np.pi * 100 ** 2 * 100)
+    assert materialReport.wall_volume(CYLINDER, inner) == pytest.approx(np.pi * (100 ** 2 * 100 - 90 ** 2 * 90))
+
+
+def test_ring_and_segment_volumes():
+    rows = [[12, 104, 104, 0, 10, False], [12, 104, 22, 10, 10, False]]
+    half_tan = np.tan(np.pi / 12)
+    rings = materialReport.ring_volumes(rows)
+    np.testing.assert_allclose(rings, 12 * half_tan * np.array([104 ** 2, 104 ** 2 - 82 ** 2]) * 10)
+    np.testing.assert_allclose(materialReport.segment_volumes(rows), rings / 12)
+    assert len(materialReport.ring_volumes([])) == 0
+
+
+def test_mass_by_species_or_density():
+    assert materialReport.mass(1e9, "Walnut") == pytest.approx(610)
+    assert materialReport.mass(2e9, 500) == pytest.approx(1000)
+
+
+def test_material_report_waste():
+    inner = profileOffset.inner_profile(CYLINDER, 10.0)
+    rows = [[12, 104, 104, 0, 10, True]] + [[12, 104, 22, z, 10, False] for z in range(10, 100, 10)]
+    report = materialReport.material_report(CYLINDER, inner, rows, "Cherry")
+    assert report["waste_volume"] == pytest.approx(report["blank_volume"] - report["vessel_volume"])
+    assert 0 < report["waste_percent"] < 100
+    assert report["blank_mass"] == pytest.approx(report["blank_volume"] * 560 / 1e9)
+    assert "Cherry" in materialReport.format_report(report)
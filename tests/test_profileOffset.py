@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+import profileOffset
+
+
+def test_inner_profile_of_a_cylinder():
+    inner = profileOffset.inner_profile([(100.0, 0.0), (100.0, 100.0)], 10.0)
+    np.testing.assert_allclose(inner, [[0, 10], [90, 10], [90, 100]])
+
+
+def test_inner_profile_stays_a_wall_thickness_away(hemisphere):
+    outer, inner = hemisphere
+    assert inner[0, 0] == 0 and inner[0, 1] == pytest.approx(10.0, abs=0.05)
+    assert np.isclose(inner[-1, 1], 100.0)
+    # Points of the inside of a hemisphere lie on the 90 mm sphere.
+    distance = np.hypot(inner[1:-1, 0], inner[1:-1, 1] - 100.0)
+    np.testing.assert_allclose(distance, 90.0, atol=0.05)
+
+
+def test_band_inner_radius_is_zero_on_the_floor(hemisphere):
+    _, inner = hemisphere
+    radius = profileOffset.band_inner_radius(inner, [0.0, 20.0], [10.0, 30.0])
+    assert radius[0] == 0
+    np.testing.assert_allclose(radius[1], np.sqrt(90.0 ** 2 - 80.0 ** 2), atol=0.05)
+
+
+def test_remove_loops_cuts_at_the_crossing():
+    points = profileOffset.remove_loops([[0, 0], [10, 0], [10, 10], [5, -5], [5, -10]])
+    np.testing.assert_allclose(points, [[0, 0], [20 / 3, 0], [5, -5], [5, -10]])
+
+
+def test_wall_section_closes_the_wall():
+    outer = [(50.0, 0.0), (50.0, 40.0)]
+    inner = profileOffset.inner_profile(outer, 5.0)
+    section = profileOffset.wall_section(outer, inner)
+    np.testing.assert_allclose(section[0], [0, 0])
+    np.testing.assert_allclose(section[-1], [0, 5])
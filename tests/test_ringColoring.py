@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+import ringColoring
+
+
+def test_neighbours_of_a_brick_layout():
+    adjacent = ringColoring.neighbours(ringColoring.layout_angles(3, 12))
+    # Two round the ring, two in each neighbouring ring.
+    assert [len(nodes) for nodes in adjacent[12:24]] == [6] * 12
+    assert [len(nodes) for nodes in adjacent[:12]] == [4] * 12
+    assert all(a in adjacent[b] for a, nodes in enumerate(adjacent) for b in nodes)
+
+
+def test_neighbours_of_stacked_rings_only_touch_above_and_below():
+    adjacent = ringColoring.neighbours(ringColoring.layout_angles(2, 8, twist=0))
+    assert adjacent[0] == [1, 7, 8]
+
+
+@pytest.mark.parametrize("alternate", [True, False])
+@pytest.mark.parametrize("num_rings", [20, 201])
+def test_three_colorable_layouts_have_no_clashes(num_rings, alternate):
+    adjacent = ringColoring.neighbours(ringColoring.layout_angles(num_rings, 24, alternate=alternate))
+    colors = ringColoring.color_graph(adjacent, 3, seed=1)
+    assert ringColoring.conflicts(adjacent, colors) == 0
+
+
+def test_quotas_and_seeds():
+    adjacent = ringColoring.neighbours(ringColoring.layout_angles(10, 12))
+    quotas = [50, 40, 40, 30]
+    colors = ringColoring.color_graph(adjacent, 4, quotas, seed=7)
+    assert ringColoring.conflicts(adjacent, colors) == 0
+    assert np.all(np.bincount(colors, minlength=4) <= quotas)
+    assert colors == ringColoring.color_graph(adjacent, 4, quotas, seed=7)
+
+
+def test_color_graph_rejects_short_quotas():
+    adjacent = ringColoring.neighbours(ringColoring.layout_angles(2, 6))
+    with pytest.raises(ValueError):
+        ringColoring.color_graph(adjacent, 2, [3, 3])
+    with pytest.raises(ValueError):
+        ringColoring.color_graph(adjacent, 2, [20])
@@ -0,0 +1,70 @@
+import numpy as np
+
+import profileOffset
+import segmentKernel
+
+
+def test_hemisphere_floor_layers_stop_at_the_axis(hemisphere):
+    outer, inner = hemisphere
+    heights = np.arange(0.0, 101.0, 10.0)
+    points = np.column_stack([np.sqrt(100.0 ** 2 - (100.0 - heights) ** 2), heights])
+    inner_radius = profileOffset.band_inner_radius(inner, heights[:-1], heights[1:])
+    parameters = segmentKernel.layer_parameters(points, 12, 10.0, 4.0, True, inner_radius)
+    np.testing.assert_array_equal(parameters[1], [64, 64, 10, 10])
+    assert np.all(parameters[:, segmentKernel.TRAPEZOID_HEIGHT] <= parameters[:, segmentKernel.RADIUS])
+    corners = segmentKernel.segment_corners(parameters, 12)
+    assert np.all(corners[:, :, 1] >= 0)
+
+
+CYLINDER = [(100.0, 0.0), (100.0, 10.0), (100.0, 20.0)]
+
+
+def test_layer_parameters_of_a_cylinder():
+    parameters = segmentKernel.layer_parameters(CYLINDER, 12, 10.0, 4.0, solid_bottom=False)
+    # The inside, 90, is pulled in to the chord: floor(90 * cos(15 degrees)) = 86.
+    np.testing.assert_array_equal(parameters, [[104, 22, 0, 10], [104, 22, 10, 10]])
+
+
+def test_layer_parameters_solid_bottom_and_inner_radius():
+    parameters = segmentKernel.layer_parameters(CYLINDER, 12, 10.0, 4.0, inner_radius=[0.0, 50.0])
+    np.testing.assert_array_equal(parameters[:, segmentKernel.TRAPEZOID_HEIGHT], [104, 104 - 48 + 4])
+    assert len(segmentKernel.layer_parameters(CYLINDER[:1], 12, 10.0, 4.0)) == 0
+
+
+def test_band_parameters_columns_and_cap():
+    parameters = segmentKernel.band_parameters([0.0, 10.0], [10.0, 25.0], [99.2, 100.0], [0.0, 90.0], 12, 4.0, False)
+    np.testing.assert_array_equal(parameters[:, segmentKernel.RADIUS], [104, 104])
+    np.testing.assert_array_equal(parameters[:, segmentKernel.Z_LEVEL], [0, 10])
+    np.testing.assert_array_equal(parameters[:, segmentKernel.EXTRUDE_HEIGHT], [10, 15])
+    # A band whose inside reaches the axis is a full disc of segments.
+    assert parameters[0, segmentKernel.TRAPEZOID_HEIGHT] == parameters[0, segmentKernel.RADIUS]
+    assert parameters[1, segmentKernel.TRAPEZOID_HEIGHT] == 22
+
+
+def test_blank_volume_of_a_disc_and_a_ring():
+    half_tan = np.tan(np.pi / 12)
+    disc = segmentKernel.blank_volume([[104, 104, 0, 10]], 12)
+    ring = segmentKernel.blank_volume([[104, 22, 0, 10]], 12)
+    np.testing.assert_allclose(disc, 12 * half_tan * 104 ** 2 * 10)
+    np.testing.assert_allclose(ring, 12 * half_tan * (104 ** 2 - 82 ** 2) * 10)
+    np.testing.assert_allclose(segmentKernel.blank_volume([[104, 22, 0, 10]], 12, solid_bottom=True), disc)
+
+
+def test_ring_vertices_shape_and_symmetry():
+    vertices = segmentKernel.ring_vertices(CYLINDER, 10.0, 4.0, 12, solid_bottom=False)
+    assert vertices.shape == (2, 12, 8, 3)
+    # Segment 0 is centred on +Y with its outer edge at the radius.
+    np.testing.assert_allclose(vertices[0, 0, 2:4, 1], [104, 104])
+    np.testing.assert_allclose(vertices[0, 0, 2, 0], -vertices[0, 0, 3, 0])
+    # Neighbouring segments share an edge.
+    np.testing.assert_allclose(vertices[0, 1, 2], vertices[0, 0, 3], atol=1e-9)
+    np.testing.assert_allclose(vertices[1, :, 0, 2], 10)
+    np.testing.assert_allclose(vertices[1, :, 4, 2], 20)
+
+
+def test_ring_dependencies_cover_the_layer_points():
+    points = [(50.0 + k, 10.0 * k) for k in range(10)]
+    dependencies = segmentKernel.ring_dependencies(points, 10.0)
+    assert dependencies.shape == (9, 2)
+    assert np.all(dependencies[:, 0] <= np.arange(9))
+    assert np.all(dependencies[:, 1] >= np.arange(9) + 2)
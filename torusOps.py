@@ -0,0 +1,117 @@
+#   Copyright (c) 2026 Justin Ahrens <justin@ahrens.net>
+#
+#   This library is free software; you can redistribute it and/or
+#   modify it under the terms of the GNU Library General Public
+#   License as published by the Free Software Foundation; either
+#   version 2 of the License, or (at your option) any later version.
+#
+#   This library  is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Library General Public License for more details.
+#
+#   You should have received a copy of the GNU Library General Public
+#   License along with this library; see the file COPYING.LIB. If not,
+#   write to the Free Software Foundation, Inc., 59 Temple Place,
+#   Suite 330, Boston, MA  02111-1307, USA
+#
+"""
+Segmented torus built in memory.
+
+The torus turns about the Y axis and its tube is centred on the X axis at
+``tube_center``.  One ring of the torus is a sector of ``360 / num_rings``
+degrees; it is made of ``num_segments`` trapezoid blanks arranged around
+the tube, each trimmed to the hollow tube sector.  Every ring is the same
+shape turned about Y, so the booleans are done for the first ring only.
+
+This replaces the sketch, revolve, cut, wedge extrusion and clone chain of
+the AddTorus panel: the tube sector is revolved straight from its annulus
+and each blank is intersected with it once.
+"""
+import math
+import time
+
+import FreeCAD as App
+import Part
+
+from docOps import batch_update
+from intersectOps import to_solid
+from ringOps import make_rings
+from segmentOps import make_segment_shape
+
+TUBE_WALL = 20.0
+Z_AXIS = App.Vector(0, 0, 1)
+# Sectors run from +X towards +Z, matching the segment blanks.
+SWEEP_AXIS = App.Vector(0, -1, 0)
+
+
+def tube_center(outside_radius, inside_radius):
+    """Return the distance from the torus axis to the centre of the tube."""
+    return (outside_radius + inside_radius) / 2.0
+
+
+def segment_row(outside_radius, inside_radius, num_rings, num_segments, wall=TUBE_WALL):
+    """Return the segment parameter row (see segmentOps) of the blanks of one ring.
+
+    The blank reaches round the tube at the far end of the sector, where
+    the inside of the torus has moved ``inside_radius * (1 - cos(angle))``
+    towards the axis, and is as long as the outside of the sector.
+    """
+    angle = math.radians(360.0 / num_rings)
+    radius = (outside_radius - inside_radius) / 2.0 + inside_radius * (1 - math.cos(angle))
+    return [num_segments, radius, wall, 0.0, outside_radius * math.sin(angle), False]
+
+
+def tube_sector(outside_radius, inside_radius, num_rings, wall=TUBE_WALL):
+    """Return the hollow tube between 0 and ``360 / num_rings`` degrees as a solid."""
+    center = App.Vector(tube_center(outside_radius, inside_radius), 0, 0)
+    radius = (outside_radius - inside_radius) / 2.0
+    section = Part.Face(Part.Wire(Part.makeCircle(radius, center, Z_AXIS)))
+    if 0 < wall < radius:
+        section = section.cut(Part.Face(Part.Wire(Part.makeCircle(radius - wall, center, Z_AXIS))))
+    return section.revolve(App.Vector(0, 0, 0), SWEEP_AXIS, 360.0 / num_rings)
+
+
+def ring_shapes(outside_radius, inside_radius, num_rings, num_segments, wall=TUBE_WALL):
+    """Return (blanks, segments) for the first ring, one entry per segment position.
+
+    Blanks are the untrimmed trapezoid prisms around the tube; segments are
+    the blanks trimmed to the tube sector (None where nothing is left).
+    """
+    blank = make_segment_shape(*segment_row(outside_radius, inside_radius, num_rings, num_segments, wall))
+    sector = tube_sector(outside_radius, inside_radius, num_rings, wall)
+    offset = App.Vector(tube_center(outside_radius, inside_radius), 0, 0)
+    blanks, segments = [], []
+    for i in range(num_segments):
+        placed = blank.copy()
+        placed.rotate(App.Vector(0, 0, 0), Z_AXIS, i * 360.0 / num_segments)
+        placed.translate(offset)
+        blanks.append(placed)
+        segments.append(to_solid(placed.common(sector)))
+    return blanks, segments
+
+
+def add_torus(doc, outside_radius, inside_radius, num_rings, num_segments, wall=TUBE_WALL, use_links=False):
+    """Add every ring of a segmented torus to ``doc``.
+
+    The trimmed segments of the first ring are added as ``Smooth(Solid)_NNN``
+    objects and arrayed about Y with make_rings, so the result is labelled
+    ``Ring_RRR_SSS`` like the AddTorus intersect and array steps produce.
+    Returns the ring objects of each segment position.
+    """
+    start = time.perf_counter()
+    _, segments = ring_shapes(outside_radius, inside_radius, num_rings, num_segments, wall)
+    masters = []
+    with batch_update(doc, "Add Torus Segments"):
+        for i, shape in enumerate(segments, start=1):
+            if shape is None:
+                continue
+            obj = doc.addObject("Part::Feature", "Smooth_solid")
+            obj.Shape = shape
+            obj.Label = f"Smooth(Solid)_{i:03d}"
+            masters.append(obj)
+    rings = make_rings(doc, masters, num_rings, use_links=use_links, axis=App.Vector(0, 1, 0))
+    App.Console.PrintMessage(
+        f"Built a {num_rings} x {num_segments} torus in {(time.perf_counter() - start) * 1000:.0f} ms\n"
+    )
+    return rings